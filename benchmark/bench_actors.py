@@ -0,0 +1,63 @@
+"""
+Compares Actors.with_traits against a full scan of the cast.
+
+Run from the benchmark folder:
+    python bench_actors.py
+"""
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+sys.path.append('../test')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from stub.traits import Blue, Red, CanShoot
+
+SIZES = (1_000, 10_000, 100_000)
+REPEAT = 5
+
+
+def build_cast(size):
+    """Builds a cast where half the actors are Blue, a tenth are Red and a 
+    hundredth can shoot."""
+    actors = Actors()
+    for i in range(size):
+        actor = Actor()
+        if i % 2 == 0:
+            actor.add_trait(Blue())
+        if i % 10 == 0:
+            actor.add_trait(Red())
+        if i % 100 == 0:
+            actor.add_trait(CanShoot())
+        actors.add_actor(actor)
+    return actors
+
+
+def scan(actors, *types):
+    """The previous implementation of with_traits."""
+    return [a for a in actors._current_actors 
+        if set(types).issubset(a._traits.keys())]
+
+
+def best_of(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=REPEAT)) / number
+
+
+def main():
+    print(f"{'actors':>8} {'query':<16} {'scan (us)':>12} "
+        f"{'index (us)':>12} {'speedup':>8}")
+    for size in SIZES:
+        actors = build_cast(size)
+        number = max(1, 100_000 // size)
+        for types in ((CanShoot,), (Red, CanShoot), (Blue,)):
+            name = "+".join(t.__name__ for t in types)
+            scanned = best_of(lambda: scan(actors, *types), number)
+            indexed = best_of(lambda: actors.with_traits(*types), number)
+            print(f"{size:>8} {name:<16} {scanned * 1e6:>12.1f} "
+                f"{indexed * 1e6:>12.1f} {scanned / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
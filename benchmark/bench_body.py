@@ -0,0 +1,67 @@
+"""
+Compares plain Body objects against bodies kept in a BodyStore.
+
+Run from the benchmark folder:
+    python bench_body.py
+"""
+import random
+import sys
+import timeit
+import tracemalloc
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.Body import Body
+from genie_core.cast.body_store import BodyStore
+
+COUNT = 50_000
+REPEAT = 5
+
+random.seed(0)
+VALUES = [[random.uniform(-100, 100) for _ in range(6)] for _ in range(COUNT)]
+
+
+def fresh(values):
+    """Copies the values into new float objects, the way a game computing 
+    positions would, so their cost is counted against the body holding them."""
+    return [v * 1.0 for v in values]
+
+
+def bytes_per_body(make):
+    """Measures the memory allocated per body by the given factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    bodies = make()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(bodies), bodies
+
+
+def main():
+    plain_size, plain = bytes_per_body(
+        lambda: [Body(*fresh(values)) for values in VALUES])
+    store = BodyStore(COUNT)
+    stored_size, stored = bytes_per_body(
+        lambda: [Body(*fresh(values), store) for values in VALUES])
+    column_size = store.get_data().nbytes / COUNT
+
+    def move_each():
+        for body in plain:
+            body.move()
+
+    move_each_time = min(timeit.repeat(move_each, number=1, repeat=REPEAT))
+    move_all_time = min(timeit.repeat(store.move_all, number=10, 
+        repeat=REPEAT)) / 10
+
+    print(f"{COUNT} bodies")
+    print(f"  plain Body:       {plain_size:8.1f} bytes/body "
+        f"{move_each_time * 1e3:8.3f} ms/frame (Body.move loop)")
+    print(f"  BodyStore view:   {stored_size + column_size:8.1f} bytes/body "
+        f"({stored_size:.1f} view + {column_size:.1f} columns)")
+    print(f"  BodyStore.move_all: {move_all_time * 1e3:6.3f} ms/frame "
+        f"({move_each_time / move_all_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
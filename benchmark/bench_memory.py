@@ -0,0 +1,48 @@
+"""
+Measures the memory used per actor with a Body and an Image.
+
+Run from the benchmark folder:
+    python bench_memory.py [count]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+
+COUNT = 1_000_000
+
+
+def make_actor(i):
+    actor = Actor()
+    actor.add_trait(Body(i * 0.5, i * 0.25, 1.5, -0.5, 16, 16))
+    actor.add_trait(Image("bullet.png", 1.0, i * 0.1))
+    return actor
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    gc.collect()
+    tracemalloc.start()
+    actors = [make_actor(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the actors is not part of an actor's cost
+    size -= sys.getsizeof(actors)
+
+    start = time.perf_counter()
+    gc.collect()
+    gc_time = time.perf_counter() - start
+    print(f"{count} actors (Actor + Body + Image)")
+    print(f"  {size / count:8.1f} bytes/actor")
+    print(f"  full collection: {gc_time * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
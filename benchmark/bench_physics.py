@@ -0,0 +1,47 @@
+"""
+Times PhysicsService.move_actors against the Clock.TIME_STEP budget.
+
+Run from the benchmark folder:
+    python bench_physics.py
+"""
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.body_store import BodyStore
+from genie_core.script.clock import Clock
+from genie_core.services.PhysicsService import PhysicsService
+
+COUNT = 100_000
+REPEAT = 5
+
+
+def build_cast(store):
+    actors = Actors()
+    for i in range(COUNT):
+        actor = Actor()
+        actor.add_trait(Body(i % 640, i % 480, 1.5, -0.5, 8, 8, store=store))
+        actors.add_actor(actor)
+    return actors
+
+
+def main():
+    physics = PhysicsService(damping=0.01, bounds=(0, 0, 640, 480))
+    budget = Clock.TIME_STEP * 1e3
+    print(f"{COUNT} bodies, budget {budget:.2f} ms")
+    for name, store in (("plain", None), ("stored", BodyStore(COUNT))):
+        actors = build_cast(store)
+        first = timeit.timeit(lambda: physics.move_actors(actors), number=1)
+        steady = min(timeit.repeat(lambda: physics.move_actors(actors), 
+            number=10, repeat=REPEAT)) / 10
+        print(f"  {name:<7} first step {first * 1e3:8.2f} ms, "
+            f"steady {steady * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measures frame times and garbage collections while bullets are spawned and 
+removed every frame, with and without an ActorPool.
+
+Run from the benchmark folder:
+    python bench_pool.py [frames]
+"""
+import gc
+import sys
+import time
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actor_pool import ActorPool
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+
+FRAMES = 600
+WAVE = 1000
+LIFETIME = 10
+
+
+def run(pool, frames):
+    actors = Actors(pool=pool)
+    prototype = Actor()
+    prototype.add_trait(Body(0, 0, 4, 0, 2, 2))
+    prototype.add_trait(Image("bullet.png"))
+    waves = []
+    times = []
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    for _ in range(frames):
+        start = time.perf_counter()
+        waves.append(actors.spawn(prototype, WAVE))
+        if len(waves) > LIFETIME:
+            actors.remove_actors(waves.pop(0))
+        actors.apply_changes()
+        times.append(time.perf_counter() - start)
+    collections = sum(stat["collections"] for stat in gc.get_stats()) \
+        - collections
+    times.sort()
+    return times, collections
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    print(f"{frames} frames, {WAVE} bullets spawned per frame, "
+        f"each living {LIFETIME} frames")
+    for name, pool in (("no pool", None), ("pool", ActorPool(WAVE * 2))):
+        times, collections = run(pool, frames)
+        print(f"  {name:<8} median {times[len(times) // 2] * 1e3:6.2f} ms, "
+            f"p99 {times[int(len(times) * 0.99)] * 1e3:6.2f} ms, "
+            f"max {times[-1] * 1e3:6.2f} ms, {collections} gc collections")
+        if pool is not None:
+            print(f"  hit rate {pool.get_stats()['hit_rate']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures the overhead of profiling a frame's actions.
+
+Run from the benchmark folder:
+    python bench_profiler.py
+"""
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+sys.path.append('../test')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.script.profiler import Profiler
+from genie_core.script.update_action import UpdateAction
+from stub.traits import Blue, Red
+
+ACTORS = 1_000
+ACTIONS = 12
+REPEAT = 7
+
+
+class QueryAction(UpdateAction):
+    """A typical small action: look up some actors and touch each one."""
+    def execute(self, actors, actions, clock, callback):
+        for actor in actors.with_traits(Blue, Red):
+            actor.get_trait(Blue)
+
+
+def main():
+    actors = Actors()
+    for i in range(ACTORS):
+        actor = Actor()
+        actor.add_trait(Blue())
+        if i % 4 == 0:
+            actor.add_trait(Red())
+        actors.add_actor(actor)
+    actions = [QueryAction(i) for i in range(ACTIONS)]
+    profiler = Profiler()
+
+    def plain():
+        for action in actions:
+            action.execute(actors, None, None, None)
+
+    def profiled():
+        profiler.execute(Profiler.UPDATE, actions, actors, None, None, None)
+
+    number = 200
+    base = min(timeit.repeat(plain, number=number, repeat=REPEAT)) / number
+    timed = min(timeit.repeat(profiled, number=number, repeat=REPEAT)) / number
+    print(f"{ACTIONS} actions over {ACTORS} actors")
+    print(f"  plain:    {base * 1e6:8.1f} us/step")
+    print(f"  profiled: {timed * 1e6:8.1f} us/step "
+        f"({(timed / base - 1) * 100:+.2f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Times Actors.snapshot and restore against pickling the cast.
+
+Run from the benchmark folder:
+    python bench_snapshot.py [count]
+"""
+import pickle
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.body_store import BodyStore
+from genie_core.cast.Image import Image
+from genie_core.script.clock import Clock
+
+COUNT = 10_000
+REPEAT = 5
+
+
+def build_cast(count, store):
+    actors = Actors()
+    for i in range(count):
+        actor = Actor()
+        actor.add_trait(Body(i % 640, i % 480, 1.5, -0.5, 8, 8, store=store))
+        actor.add_trait(Image("bullet.png", 1.0, i * 0.1))
+        actors.add_actor(actor)
+    return actors
+
+
+def best(operation):
+    return min(timeit.repeat(operation, number=1, repeat=REPEAT))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    budget = Clock.TIME_STEP * 1e3
+    print(f"{count} actors (Body + Image), budget {budget:.2f} ms")
+    for name, store in (("plain", None), ("stored", BodyStore(count))):
+        actors = build_cast(count, store)
+        data = actors.snapshot()
+        take = best(actors.snapshot)
+        restore = best(lambda: Actors().restore(data))
+        print(f"  {name:<7} snapshot {take * 1e3:7.2f} ms, "
+            f"restore {restore * 1e3:7.2f} ms, {len(data) / count:5.1f} B/actor")
+    actors = build_cast(count, None)
+    data = pickle.dumps(actors, pickle.HIGHEST_PROTOCOL)
+    take = best(lambda: pickle.dumps(actors, pickle.HIGHEST_PROTOCOL))
+    restore = best(lambda: pickle.loads(data))
+    print(f"  {'pickle':<7} snapshot {take * 1e3:7.2f} ms, "
+        f"restore {restore * 1e3:7.2f} ms, {len(data) / count:5.1f} B/actor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares the spatial queries on Actors against a scan of with_traits(Body).
+
+Run from the benchmark folder:
+    python bench_spatial.py
+"""
+import random
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+
+SIZES = (1_000, 10_000, 100_000)
+REPEAT = 5
+WORLD = 4096
+
+
+def build_cast(size):
+    actors = Actors(cell_size=64)
+    for _ in range(size):
+        actor = Actor()
+        actor.add_trait(Body(random.uniform(0, WORLD), random.uniform(0, WORLD)))
+        actors.add_actor(actor)
+    return actors
+
+
+def scan(actors, x, y, radius):
+    """What update actions did before the spatial index."""
+    found = []
+    for actor in actors.with_traits(Body):
+        ax, ay = actor.get_trait(Body).get_position()
+        if (ax - x) ** 2 + (ay - y) ** 2 <= radius * radius:
+            found.append(actor)
+    return found
+
+
+def best_of(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=REPEAT)) / number
+
+
+def main():
+    random.seed(0)
+    print(f"{'actors':>8} {'query':<14} {'scan (us)':>12} {'index (us)':>12}")
+    for size in SIZES:
+        actors = build_cast(size)
+        actors.nearest(0, 0)
+        number = max(1, 10_000 // size)
+        x, y = WORLD / 2, WORLD / 2
+        scanned = best_of(lambda: scan(actors, x, y, 100), number)
+        radius = best_of(lambda: actors.in_radius(x, y, 100), 100)
+        nearest = best_of(lambda: actors.nearest(x, y, 8), 100)
+        print(f"{size:>8} {'in_radius':<14} {scanned * 1e6:>12.1f} "
+            f"{radius * 1e6:>12.1f}")
+        print(f"{size:>8} {'nearest(8)':<14} {'':>12} {nearest * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measures the cost per actor of spawning a wave of actors one at a time and 
+with Actors.spawn.
+
+Run from the benchmark folder:
+    python bench_spawn.py [count]
+"""
+import sys
+import timeit
+
+# setting path
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.body_store import BodyStore
+from genie_core.cast.Image import Image
+
+COUNT = 10_000
+REPEAT = 5
+
+
+def one_at_a_time(count, store):
+    actors = Actors()
+    for i in range(count):
+        actor = Actor()
+        actor.add_trait(Body(i, i, 1.5, -0.5, 8, 8, store=store))
+        actor.add_trait(Image("bullet.png"))
+        actors.add_actor(actor)
+
+
+def spawned(count, store):
+    prototype = Actor()
+    prototype.add_trait(Body(0, 0, 1.5, -0.5, 8, 8, store=store))
+    prototype.add_trait(Image("bullet.png"))
+    Actors().spawn(prototype, count, position=[(i, i) for i in range(count)])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+    print(f"{count} actors (Body + Image)")
+    for name, make_store in (("plain", lambda: None), 
+            ("stored", lambda: BodyStore(count + 1))):
+        for how, spawn in (("one at a time", one_at_a_time), 
+                ("spawn", spawned)):
+            seconds = min(timeit.repeat(lambda: spawn(count, make_store()), 
+                number=1, repeat=REPEAT))
+            print(f"  {name:<7} {how:<14} {seconds / count * 1e6:6.2f} us/actor")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmarks the cast, script and director hot paths.
+
+Every case is timed with timeit, reported in operations per second together 
+with the bytes allocated by a single operation, and scored relative to a 
+fixed pure Python calibration loop so that results taken on different 
+machines can be compared with the baseline kept in baseline.json.
+
+Run from the benchmark folder:
+    python suite.py                  # print the results
+    python suite.py --save           # store them as the new baseline
+    python suite.py --check          # fail if a case regressed
+    python suite.py --check --threshold 0.3 --filter with_traits
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+# setting path
+sys.path.append('..')
+sys.path.append('../test')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.director import Director
+from genie_core.script.actions import Actions
+from genie_core.script.input_action import InputAction
+from genie_core.script.output_action import OutputAction
+from genie_core.script.update_action import UpdateAction
+from genie_core.script.virtual_clock import VirtualClock
+from stub.traits import Blue, Red, CanShoot
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
+    "baseline.json")
+THRESHOLD = 0.25
+REPEAT = 5
+
+
+class QueryAction(UpdateAction):
+    def execute(self, actors, actions, clock, callback):
+        for actor in actors.with_traits(Red, CanShoot):
+            actor.get_trait(Red)
+
+
+class IdleInput(InputAction):
+    def execute(self, actors, actions, clock, callback):
+        pass
+
+
+class IdleOutput(OutputAction):
+    def execute(self, actors, actions, clock, callback):
+        pass
+
+
+def build_cast(size):
+    """Half the actors are Blue, a tenth Red and a hundredth can shoot."""
+    actors = Actors()
+    for i in range(size):
+        actor = Actor()
+        if i % 2 == 0:
+            actor.add_trait(Blue())
+        if i % 10 == 0:
+            actor.add_trait(Red())
+        if i % 100 == 0:
+            actor.add_trait(CanShoot())
+        actors.add_actor(actor)
+    return actors
+
+
+def build_script(size):
+    actions = Actions()
+    for i in range(size):
+        actions.add_action(QueryAction(i))
+        actions.add_action(IdleInput(i))
+        actions.add_action(IdleOutput(i))
+    return actions
+
+
+def cases():
+    """Yields (name, setup) pairs where setup returns the operation to time."""
+    for size in (1_000, 10_000, 100_000):
+        def with_traits(size=size):
+            actors = build_cast(size)
+            return lambda: actors.with_traits(Red, CanShoot)
+        yield f"actors.with_traits[{size}]", with_traits
+
+    for size in (10_000, 100_000):
+        def query(size=size):
+            actors = build_cast(size)
+            query = actors.query(Red, CanShoot)
+            return lambda: sum(1 for _ in query)
+        yield f"actors.query[{size}]", query
+
+        def each(size=size):
+            actors = build_cast(size)
+            return lambda: sum(1 for _ in actors.each(Red, CanShoot))
+        yield f"actors.each[{size}]", each
+
+    def has_traits():
+        actor = Actor()
+        actor.add_trait(Blue())
+        actor.add_trait(Red())
+        return lambda: actor.has_traits(Blue, Red, CanShoot)
+    yield "actor.has_traits", has_traits
+
+    for size in (10, 100):
+        def get_actions(size=size):
+            actions = build_script(size)
+            return lambda: actions.get_actions(UpdateAction)
+        yield f"actions.get_actions[{size}]", get_actions
+
+    for actors_size, actions_size in ((1_000, 10), (10_000, 10)):
+        def frame(actors_size=actors_size, actions_size=actions_size):
+            actors = build_cast(actors_size)
+            actions = build_script(actions_size)
+            director = Director(clock=VirtualClock())
+            return lambda: director.run_for(actors, actions, 1)
+        yield f"director.frame[{actors_size}x{actions_size}]", frame
+
+
+def calibrate():
+    """Gets the ops/sec of a fixed pure Python loop on this machine."""
+    def loop():
+        total = 0
+        for i in range(1000):
+            total += i
+        return total
+    return ops_per_sec(loop)
+
+
+def ops_per_sec(operation):
+    number, _ = timeit.Timer(operation).autorange()
+    best = min(timeit.repeat(operation, number=number, repeat=REPEAT))
+    return number / best
+
+
+def allocated_bytes(operation):
+    """Gets the peak memory allocated while running the operation once."""
+    operation()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - start
+
+
+def run(pattern):
+    calibration = calibrate()
+    results = {}
+    for name, setup in cases():
+        if pattern and pattern not in name:
+            continue
+        operation = setup()
+        ops = ops_per_sec(operation)
+        results[name] = {
+            "ops_per_sec": ops,
+            "score": ops / calibration,
+            "alloc_bytes": allocated_bytes(operation)
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--save", action="store_true", 
+        help="store the results as the new baseline")
+    parser.add_argument("--check", action="store_true", 
+        help="exit with an error if a case is slower than the baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, 
+        help="the fraction of the baseline score a case may lose")
+    parser.add_argument("--filter", default="", 
+        help="only run the cases whose name contains this")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as file:
+            baseline = json.load(file)
+
+    results = run(args.filter)
+    regressions = []
+    print(f"{'case':<32} {'ops/sec':>14} {'alloc B/op':>11} {'vs base':>8}")
+    for name, result in results.items():
+        change = ""
+        if name in baseline:
+            ratio = result["score"] / baseline[name]["score"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio < 1 - args.threshold:
+                regressions.append(name)
+        print(f"{name:<32} {result['ops_per_sec']:>14,.0f} "
+            f"{result['alloc_bytes']:>11,} {change:>8}")
+
+    if args.save:
+        baseline.update(results)
+        with open(BASELINE, "w") as file:
+            json.dump(baseline, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print(f"saved {len(results)} results to {BASELINE}")
+
+    if args.check and regressions:
+        print(f"regressed by more than {args.threshold:.0%}: "
+            + ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+from genie_core.assets.lru_cache import LruCache
+
+
+class ImageCache:
+    """Decoded images and their scaled and rotated variants.
+
+    The responsibility of ImageCache is to make sure each image file is 
+    decoded once and each scaled or rotated variant is made once, no matter 
+    how many actors share them. Decoding and transforming depend on the 
+    rendering backend, so both are given to the cache as functions; the cache 
+    only decides when to call them.
+
+    Rotations are rounded to a multiple of rotation_step degrees so that 
+    actors turning smoothly share a bounded number of variants. Originals and 
+    variants share one memory budget and are evicted least recently used 
+    first. The budget is only as good as the sizer: the default measures 
+    bytes-like images with len, so backends whose images are other objects, 
+    such as surfaces or textures, must give a sizer that returns the bytes 
+    of pixel data.
+
+    Attributes:
+        _loader: Callable[[str], object], Decodes the image at a path.
+        _transformer: Callable[[object, float, float], object], Makes a 
+            variant of a decoded image for a scale and rotation.
+        _rotation_step: float, The degrees rotations are rounded to.
+        _cache: LruCache, The decoded images keyed by (path, scale, rotation).
+    """
+
+    def __init__(self, loader, transformer = None, 
+                    budget : int = 64 * 1024 * 1024,
+                    sizer = len,
+                    rotation_step : float = 1):
+        """Initializes a new instance of ImageCache.
+
+        Args:
+            loader: Callable[[str], object], Decodes the image at a path.
+            transformer: Callable[[object, float, float], object], Makes a 
+                variant of a decoded image for a scale and a rotation in 
+                degrees. Without one, variants are the original image.
+            budget: int, The most bytes the cached images may take.
+            sizer: Callable[[object], int], Gets the size of an image's pixel 
+                data in bytes. The default only works for bytes-like images.
+            rotation_step: float, The degrees rotations are rounded to.
+        """
+        self._loader = loader
+        self._transformer = transformer
+        self._rotation_step = rotation_step
+        self._cache = LruCache(budget, sizer)
+
+    def get(self, path : str, scale : float = 1, rotation : float = 0):
+        """Gets the decoded image at the given path, scaled and rotated. It 
+        is loaded and transformed only if it isn't cached already.
+
+        Args:
+            path: str, The path of the image file.
+            scale: float, The scale.
+            rotation: float, The rotation in degrees.
+
+        Returns:
+            object: The image, as returned by the loader or transformer.
+        """
+        rotation = self.quantize(rotation)
+        if self._transformer is None or (scale == 1 and rotation == 0):
+            return self._load(path)
+        key = (path, scale, rotation)
+        image = self._cache.get(key)
+        if image is None:
+            image = self._transformer(self._load(path), scale, rotation)
+            self._cache.put(key, image)
+        return image
+
+    def get_image(self, image):
+        """Gets the decoded variant for the given Image trait.
+
+        Args:
+            image: Image, The trait to look up.
+
+        Returns:
+            object: The image, as returned by the loader or transformer.
+        """
+        return self.get(image.get_path(), image.get_scale(), 
+            image.get_rotation())
+
+    def preload(self, *paths):
+        """Loads the images at the given paths ahead of their first use.
+
+        Args:
+            paths: Tuple[str], The paths of the image files.
+        """
+        for path in paths:
+            self._load(path)
+
+    def quantize(self, rotation : float):
+        """Rounds a rotation the way the cache does.
+
+        Args:
+            rotation: float, A rotation in degrees.
+
+        Returns:
+            float: The rotation rounded to a multiple of rotation_step, 
+            between 0 and 360.
+        """
+        step = self._rotation_step
+        if step:
+            rotation = round(rotation / step) * step
+        return rotation % 360
+
+    def get_stats(self):
+        """Gets the cache counters.
+
+        Returns:
+            dict: The "hits", "misses", "evictions", "entries" and "bytes".
+        """
+        return self._cache.get_stats()
+
+    def clear(self):
+        """Forgets every image."""
+        self._cache.clear()
+
+    def _load(self, path):
+        """Gets the original image at the given path, decoding it if needed."""
+        key = (path, 1, 0)
+        image = self._cache.get(key)
+        if image is None:
+            image = self._loader(path)
+            self._cache.put(key, image)
+        return image
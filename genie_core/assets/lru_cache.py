@@ -0,0 +1,133 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import threading
+from collections import OrderedDict
+
+
+class LruCache:
+    """A cache that forgets what was used least recently.
+
+    The responsibility of LruCache is to hold loaded assets under a memory 
+    budget. When adding an asset takes the cache over budget, the assets that 
+    have gone unused the longest are evicted until it fits again. The asset 
+    just added is never evicted, so one asset larger than the budget can 
+    still be used.
+
+    Every method holds a lock, so a cache can be shared with a scene being 
+    built on another thread.
+
+    Attributes:
+        _budget: int, The most bytes the cached assets may take.
+        _sizer: Callable[[object], int], Gets the size of an asset in bytes.
+        _entries: OrderedDict[Hashable, Tuple[object, int]], The assets and 
+            their sizes, least recently used first.
+        _size: int, The total size of the cached assets.
+        _hits: int, The number of lookups that found their asset.
+        _misses: int, The number of lookups that didn't.
+        _evictions: int, The number of assets evicted.
+        _lock: threading.Lock, Held while the cache is read or changed.
+    """
+
+    def __init__(self, budget : int, sizer = len):
+        """Initializes a new instance of LruCache.
+
+        Args:
+            budget: int, The most bytes the cached assets may take.
+            sizer: Callable[[object], int], Gets the size of an asset in 
+                bytes. The default only works for bytes-like assets.
+        """
+        self._budget = budget
+        self._sizer = sizer
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, default = None):
+        """Gets the asset stored under the given key and marks it as the most 
+        recently used.
+
+        Args:
+            key: Hashable, The key.
+            default: object, What to return if the key isn't cached.
+
+        Returns:
+            object: The asset or the default.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, asset):
+        """Stores the given asset under the given key, evicting the least 
+        recently used assets if that takes the cache over budget.
+
+        Args:
+            key: Hashable, The key.
+            asset: object, The asset.
+        """
+        size = self._sizer(asset)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (asset, size)
+            self._size += size
+            while self._size > self._budget and len(self._entries) > 1:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def discard(self, key):
+        """Removes the asset stored under the given key, if any.
+
+        Args:
+            key: Hashable, The key.
+        """
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """Removes every asset. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self):
+        """Gets the cache counters.
+
+        Returns:
+            dict: The "hits", "misses", "evictions", "entries" and "bytes".
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._size
+            }
+
+    def _discard(self, key):
+        """Removes the asset stored under the given key while the lock is 
+        held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
@@ -0,0 +1,151 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import asyncio
+import time
+from .director import Director
+
+
+class AsyncDirector(Director):
+    """A director that runs the animation loop on an asyncio event loop.
+
+    The responsibility of AsyncDirector is to let the animation share a 
+    thread with other asyncio code, such as a server's socket handling. Its 
+    loop methods are coroutines that give the event loop a turn between the 
+    phases of every frame and await the end of the frame instead of 
+    sleeping.
+
+    An action's execute method may also be a coroutine. It is started as a 
+    task when the action is cued and may span as many frames as it needs, 
+    for example to wait for the network. The action isn't cued again until 
+    its task is over, and a task that raised re-raises at the end of the 
+    frame it is found to be over in. Tasks still running when the scene 
+    changes or the loop returns are cancelled and awaited, so none outlive 
+    the scene that started them. Update actions run by a Scheduler can't be 
+    coroutines.
+
+    Attributes:
+        _tasks: Dict[Action, asyncio.Task], The tasks of the coroutine 
+            actions still running.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initializes a new instance of AsyncDirector. Takes the same 
+        arguments as Director."""
+        super().__init__(*args, **kwargs)
+        self._tasks = {}
+
+    async def direct_scene(self, actors, actions):
+        """Runs the animation loop for the given scene until an action stops 
+        it.
+
+        Args:
+            actors: Actors, The cast to direct.
+            actions: Actions, The script to use.
+        """
+        await self.run_until(actors, actions, 
+            lambda actors, actions, clock: False)
+
+    async def run_for(self, actors, actions, updates, outputs : bool = True):
+        """Runs the animation loop for the given scene until the given number 
+        of updates have been cued, see Director.run_for.
+
+        Returns:
+            int: The number of updates that ran.
+        """
+        start = self._clock.get_updates()
+        end = start + updates
+        self._update_limit = end
+        try:
+            await self.run_until(actors, actions, 
+                lambda actors, actions, clock: clock.get_updates() >= end, 
+                outputs)
+        finally:
+            self._update_limit = None
+        return self._clock.get_updates() - start
+
+    async def run_until(self, actors, actions, predicate, 
+                    outputs : bool = True):
+        """Runs the animation loop for the given scene until the given 
+        predicate is true or an action stops the animation, see 
+        Director.run_until.
+
+        Returns:
+            int: The number of updates that ran.
+        """
+        start = self._clock.get_updates()
+        self._actors = actors
+        self._actions = actions
+        self._is_directing = True
+        try:
+            while (self._is_directing and not predicate(self._actors, 
+                    self._actions, self._clock)):
+                scene = self._actions
+                self._do_inputs()
+                await asyncio.sleep(0)
+                self._do_updates()
+                await asyncio.sleep(0)
+                if outputs:
+                    self._do_outputs()
+                else:
+                    self._apply_changes()
+                self._check_tasks()
+                if self._actions is not scene:
+                    await self._cancel_tasks()
+                await asyncio.sleep(self._clock.get_wait_time())
+        finally:
+            await self._cancel_tasks()
+        return self._clock.get_updates() - start
+
+    def get_tasks(self):
+        """Gets the tasks of the coroutine actions still running.
+
+        Returns:
+            Dict[Action, asyncio.Task]: The tasks by action.
+        """
+        return self._tasks
+
+    def _cue(self, phase, actions):
+        """Executes the given actions in order, starting a task for those 
+        that return a coroutine and skipping those whose task is still 
+        running. Only the synchronous part of an action is timed when 
+        profiling is on.
+
+        Args:
+            phase: str, The phase the actions belong to.
+            actions: List[Action], The actions to execute.
+        """
+        profiler = self._profiler
+        tasks = self._tasks
+        start = time.perf_counter()
+        for action in actions:
+            if action in tasks:
+                continue
+            before = time.perf_counter()
+            result = action.execute(self._actors, self._actions, self._clock, 
+                self)
+            if profiler is not None:
+                profiler.record(action, time.perf_counter() - before)
+            if asyncio.iscoroutine(result):
+                tasks[action] = asyncio.get_running_loop().create_task(result)
+        if profiler is not None:
+            profiler.record(phase, time.perf_counter() - start)
+
+    async def _cancel_tasks(self):
+        """Cancels the tasks still running and waits for them to finish."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _check_tasks(self):
+        """Forgets the tasks that are over, raising what they raised."""
+        done = [action for action, task in self._tasks.items() if task.done()]
+        for action in done:
+            task = self._tasks.pop(action)
+            if not task.cancelled():
+                task.result()
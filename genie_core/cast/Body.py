@@ -1,72 +1,217 @@
 from .trait import Trait
 
+# Rows of the BodyStore columns, see BodyStore.COLUMNS
+_X, _Y, _VX, _VY, _HEIGHT, _WIDTH = range(6)
+
 class Body(Trait):
+    """A position, velocity and size.
+
+    A body either stores its values itself or, when created with a BodyStore, 
+    is a view into one slot of the store's columns. The methods behave the 
+    same either way.
+
+    Whenever a value changes through one of the methods below, the actor the 
+    body belongs to is told about it so the cast can keep its spatial index 
+    and its record of changed actors current.
+    """
+
+    __slots__ = ("_x", "_y", "_vx", "_vy", "_height", "_width", 
+        "_store", "_row", "_actor")
+
     def __init__(self, x : float = 0, 
                     y : float = 0,
                     vx : float = 0,
                     vy : float = 0,
                     height : float = 0, 
-                    width : float = 0):
+                    width : float = 0,
+                    store = None):
+        self._actor = None
+        if store is not None:
+            self._store = store
+            self._row = store.allocate(x, y, vx, vy, height, width)
+            return
+        self._store = None
         self._x = x
         self._y = y
         self._vx = vx
         self._vy = vy
         self._height = height
         self._width = width
+
+    def on_added(self, actor):
+        self._actor = actor
+
+    def on_removed(self, actor):
+        if self._actor is actor:
+            self._actor = None
+
+    def clone(self):
+        """Makes a copy of the body that belongs to no actor. A body in a 
+        store gets a new slot in the same store."""
+        if self._store is not None:
+            x, y = self.get_position()
+            return Body(x, y, self.get_vx(), self.get_vy(), self.get_height(), 
+                self.get_width(), self._store)
+        body = Body.__new__(Body)
+        body._actor = None
+        body._store = None
+        body._x = self._x
+        body._y = self._y
+        body._vx = self._vx
+        body._vy = self._vy
+        body._height = self._height
+        body._width = self._width
+        return body
+
+    def assign(self, other):
+        """Copies the values of another body into this one, moving this body 
+        into the other's store, or out of its own, if they differ."""
+        store = other._store
+        if self._store is not store:
+            if self._store is not None:
+                self._store.release(self)
+            if store is not None:
+                x, y = other.get_position()
+                self._store = store
+                self._row = store.allocate(x, y, other.get_vx(), 
+                    other.get_vy(), other.get_height(), other.get_width())
+                return
+        if store is not None:
+            store._data[:, self._row] = store._data[:, other._row]
+            return
+        self._x = other._x
+        self._y = other._y
+        self._vx = other._vx
+        self._vy = other._vy
+        self._height = other._height
+        self._width = other._width
+
+    def get_store(self):
+        return self._store
     
     def get_position(self):
-        return (self._x, self._y)
+        if self._store is None:
+            return (self._x, self._y)
+        data = self._store._data
+        return (data.item(_X, self._row), data.item(_Y, self._row))
     
     def set_position(self, x : float, y : float):
-        self._x = x
-        self._y = y
+        if self._store is None:
+            self._x = x
+            self._y = y
+        else:
+            data = self._store._data
+            data[_X, self._row] = x
+            data[_Y, self._row] = y
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
 
     def get_x(self):
-        return self._x
+        if self._store is None:
+            return self._x
+        return self._store._data.item(_X, self._row)
     
     def get_y(self):
-        return self._y
+        if self._store is None:
+            return self._y
+        return self._store._data.item(_Y, self._row)
     
     def set_x(self, x):
-        self._x = x
+        if self._store is None:
+            self._x = x
+        else:
+            self._store._data[_X, self._row] = x
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def set_y(self, y):
-        self._y = y
+        if self._store is None:
+            self._y = y
+        else:
+            self._store._data[_Y, self._row] = y
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
 
     def get_vx(self):
-        return self._vx
+        if self._store is None:
+            return self._vx
+        return self._store._data.item(_VX, self._row)
     
     def get_vy(self):
-        return self._vy
+        if self._store is None:
+            return self._vy
+        return self._store._data.item(_VY, self._row)
     
     def set_vx(self, vx):
-        self._vx = vx
+        if self._store is None:
+            self._vx = vx
+        else:
+            self._store._data[_VX, self._row] = vx
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def set_vy(self, vy):
-        self._vy = vy
+        if self._store is None:
+            self._vy = vy
+        else:
+            self._store._data[_VY, self._row] = vy
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def get_height(self):
-        return self._height
+        if self._store is None:
+            return self._height
+        return self._store._data.item(_HEIGHT, self._row)
     
     def set_height(self, height : float):
-        self._height = height
+        if self._store is None:
+            self._height = height
+        else:
+            self._store._data[_HEIGHT, self._row] = height
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def get_width(self):
-        return self._width
+        if self._store is None:
+            return self._width
+        return self._store._data.item(_WIDTH, self._row)
     
     def set_width(self, width : float):
-        self._width = width
+        if self._store is None:
+            self._width = width
+        else:
+            self._store._data[_WIDTH, self._row] = width
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def incr_x(self, dx):
-        self._x += dx
+        if self._store is None:
+            self._x += dx
+        else:
+            self._store._data[_X, self._row] += dx
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def incr_y(self, dy):
-        self._y += dy
+        if self._store is None:
+            self._y += dy
+        else:
+            self._store._data[_Y, self._row] += dy
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def move(self):
         """
             Move the object if the velocities are > 0
             There's more to think about this function
         """
-        self._x += self._vx
-        self._y += self._vy
\ No newline at end of file
+        if self._store is None:
+            self._x += self._vx
+            self._y += self._vy
+        else:
+            data = self._store._data
+            row = self._row
+            data[_X, row] += data[_VX, row]
+            data[_Y, row] += data[_VY, row]
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
@@ -1,27 +1,71 @@
 from .trait import Trait
 
 class Image(Trait):
+    """The picture an actor is drawn with.
+
+    Whenever a value changes through one of the setters below, the actor the 
+    image belongs to is told about it so the cast can keep its record of 
+    changed actors current.
+    """
+
+    __slots__ = ("_path", "_scale", "_rotation", "_layer", "_actor")
+
     def __init__(self, path : str = "", 
                     scale : float = 1,
-                    rotation : float = 0):
+                    rotation : float = 0,
+                    layer : int = 0):
         self._path = path
         self._scale = scale
         self._rotation = rotation
+        self._layer = layer
+        self._actor = None
+
+    def on_added(self, actor):
+        self._actor = actor
+
+    def on_removed(self, actor):
+        if self._actor is actor:
+            self._actor = None
+    
+    def clone(self):
+        return Image(self._path, self._scale, self._rotation, self._layer)
+    
+    def assign(self, other):
+        self._path = other._path
+        self._scale = other._scale
+        self._rotation = other._rotation
+        self._layer = other._layer
     
     def get_path(self):
         return self._path
     
     def set_path(self, path : str):
         self._path = path
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def get_scale(self):
         return self._scale
     
     def set_scale(self, scale : float):
         self._scale = scale
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
     
     def get_rotation(self):
         return self._rotation
     
     def set_rotation(self, rotation : float):
-        self._rotation = rotation
\ No newline at end of file
+        self._rotation = rotation
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
+    
+    def get_layer(self):
+        return self._layer
+    
+    def set_layer(self, layer : int):
+        """Sets the layer the image is drawn on. Lower layers are drawn first, 
+        so higher layers appear on top."""
+        self._layer = layer
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
\ No newline at end of file
@@ -0,0 +1,77 @@
+from .trait import Trait
+
+class Sound(Trait):
+    """A sound an actor can make.
+
+    Calling play() asks for the sound to be heard. The request is made 
+    through the actor, so AudioService, which watches the actors with a 
+    Sound, picks it up in the same frame's output phase, or the next one if 
+    it was made after that.
+
+    Sounds with a higher priority take a voice from lower priority ones when 
+    every voice is in use.
+    """
+
+    __slots__ = ("_path", "_volume", "_priority", "_is_triggered", "_actor")
+
+    def __init__(self, path : str = "", 
+                    volume : float = 1,
+                    priority : int = 0):
+        self._path = path
+        self._volume = volume
+        self._priority = priority
+        self._is_triggered = False
+        self._actor = None
+
+    def on_added(self, actor):
+        self._actor = actor
+
+    def on_removed(self, actor):
+        if self._actor is actor:
+            self._actor = None
+    
+    def clone(self):
+        return Sound(self._path, self._volume, self._priority)
+    
+    def assign(self, other):
+        self._path = other._path
+        self._volume = other._volume
+        self._priority = other._priority
+        self._is_triggered = False
+    
+    def get_path(self):
+        return self._path
+    
+    def set_path(self, path : str):
+        self._path = path
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
+    
+    def get_volume(self):
+        return self._volume
+    
+    def set_volume(self, volume : float):
+        self._volume = volume
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
+    
+    def get_priority(self):
+        return self._priority
+    
+    def set_priority(self, priority : int):
+        self._priority = priority
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
+
+    def is_triggered(self):
+        return self._is_triggered
+    
+    def play(self):
+        """Asks for the sound to be played this frame."""
+        self._is_triggered = True
+        if self._actor is not None:
+            self._actor.on_trait_changed(self)
+
+    def reset(self):
+        """Marks the request to play the sound as handled."""
+        self._is_triggered = False
@@ -4,6 +4,8 @@ Author(s): Matt Manley, Jacob Oliphant
 Version: 1.0
 Date: 27-01-2021
 """
+from abc import ABC
+from abc import abstractmethod
 
 
 class Actor:
@@ -21,20 +23,96 @@ class Actor:
 
     Attributes:
         _traits: Dict[Type[Trait], cls: Type[Trait]], The actor's traits.
+        _observers: Tuple[Actor.Observer], The objects watching the actor's 
+            traits.
     """
 
+    __slots__ = ("_traits", "_observers", "__weakref__")
+
+    class Observer(ABC):
+        """An actor observer.
+
+        The responsibility of Observer is to provide a means for an actor to 
+        let interested objects, like the cast it belongs to, know that its 
+        traits have changed.
+        """
+
+        @abstractmethod
+        def on_trait_added(self, actor, trait):
+            """This method is called after a new type of trait is added to the 
+            actor.
+
+            Args:
+                actor: Actor, The actor that changed.
+                trait: Trait, The trait that was added.
+            """
+            pass
+
+        @abstractmethod
+        def on_trait_removed(self, actor, trait):
+            """This method is called after a type of trait is removed from the 
+            actor.
+
+            Args:
+                actor: Actor, The actor that changed.
+                trait: Trait, The trait that was removed.
+            """
+            pass
+
+        @abstractmethod
+        def on_trait_changed(self, actor, trait):
+            """This method is called after the values of one of the actor's 
+            traits change.
+
+            Args:
+                actor: Actor, The actor that changed.
+                trait: Trait, The trait whose values changed.
+            """
+            pass
+
     def __init__(self):
         """Initializes a new instance of Actor."""
         self._traits = dict()
+        self._observers = ()
+
+    def add_observer(self, observer):
+        """Starts notifying the given observer of trait changes.
+
+        Args:
+            observer: Actor.Observer, The observer to add.
+        """
+        if observer not in self._observers:
+            self._observers += (observer,)
+
+    def remove_observer(self, observer):
+        """Stops notifying the given observer of trait changes.
+
+        Args:
+            observer: Actor.Observer, The observer to remove.
+        """
+        if observer in self._observers:
+            self._observers = tuple(
+                o for o in self._observers if o is not observer)
             
     def add_trait(self, trait):
-        """Adds the given trait to the actor. Will replace 
+        """Adds the given trait to the actor. Will replace any existing trait 
+        of the same type.
 
         Args:
             trait: Trait, The trait to add.
         """
         type_ = type(trait)
+        replaced = self._traits.get(type_, None)
+        if replaced is trait:
+            return
         self._traits[type_] = trait
+        if replaced is not None:
+            replaced.on_removed(self)
+        trait.on_added(self)
+        for observer in self._observers:
+            if replaced is not None:
+                observer.on_trait_removed(self, replaced)
+            observer.on_trait_added(self, trait)
         
     def get_trait(self, type_):
         """Gets the trait corresponding to the given type. This method will 
@@ -57,7 +135,11 @@ class Actor:
         Returns:
             boolean: True if the actor has all the traits; false if otherwise.
         """
-        return set(types).issubset(self._traits.keys())
+        traits = self._traits
+        for type_ in types:
+            if type_ not in traits:
+                return False
+        return True
 
     def remove_trait(self, trait):
         """Removes the given trait from the actor.
@@ -66,4 +148,18 @@ class Actor:
             trait: Trait, The trait to remove.
         """
         type_ = type(trait)
-        self._traits.pop(type_, None)
\ No newline at end of file
+        removed = self._traits.pop(type_, None)
+        if removed is not None:
+            removed.on_removed(self)
+            for observer in self._observers:
+                observer.on_trait_removed(self, removed)
+
+    def on_trait_changed(self, trait):
+        """Tells the actor's observers that the values of the given trait have 
+        changed. Traits call this from their setters.
+
+        Args:
+            trait: Trait, The trait whose values changed.
+        """
+        for observer in self._observers:
+            observer.on_trait_changed(self, trait)
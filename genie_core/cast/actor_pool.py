@@ -0,0 +1,100 @@
+from collections import defaultdict
+
+
+class ActorPool:
+    """Removed actors kept for reuse.
+
+    The responsibility of ActorPool is to keep short-lived actors, like 
+    bullets and particles, from being allocated and collected over and over. 
+    A cast created with a pool gives it every actor that apply_changes 
+    removes, with its traits, and Actors.spawn takes actors with the same 
+    types of trait from it before making new ones. The set of trait types is 
+    the actor's archetype and each archetype has its own free list.
+
+    Pooled actors are reused, so code must not hold on to an actor after 
+    removing it from a pooled cast.
+
+    Attributes:
+        _capacity: int, The most actors kept per archetype.
+        _free: Dict[FrozenSet[Type[Trait]], List[Actor]], The free lists.
+        _hits: int, The number of spawns that reused an actor.
+        _misses: int, The number of spawns that found the free list empty.
+        _released: int, The number of actors put in a free list.
+        _discarded: int, The number of actors dropped because their free 
+            list was full.
+    """
+
+    def __init__(self, capacity : int = 1024):
+        """Initializes a new instance of ActorPool.
+
+        Args:
+            capacity: int, The most actors kept per archetype.
+        """
+        self._capacity = capacity
+        self._free = defaultdict(list)
+        self._hits = 0
+        self._misses = 0
+        self._released = 0
+        self._discarded = 0
+
+    def acquire(self, archetype):
+        """Takes an actor of the given archetype from its free list.
+
+        Args:
+            archetype: FrozenSet[Type[Trait]], The types of trait.
+
+        Returns:
+            Actor: The actor, with its old traits, or None if there is none.
+        """
+        free = self._free.get(archetype)
+        if free:
+            self._hits += 1
+            return free.pop()
+        self._misses += 1
+        return None
+
+    def release(self, actor):
+        """Puts an actor that left the cast in the free list of its 
+        archetype.
+
+        Args:
+            actor: Actor, The actor.
+        """
+        free = self._free[self.get_archetype(actor)]
+        if len(free) >= self._capacity:
+            self._discarded += 1
+            return
+        free.append(actor)
+        self._released += 1
+
+    def get_archetype(self, actor):
+        """Gets the archetype of the given actor.
+
+        Args:
+            actor: Actor, The actor.
+
+        Returns:
+            FrozenSet[Type[Trait]]: The types of its traits.
+        """
+        return frozenset(actor._traits)
+
+    def get_stats(self):
+        """Gets the pool counters.
+
+        Returns:
+            dict: The "hits", "misses", "hit_rate", "released", "discarded" 
+            and currently "pooled" actors.
+        """
+        spawns = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / spawns if spawns else 0.0,
+            "released": self._released,
+            "discarded": self._discarded,
+            "pooled": sum(len(free) for free in self._free.values())
+        }
+
+    def clear(self):
+        """Forgets every pooled actor."""
+        self._free.clear()
@@ -4,10 +4,18 @@ Author(s): Matt Manley, Jacob Oliphant
 Version: 1.0
 Date: 27-01-2021
 """
-from collections import defaultdict
+import threading
+import weakref
 from genie_core.cast.actor import Actor
+from genie_core.cast.actor_pool import ActorPool
+from genie_core.cast.Body import Body
+from genie_core.cast import snapshot
+from genie_core.cast.entities import Entities, INDEX_MASK
+from genie_core.cast.query import Query
+from genie_core.cast.spatial_hash import SpatialHash
+from genie_core.cast.sparse_set import SparseSet
 
-class Actors:
+class Actors(Actor.Observer):
     """A collection of actors. 
     
     The responsibility of Actors is to keep track of them. It provides methods 
@@ -22,15 +30,74 @@ class Actors:
     allows us to change the underlying data structure and algorithms at any 
     time without affecting the rest of the project. 
 
+    Underneath, the cast works like an entity component system: every actor 
+    in it has a generational integer id, and the traits of each type are 
+    packed in a SparseSet keyed by the id's slot, so each can walk every 
+    actor with some types of trait over contiguous lists.
+
     Attributes:
         _current_actors: Set[cls: Type[Actor]]
         _removed_actors: Set[cls: Type[Actor]]
+        _entities: Entities, The ids of the current actors.
+        _ids: Dict[Actor, int], The id of every current actor.
+        _slots: List[Actor], The actor in each id slot, or None.
+        _storages: Dict[Type[Trait], SparseSet], The traits of the current 
+            actors, by type.
+        _version: int, A number that changes whenever _storages does.
+        _cell_size: float, The cell size of the spatial index.
+        _spatial_hash: SpatialHash, The current actors with a Body indexed by 
+            position, or None until the first spatial query.
+        _changed_actors: Set[Actor], The actors added or whose traits changed 
+            since the last call to apply_changes.
+        _frame: int, The number of times apply_changes has been called.
+        _last_changed: Set[Actor], The actors changed in the previous frame.
+        _last_removed: Set[Actor], The actors removed in the previous frame.
+        _queries: WeakSet[Query], The live queries to tell about changes.
+        _pool: ActorPool, Where removed actors are kept for spawn to reuse, 
+            or None.
+        _lock: threading.RLock, Held while the actors, the spatial index or 
+            a query change, so actions run at the same time by a Scheduler 
+            can add actors or search the cast.
     """
 
-    def __init__(self):
-        """Initializes a new instance of Cast."""
+    def __init__(self, cell_size : float = 64, pool : ActorPool = None):
+        """Initializes a new instance of Cast.
+
+        Args:
+            cell_size: float, The cell size of the spatial index used by 
+                in_rect, in_radius and nearest.
+            pool: ActorPool, Where to keep removed actors for spawn to reuse, 
+                or None to let them go.
+        """
         self._current_actors = set()
         self._removed_actors = set()
+        self._entities = Entities()
+        self._ids = {}
+        self._slots = []
+        self._storages = {}
+        self._version = 0
+        self._cell_size = cell_size
+        self._spatial_hash = None
+        self._changed_actors = set()
+        self._last_changed = set()
+        self._last_removed = set()
+        self._frame = 0
+        self._queries = weakref.WeakSet()
+        self._pool = pool
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        """Leaves the live queries and the lock out when the cast is 
+        pickled; they can't be pickled and belong to this process."""
+        state = self.__dict__.copy()
+        del state["_queries"]
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._queries = weakref.WeakSet()
+        self._lock = threading.RLock()
         
     def add_actor(self, actor):
         """Adds the given actor to the cast.
@@ -38,12 +105,187 @@ class Actors:
         Args:
             actors: Actor, The actor to add.
         """
-        self._current_actors.add(actor)
+        with self._lock:
+            if actor in self._current_actors:
+                return
+            self._current_actors.add(actor)
+            self._index(actor)
+            actor.add_observer(self)
+            self._version += 1
+            self._changed_actors.add(actor)
+            if self._spatial_hash is not None and Body in actor._traits:
+                self._spatial_hash.add_actor(actor)
+            for query in self._queries:
+                query.on_actor_changed(actor)
+    
+    def add_actors(self, actors):
+        """Adds the given actors to the cast, updating its indexes once for 
+        the whole batch instead of once per actor.
+
+        Args:
+            actors: Iterable[Actor], The actors to add.
+        """
+        with self._lock:
+            current = self._current_actors
+            added = [a for a in dict.fromkeys(actors) if a not in current]
+            if not added:
+                return
+            current.update(added)
+            for actor in added:
+                self._index(actor)
+                actor.add_observer(self)
+            self._version += 1
+            self._changed_actors.update(added)
+            if self._spatial_hash is not None:
+                for actor in added:
+                    if Body in actor._traits:
+                        self._spatial_hash.add_actor(actor)
+            for query in self._queries:
+                query.on_actors_changed(added)
+
+    def remove_actors(self, actors):
+        """Marks the given actors for removal from the cast, see remove_actor.
+
+        Args:
+            actors: Iterable[Actor], The actors to remove.
+        """
+        with self._lock:
+            self._removed_actors.update(actors)
+
+    def spawn(self, prototype, count, **overrides):
+        """Adds the given number of copies of a prototype actor to the cast. 
+        Every trait of the prototype is copied with its clone method, so the 
+        prototype itself need not be in the cast.
+
+        With a pool, actors of the prototype's archetype that were removed 
+        earlier are reused, their traits given the prototype's values with 
+        assign, before new ones are made.
+
+        Each keyword names a setter of one of the prototype's traits, without 
+        the "set_" prefix, and gives the copies their own values: a list (or 
+        other sequence that isn't a tuple or string) holds one value per copy 
+        and anything else is used for every copy. Tuples are passed to the 
+        setter as separate arguments, for example position=[(0, 0), (5, 5)].
+
+        Args:
+            prototype: Actor, The actor to copy.
+            count: int, The number of copies.
+            overrides: Dict[str, object], The values to set on the copies.
+
+        Returns:
+            List[Actor]: The copies.
+
+        Raises:
+            AttributeError: If no trait of the prototype has a setter for an 
+                override.
+            ValueError: If an override doesn't have one value per copy.
+        """
+        traits = list(prototype._traits.values())
+        setters = []
+        for name, value in overrides.items():
+            setter = "set_" + name
+            for index, trait in enumerate(traits):
+                if hasattr(trait, setter):
+                    break
+            else:
+                raise AttributeError(f"no trait of the prototype has {setter}")
+            if isinstance(value, (tuple, str, bytes)) \
+                    or not hasattr(value, "__len__"):
+                value = [value] * count
+            elif len(value) != count:
+                raise ValueError(f"{name} has {len(value)} values for "
+                    f"{count} copies")
+            setters.append((index, setter, value))
+        pool = self._pool
+        archetype = pool.get_archetype(prototype) if pool is not None else None
+        spawned = []
+        for i in range(count):
+            actor = None
+            if pool is not None:
+                with self._lock:
+                    actor = pool.acquire(archetype)
+            if actor is not None:
+                clones = [actor._traits[type(trait)] for trait in traits]
+                for clone, trait in zip(clones, traits):
+                    clone.assign(trait)
+            else:
+                actor = Actor()
+                clones = [trait.clone() for trait in traits]
+            for index, setter, values in setters:
+                value = values[i]
+                if isinstance(value, tuple):
+                    getattr(clones[index], setter)(*value)
+                else:
+                    getattr(clones[index], setter)(value)
+            traits_by_type = actor._traits
+            for clone in clones:
+                traits_by_type[type(clone)] = clone
+                clone.on_added(actor)
+            spawned.append(actor)
+        self.add_actors(spawned)
+        return spawned
     
     def apply_changes(self):
-        """Permantely removes all of the dead actors."""
-        self._current_actors -= self._removed_actors
-        self._removed_actors.clear()
+        """Permantely removes all of the dead actors and starts a new record 
+        of changed actors."""
+        with self._lock:
+            queries = list(self._queries)
+            for actor in self._removed_actors:
+                if actor in self._current_actors:
+                    self._current_actors.discard(actor)
+                    self._unindex(actor)
+                    self._version += 1
+                    for query in queries:
+                        query.on_actor_changed(actor)
+                    if self._pool is not None:
+                        self._pool.release(actor)
+            self._last_removed, self._removed_actors = \
+                self._removed_actors, self._last_removed
+            self._last_changed, self._changed_actors = \
+                self._changed_actors, self._last_changed
+            self._removed_actors.clear()
+            self._changed_actors.clear()
+            self._frame += 1
+            for query in queries:
+                query.on_frame()
+
+    def get_changed_actors(self):
+        """Gets the actors that were added, or whose traits were added, 
+        removed or changed, since apply_changes was last called. Output 
+        actions can use it to redraw only what changed. Removed actors can be 
+        found with get_removed_actors until apply_changes is called.
+
+        Returns:
+            Set[Actor]: The changed actors. Must not be modified.
+        """
+        return self._changed_actors
+
+    def get_removed_actors(self):
+        """Gets the actors marked for removal since apply_changes was last 
+        called.
+
+        Returns:
+            Set[Actor]: The removed actors. Must not be modified.
+        """
+        return self._removed_actors
+
+    def get_last_changed_actors(self):
+        """Gets the actors that counted as changed in the previous frame, 
+        for clients that need the changes made after they last looked.
+
+        Returns:
+            Set[Actor]: The actors. Must not be modified.
+        """
+        return self._last_changed
+
+    def get_last_removed_actors(self):
+        """Gets the actors that were marked for removal in the previous 
+        frame.
+
+        Returns:
+            Set[Actor]: The actors. Must not be modified.
+        """
+        return self._last_removed
 
     def remove_actor(self, actor):
         """Marks the given actor for removal from the cast. Clients must call clean_actors to permanently remove actors from the cast. 
@@ -51,8 +293,32 @@ class Actors:
         Args:
             actor: Actor, The actor to remove.
         """
-        self._removed_actors.add(actor)
+        with self._lock:
+            self._removed_actors.add(actor)
         
+    def get_pool(self):
+        return self._pool
+
+    def get_frame(self):
+        """Gets the number of times apply_changes has been called. Clients 
+        that read get_changed_actors less often than once a frame can use it 
+        to tell that they missed some changes.
+
+        Returns:
+            int: The frame number.
+        """
+        return self._frame
+
+    def get_version(self):
+        """Gets a number that changes whenever an actor joins or leaves the 
+        cast or gains or loses a type of trait. Clients can use it to tell 
+        whether the results they got from with_traits are still current.
+
+        Returns:
+            int: The version.
+        """
+        return self._version
+
     def with_traits(self, *types):
         """Finds those actors with the given types of traits.
         
@@ -61,4 +327,301 @@ class Actors:
         Returns:
             set: A set of actors.
         """
-        return [a for a in self._current_actors if a.has_traits(*types)]
\ No newline at end of file
+        if not types:
+            return list(self._current_actors)
+        smallest = None
+        for type_ in types:
+            storage = self._storages.get(type_)
+            if not storage:
+                return []
+            if smallest is None or len(storage) < len(smallest):
+                smallest = storage
+        if len(types) == 1:
+            return list(smallest.get_actors())
+        return [a for a in smallest.get_actors() if a.has_traits(*types)]
+
+    def each(self, *types):
+        """Walks the actors with the given types of trait, yielding each with 
+        those traits. The walk goes over the packed storage of the rarest 
+        type and looks the others up by id, so no get_trait calls or lists 
+        are needed. Traits must not be added to or removed from actors 
+        during the walk; actors may be added or removed as usual.
+
+        Args:
+            types: Tuple[Type[Trait]], The types of trait.
+
+        Returns:
+            Iterator[Tuple]: (actor, trait, ...) with the traits in the order 
+            of the types.
+        """
+        storages = [self._storages.get(type_) for type_ in types]
+        if not storages or not all(storages):
+            return iter(())
+        smallest = min(storages, key=len)
+        if len(storages) == 1:
+            return zip(smallest.get_actors(), smallest.get_values())
+        return self._join(smallest, storages)
+
+    def get_id(self, actor):
+        """Gets the id of the given actor, which stays the same for as long 
+        as the actor is in the cast.
+
+        Args:
+            actor: Actor, The actor.
+
+        Returns:
+            int: The id, or None if the actor isn't in the cast.
+        """
+        return self._ids.get(actor)
+
+    def get_actor(self, id_ : int):
+        """Gets the actor with the given id.
+
+        Args:
+            id_: int, The id.
+
+        Returns:
+            Actor: The actor, or None if the id is no longer alive.
+        """
+        if not self._entities.is_alive(id_):
+            return None
+        return self._slots[id_ & INDEX_MASK]
+
+    def in_rect(self, left, top, right, bottom):
+        """Finds the actors with a Body positioned inside the given rectangle, 
+        edges included.
+
+        Returns:
+            List[Actor]: The actors found.
+        """
+        with self._lock:
+            return self._get_spatial_hash().in_rect(left, top, right, bottom)
+
+    def in_radius(self, x, y, radius):
+        """Finds the actors with a Body positioned within the given distance 
+        of the given point.
+
+        Returns:
+            List[Actor]: The actors found.
+        """
+        with self._lock:
+            return self._get_spatial_hash().in_radius(x, y, radius)
+
+    def nearest(self, x, y, k = 1):
+        """Finds the k actors with a Body positioned closest to the given 
+        point.
+
+        Returns:
+            List[Actor]: Up to k actors, closest first.
+        """
+        with self._lock:
+            return self._get_spatial_hash().nearest(x, y, k)
+
+    def query(self, *types):
+        """Makes a live query for the actors with the given types of trait. 
+        Unlike with_traits, the query is meant to be kept: it stays current 
+        as the cast changes and iterating it doesn't build a new list.
+
+        Args:
+            types: Tuple[Type[Trait]], The types of trait.
+
+        Returns:
+            Query: The query.
+        """
+        query = Query(self, types)
+        self._queries.add(query)
+        return query
+
+    def snapshot(self):
+        """Packs the current actors and their traits into a compact binary 
+        buffer that restore can rebuild them from, for save states or 
+        rewinding. Bodies living in a BodyStore are saved by copying the 
+        store's columns in one go. Types of trait other than Body, Image and 
+        Sound must be registered with snapshot.register_trait first.
+
+        Returns:
+            bytearray: The snapshot.
+        """
+        return snapshot.take_snapshot(self)
+
+    def restore(self, data):
+        """Replaces the cast with the actors in the given snapshot, right 
+        away. The restored actors are new objects and count as changed until 
+        apply_changes is called.
+
+        Args:
+            data: Buffer, A snapshot made by snapshot().
+        """
+        with self._lock:
+            restored = snapshot.restore_snapshot(data)
+            self._spatial_hash = None
+            for actor in self._current_actors:
+                self._unindex(actor)
+                for query in self._queries:
+                    query.on_actor_changed(actor)
+            self._current_actors = set()
+            self._removed_actors.clear()
+            self._changed_actors.clear()
+            self._last_removed.clear()
+            self._last_changed.clear()
+            self._version += 1
+            for actor in restored:
+                self.add_actor(actor)
+
+    def invalidate_positions(self, stores = None):
+        """Tells the cast that bodies may have moved without going through the 
+        Body methods, for example in bulk through a BodyStore. The spatial 
+        index is rebuilt before the next query and the actors whose bodies 
+        may have moved count as changed until apply_changes is called.
+
+        Args:
+            stores: Iterable[BodyStore], The stores whose bodies moved, or 
+                None if any body may have moved.
+        """
+        with self._lock:
+            if self._spatial_hash is not None:
+                self._spatial_hash.invalidate()
+            storage = self._storages.get(Body)
+            if not storage:
+                return
+            if stores is None:
+                self._changed_actors.update(storage.get_actors())
+                return
+            stores = set(stores)
+            self._changed_actors.update(actor for actor, body 
+                in zip(storage.get_actors(), storage.get_values()) 
+                if body._store in stores)
+
+    def on_trait_added(self, actor, trait):
+        """This Actor.Observer override indexes the actor by its new trait.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait that was added.
+        """
+        with self._lock:
+            id_ = self._ids.get(actor)
+            if id_ is not None:
+                storage = self._get_storage(type(trait))
+                storage.add(id_ & INDEX_MASK, actor, trait)
+                self._version += 1
+                self._changed_actors.add(actor)
+                for query in self._queries:
+                    query.on_actor_changed(actor)
+                if self._spatial_hash is not None and type(trait) is Body:
+                    self._spatial_hash.add_actor(actor)
+
+    def on_trait_removed(self, actor, trait):
+        """This Actor.Observer override drops the actor from the index of the 
+        removed trait.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait that was removed.
+        """
+        with self._lock:
+            storage = self._storages.get(type(trait))
+            id_ = self._ids.get(actor)
+            if storage is not None and id_ is not None \
+                    and (id_ & INDEX_MASK) in storage:
+                storage.remove(id_ & INDEX_MASK)
+                self._version += 1
+                self._changed_actors.add(actor)
+                for query in self._queries:
+                    query.on_actor_changed(actor)
+                if self._spatial_hash is not None and type(trait) is Body:
+                    self._spatial_hash.remove_actor(actor)
+
+    def on_trait_changed(self, actor, trait):
+        """This Actor.Observer override records the actor as changed and keeps 
+        the spatial index current when its body moves.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait whose values changed.
+        """
+        self._changed_actors.add(actor)
+        if self._spatial_hash is not None and type(trait) is Body:
+            with self._lock:
+                self._spatial_hash.mark_moved(actor)
+
+    def _get_spatial_hash(self):
+        """Gets the spatial index, building it on first use."""
+        if self._spatial_hash is None:
+            self._spatial_hash = SpatialHash(self._cell_size)
+            storage = self._storages.get(Body)
+            for actor in (storage.get_actors() if storage else ()):
+                self._spatial_hash.add_actor(actor)
+        return self._spatial_hash
+
+    def _get_storage(self, type_):
+        """Gets the storage of the given type of trait, making it if needed."""
+        storage = self._storages.get(type_)
+        if storage is None:
+            storage = self._storages[type_] = SparseSet()
+        return storage
+
+    def _index(self, actor):
+        """Gives the given actor an id and stores its traits.
+
+        Args:
+            actor: Actor, The actor to index.
+        """
+        id_ = self._entities.create()
+        index = id_ & INDEX_MASK
+        self._ids[actor] = id_
+        if index == len(self._slots):
+            self._slots.append(actor)
+        else:
+            self._slots[index] = actor
+        for type_, trait in actor._traits.items():
+            self._get_storage(type_).add(index, actor, trait)
+
+    def _join(self, smallest, storages):
+        """Yields the actors of the smallest storage that are in all the 
+        others, with their traits."""
+        at = storages.index(smallest)
+        others = [(s._sparse, len(s._sparse), s._values) 
+            for i, s in enumerate(storages) if i != at]
+        if len(others) == 1:
+            (sparse, size, values), = others
+            for index, actor, value in zip(smallest._indices, 
+                    smallest._actors, smallest._values):
+                position = sparse[index] if index < size else -1
+                if position >= 0:
+                    if at == 0:
+                        yield (actor, value, values[position])
+                    else:
+                        yield (actor, values[position], value)
+            return
+        for index, actor, value in zip(smallest._indices, smallest._actors, 
+                smallest._values):
+            row = [actor]
+            for sparse, size, values in others:
+                position = sparse[index] if index < size else -1
+                if position < 0:
+                    break
+                row.append(values[position])
+            else:
+                row.insert(at + 1, value)
+                yield tuple(row)
+
+    def _unindex(self, actor):
+        """Drops the given actor from the trait storages, retires its id and 
+        stops observing it.
+
+        Args:
+            actor: Actor, The actor to drop.
+        """
+        id_ = self._ids.pop(actor, None)
+        if id_ is not None:
+            index = id_ & INDEX_MASK
+            for type_ in actor._traits:
+                storage = self._storages.get(type_)
+                if storage is not None:
+                    storage.remove(index)
+            self._slots[index] = None
+            self._entities.destroy(id_)
+        if self._spatial_hash is not None:
+            self._spatial_hash.remove_actor(actor)
+        actor.remove_observer(self)
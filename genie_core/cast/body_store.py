@@ -0,0 +1,169 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BodyStore:
+    """Columnar storage for bodies.
+
+    The responsibility of BodyStore is to keep the positions, velocities and 
+    sizes of many bodies in one contiguous NumPy array, a row per column, so 
+    they can be updated in bulk instead of one Body at a time. Bodies created 
+    with a store are lightweight views into one of its slots and keep the 
+    usual getter and setter methods.
+
+    NumPy is an optional dependency of genie_core. It is only needed when a 
+    store is created.
+
+    Attributes:
+        _data: numpy.ndarray, A (6, capacity) array of float64 holding the 
+            columns listed in COLUMNS.
+        _size: int, The number of slots handed out so far.
+        _free: List[int], Slots given back by released bodies.
+        _is_fixed: bool, Whether the columns live in a buffer that was given 
+            to the store, which keeps it from growing.
+        _version: int, A number that changes whenever a slot is handed out or 
+            given back.
+    """
+
+    X, Y, VX, VY, HEIGHT, WIDTH = range(6)
+    COLUMNS = ("x", "y", "vx", "vy", "height", "width")
+    """Tuple[str]: The names of the columns, in storage order."""
+
+    def __init__(self, capacity : int = 1024, buffer = None):
+        """Initializes a new instance of BodyStore.
+
+        Args:
+            capacity: int, The number of bodies to make room for up front. The 
+                store grows as needed unless a buffer is given.
+            buffer: Buffer, Memory to keep the columns in, for example that of 
+                a multiprocessing.shared_memory.SharedMemory. It must hold 
+                len(COLUMNS) * capacity float64 values and the store can't 
+                grow past capacity.
+        """
+        if numpy is None:
+            raise ImportError("BodyStore requires numpy to be installed")
+        shape = (len(self.COLUMNS), max(1, capacity))
+        if buffer is None:
+            self._data = numpy.zeros(shape)
+        else:
+            self._data = numpy.ndarray(shape, dtype=numpy.float64, 
+                buffer=buffer)
+        self._is_fixed = buffer is not None
+        self._size = 0
+        self._free = []
+        self._version = 0
+
+    def __len__(self):
+        """The number of bodies currently stored."""
+        return self._size - len(self._free)
+
+    def allocate(self, x, y, vx, vy, height, width):
+        """Reserves a slot for a body and fills it with the given values.
+
+        Returns:
+            int: The slot the body lives in.
+        """
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._size == self._data.shape[1]:
+                self._grow()
+            row = self._size
+            self._size += 1
+        self._version += 1
+        data = self._data
+        data[self.X, row] = x
+        data[self.Y, row] = y
+        data[self.VX, row] = vx
+        data[self.VY, row] = vy
+        data[self.HEIGHT, row] = height
+        data[self.WIDTH, row] = width
+        return row
+
+    def get_column(self, name : str):
+        """Gets a live view of one column over every slot handed out so far. 
+        Released slots are zeroed so they can be safely included in bulk 
+        operations. The view is invalidated when the store grows.
+
+        Args:
+            name: str, One of COLUMNS.
+
+        Returns:
+            numpy.ndarray: The column.
+        """
+        return self._data[self.COLUMNS.index(name), :self._size]
+
+    def get_data(self):
+        """Gets a live view of every column over every slot handed out so far.
+
+        Returns:
+            numpy.ndarray: A (6, n) array ordered like COLUMNS.
+        """
+        return self._data[:, :self._size]
+
+    def get_free_slots(self):
+        """Gets the slots below the size of the store that aren't in use.
+
+        Returns:
+            List[int]: The slots.
+        """
+        return list(self._free)
+
+    def get_version(self):
+        """Gets a number that changes whenever a slot is handed out or given 
+        back.
+
+        Returns:
+            int: The version.
+        """
+        return self._version
+
+    def move_all(self):
+        """Moves every body in the store by its velocity in one vectorized 
+        operation. Bodies moved this way don't tell their actors, so call 
+        Actors.invalidate_positions afterwards if the cast's spatial queries 
+        are in use."""
+        n = self._size
+        self._data[self.X:self.VX, :n] += self._data[self.VX:self.HEIGHT, :n]
+
+    def release(self, body):
+        """Gives the body's slot back to the store. The body keeps its values 
+        but stops being a view and goes back to storing them itself.
+
+        Args:
+            body: Body, A body created with this store.
+        """
+        if body._store is not self:
+            raise ValueError("body does not belong to this store")
+        row = body._row
+        x, y, vx, vy, height, width = self._data[:, row].tolist()
+        body._store = None
+        body._row = None
+        body._x = x
+        body._y = y
+        body._vx = vx
+        body._vy = vy
+        body._height = height
+        body._width = width
+        self._data[:, row] = 0
+        self._free.append(row)
+        self._version += 1
+
+    def unshare(self):
+        """Copies the columns out of the buffer the store was given, so that 
+        the buffer can be freed while the store and its bodies keep working. 
+        The store can grow again afterwards."""
+        if self._is_fixed:
+            self._data = self._data.copy()
+            self._is_fixed = False
+
+    def _grow(self):
+        """Doubles the capacity of the store."""
+        if self._is_fixed:
+            raise MemoryError("BodyStore is full and its buffer can't grow")
+        rows, capacity = self._data.shape
+        data = numpy.zeros((rows, capacity * 2))
+        data[:, :capacity] = self._data
+        self._data = data
@@ -0,0 +1,65 @@
+from array import array
+
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class Entities:
+    """Generational integer ids.
+
+    The responsibility of Entities is to hand out the integer ids a cast 
+    knows its actors by. An id packs a slot index, in the low INDEX_BITS 
+    bits, with the generation of that slot above them. Slots are reused once 
+    their id is destroyed, but each reuse bumps the generation, so an old id 
+    that is still held somewhere never refers to the new occupant.
+
+    Attributes:
+        _generations: array, The current generation of every slot.
+        _free: List[int], The slots whose ids were destroyed.
+    """
+
+    def __init__(self):
+        self._generations = array("L")
+        self._free = []
+
+    def __len__(self):
+        """The number of ids alive."""
+        return len(self._generations) - len(self._free)
+
+    def create(self):
+        """Makes a new id.
+
+        Returns:
+            int: The id.
+        """
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._generations)
+            self._generations.append(0)
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def destroy(self, id_ : int):
+        """Retires an id so that its slot can be reused. Retiring an id 
+        that isn't alive does nothing.
+
+        Args:
+            id_: int, The id.
+        """
+        if self.is_alive(id_):
+            index = id_ & INDEX_MASK
+            self._generations[index] += 1
+            self._free.append(index)
+
+    def is_alive(self, id_ : int):
+        """Whether the given id was created and not destroyed yet.
+
+        Args:
+            id_: int, The id.
+
+        Returns:
+            bool: True if the id is alive; false if otherwise.
+        """
+        index = id_ & INDEX_MASK
+        return (index < len(self._generations) 
+            and self._generations[index] == id_ >> INDEX_BITS)
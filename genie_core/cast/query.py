@@ -0,0 +1,159 @@
+class Query:
+    """The actors with some types of trait, kept current.
+
+    The responsibility of Query is to give actions that look for the same 
+    types of trait every frame an answer they can keep instead of asking 
+    Actors.with_traits, which builds a new list each call. A query is made 
+    with Actors.query and is told by the cast about every actor that joins, 
+    leaves or gains or loses a trait. It only works out what those changes 
+    mean the next time it is used. Working them out puts the members in a 
+    new list, leaving the one a running iteration walks alone, so iterating 
+    the query while actions change the cast, or asking for its length or 
+    membership meanwhile, is safe; the changes show up the next time it is 
+    iterated.
+
+    The query also keeps the actors that joined and left it during the last 
+    frame, ending with the removals made by the cast's apply_changes, for 
+    actions that only react to changes.
+
+    Attributes:
+        _actors: Actors, The cast.
+        _types: Tuple[Type[Trait]], The types of trait the actors must have.
+        _members: List[Actor], The actors in the query, in no set order.
+        _positions: Dict[Actor, int], Where each member is in _members.
+        _pending: Set[Actor], The actors that may have joined or left since 
+            the query was last used.
+        _added: Set[Actor], The actors that joined this frame.
+        _removed: Set[Actor], The actors that left this frame.
+        _last_added: Set[Actor], The actors that joined last frame.
+        _last_removed: Set[Actor], The actors that left last frame.
+    """
+
+    def __init__(self, actors, types):
+        """Initializes a new instance of Query. Use Actors.query instead.
+
+        Args:
+            actors: Actors, The cast.
+            types: Tuple[Type[Trait]], The types of trait the actors must 
+                have.
+        """
+        self._actors = actors
+        self._types = tuple(types)
+        self._members = list(actors.with_traits(*types))
+        self._positions = {a: i for i, a in enumerate(self._members)}
+        self._pending = set()
+        self._added = set()
+        self._removed = set()
+        self._last_added = set()
+        self._last_removed = set()
+
+    def __iter__(self):
+        self._refresh()
+        return iter(self._members)
+
+    def __len__(self):
+        self._refresh()
+        return len(self._members)
+
+    def __contains__(self, actor):
+        self._refresh()
+        return actor in self._positions
+
+    def get_types(self):
+        return self._types
+
+    def get_added(self):
+        """Gets the actors that joined the query during the last frame.
+
+        Returns:
+            Set[Actor]: The actors. Must not be modified.
+        """
+        return self._last_added
+
+    def get_joined(self):
+        """Gets the actors that have joined the query so far this frame, for 
+        clients that look at the query before the frame is over.
+
+        Returns:
+            Set[Actor]: The actors. Must not be modified.
+        """
+        self._refresh()
+        return self._added
+
+    def get_removed(self):
+        """Gets the actors that left the query during the last frame, 
+        including those the cast removed at the end of it.
+
+        Returns:
+            Set[Actor]: The actors. Must not be modified.
+        """
+        return self._last_removed
+
+    def on_actor_changed(self, actor):
+        """Tells the query that the given actor may have joined or left it. 
+        The cast calls this.
+
+        Args:
+            actor: Actor, The actor.
+        """
+        self._pending.add(actor)
+
+    def on_actors_changed(self, actors):
+        """Tells the query that the given actors may have joined or left it, 
+        all at once. The cast calls this.
+
+        Args:
+            actors: Iterable[Actor], The actors.
+        """
+        self._pending.update(actors)
+
+    def on_frame(self):
+        """Tells the query that a frame is over. The cast calls this at the 
+        end of apply_changes."""
+        self._refresh()
+        self._last_added, self._added = self._added, self._last_added
+        self._last_removed, self._removed = self._removed, self._last_removed
+        self._added.clear()
+        self._removed.clear()
+
+    def _refresh(self):
+        """Works out which of the pending actors joined or left the query. 
+        The members are copied before the first change, since an iteration 
+        may still be walking the old list, and the cast's lock is held so 
+        that actions running at the same time don't work them out twice."""
+        if not self._pending:
+            return
+        with self._actors._lock:
+            if not self._pending:
+                return
+            current = self._actors._current_actors
+            types = self._types
+            positions = self._positions
+            members = self._members
+            is_copied = False
+            for actor in self._pending:
+                belongs = actor in current and actor.has_traits(*types)
+                position = positions.get(actor)
+                if belongs is (position is not None):
+                    continue
+                if not is_copied:
+                    members = self._members = list(members)
+                    is_copied = True
+                if belongs:
+                    positions[actor] = len(members)
+                    members.append(actor)
+                    if actor in self._removed:
+                        self._removed.discard(actor)
+                    else:
+                        self._added.add(actor)
+                else:
+                    last = members.pop()
+                    if last is not actor:
+                        members[position] = last
+                        positions[last] = position
+                    del positions[actor]
+                    if actor in self._added:
+                        self._added.discard(actor)
+                    else:
+                        self._removed.add(actor)
+            self._pending.clear()
@@ -0,0 +1,219 @@
+import struct
+from genie_core.cast import body_store
+from genie_core.cast.actor import Actor
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.cast.Sound import Sound
+
+MAGIC = b"GSNP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHHI")
+_LENGTH = struct.Struct("<H")
+_STORE = struct.Struct("<II")
+_TRAIT = struct.Struct("<HI")
+_PLAIN_BODY = struct.Struct("<B6d")
+_STORED_BODY = struct.Struct("<BHI")
+_IMAGE = struct.Struct("<ddi")
+_SOUND = struct.Struct("<di")
+
+# Trait names mapped to their (type, encode, decode)
+_codecs = {}
+
+
+def register_trait(type_, encode = None, decode = None):
+    """Makes a type of trait part of snapshots.
+
+    Args:
+        type_: Type[Trait], The type of trait.
+        encode: Callable[[Trait], bytes], Packs the fields of a trait, or
+            None for traits without fields.
+        decode: Callable[[memoryview], Trait], Makes a trait from what encode
+            packed, or None to call the type without arguments.
+    """
+    if encode is None:
+        encode = lambda trait: b""
+    if decode is None:
+        decode = lambda view: type_()
+    _codecs[_get_name(type_)] = (type_, encode, decode)
+
+
+def take_snapshot(actors):
+    """Packs the current actors and their traits into a flat buffer.
+
+    The buffer starts with a table of the trait types used, followed by the
+    columns of every BodyStore the bodies live in, copied straight from the
+    store's memory, and then every actor as a list of (type, fields)
+    entries. Bodies in a store are packed as their slot.
+
+    Args:
+        actors: Actors, The cast.
+
+    Returns:
+        bytearray: The snapshot.
+
+    Raises:
+        ValueError: If an actor has a type of trait that isn't registered.
+    """
+    types = {}
+    stores = {}
+    entries = bytearray()
+    pack_length = _LENGTH.pack
+    pack_trait = _TRAIT.pack
+    for actor in actors._current_actors:
+        traits = actor._traits
+        entries += pack_length(len(traits))
+        for type_, trait in traits.items():
+            codec = types.get(type_)
+            if codec is None:
+                codec = types[type_] = _get_encoder(type_, len(types), stores)
+            index, encode = codec
+            payload = encode(trait)
+            entries += pack_trait(index, len(payload))
+            entries += payload
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(types), len(stores),
+        len(actors._current_actors)))
+    for type_ in types:
+        name = _get_name(type_).encode("utf-8")
+        out += _LENGTH.pack(len(name))
+        out += name
+    for store in stores:
+        size = store._size
+        free = store._free
+        out += _STORE.pack(size, len(free))
+        out += struct.pack(f"<{len(free)}I", *free)
+        for column in store._data[:, :size]:
+            out += memoryview(column).cast("B")
+    out += entries
+    return out
+
+
+def restore_snapshot(data):
+    """Makes the actors in a snapshot. The actors, traits and stores are new
+    objects; nothing is shared with the cast the snapshot was taken from.
+
+    Args:
+        data: Buffer, A snapshot made by take_snapshot.
+
+    Returns:
+        List[Actor]: The actors, with their traits.
+
+    Raises:
+        ValueError: If the snapshot is invalid or uses a type of trait that
+            isn't registered.
+    """
+    view = memoryview(data)
+    magic, version, type_count, store_count, actor_count = \
+        _HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a snapshot of this version")
+    offset = _HEADER.size
+
+    codecs = []
+    for _ in range(type_count):
+        length, = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        name = bytes(view[offset:offset + length]).decode("utf-8")
+        offset += length
+        if name not in _codecs:
+            raise ValueError(f"{name} is not registered")
+        codecs.append(_codecs[name])
+
+    stores = []
+    for _ in range(store_count):
+        size, free_count = _STORE.unpack_from(view, offset)
+        offset += _STORE.size
+        free = list(struct.unpack_from(f"<{free_count}I", view, offset))
+        offset += 4 * free_count
+        columns = body_store.numpy.frombuffer(view, body_store.numpy.float64,
+            len(body_store.BodyStore.COLUMNS) * size, offset)
+        offset += columns.nbytes
+        store = body_store.BodyStore(size)
+        store._data[:, :size] = columns.reshape(-1, size)
+        store._size = size
+        store._free = free
+        stores.append(store)
+
+    restored = []
+    for _ in range(actor_count):
+        actor = Actor()
+        trait_count, = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        for _ in range(trait_count):
+            index, length = _TRAIT.unpack_from(view, offset)
+            offset += _TRAIT.size
+            payload = view[offset:offset + length]
+            offset += length
+            type_, _, decode = codecs[index]
+            if type_ is Body:
+                actor.add_trait(_decode_body(payload, stores))
+            else:
+                actor.add_trait(decode(payload))
+        restored.append(actor)
+    return restored
+
+
+def _get_encoder(type_, index, stores):
+    """Gets the index and encode function of a type of trait."""
+    if type_ is Body:
+        return (index, lambda body: _encode_body(body, stores))
+    name = _get_name(type_)
+    if name not in _codecs:
+        raise ValueError(f"{name} is not registered")
+    return (index, _codecs[name][1])
+
+
+def _get_name(type_):
+    return f"{type_.__module__}.{type_.__qualname__}"
+
+
+def _encode_body(body, stores):
+    """Packs a body as its values, or as its slot if it lives in a store."""
+    store = body._store
+    if store is None:
+        return _PLAIN_BODY.pack(0, body._x, body._y, body._vx, body._vy,
+            body._height, body._width)
+    index = stores.get(store)
+    if index is None:
+        index = stores[store] = len(stores)
+    return _STORED_BODY.pack(1, index, body._row)
+
+
+def _decode_body(view, stores):
+    """Makes a body from what _encode_body packed."""
+    if view[0] == 0:
+        return Body(*_PLAIN_BODY.unpack(view)[1:])
+    _, index, row = _STORED_BODY.unpack(view)
+    body = Body.__new__(Body)
+    body._actor = None
+    body._store = stores[index]
+    body._row = row
+    return body
+
+
+def _encode_image(image):
+    path = image.get_path().encode("utf-8")
+    return _IMAGE.pack(image.get_scale(), image.get_rotation(),
+        image.get_layer()) + path
+
+
+def _decode_image(view):
+    scale, rotation, layer = _IMAGE.unpack_from(view)
+    path = bytes(view[_IMAGE.size:]).decode("utf-8")
+    return Image(path, scale, rotation, layer)
+
+
+def _encode_sound(sound):
+    path = sound.get_path().encode("utf-8")
+    return _SOUND.pack(sound.get_volume(), sound.get_priority()) + path
+
+
+def _decode_sound(view):
+    volume, priority = _SOUND.unpack_from(view)
+    return Sound(bytes(view[_SOUND.size:]).decode("utf-8"), volume, priority)
+
+
+register_trait(Body)
+register_trait(Image, _encode_image, _decode_image)
+register_trait(Sound, _encode_sound, _decode_sound)
@@ -0,0 +1,103 @@
+from array import array
+
+
+class SparseSet:
+    """Traits of one type, packed together.
+
+    The responsibility of SparseSet is to store the traits of one type for 
+    every actor of a cast that has one, in dense lists with no gaps, while 
+    still finding the trait of a given actor in constant time. The sparse 
+    array maps an entity slot index to a position in the dense lists; 
+    removing swaps the last entry into the hole. Walking the dense lists 
+    touches only actors that have the trait.
+
+    Attributes:
+        _sparse: array, The dense position of every slot index, or -1.
+        _indices: List[int], The slot index of each dense entry.
+        _actors: List[Actor], The actor of each dense entry.
+        _values: List[Trait], The trait of each dense entry.
+    """
+
+    __slots__ = ("_sparse", "_indices", "_actors", "_values")
+
+    def __init__(self):
+        self._sparse = array("q")
+        self._indices = []
+        self._actors = []
+        self._values = []
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __contains__(self, index):
+        return index < len(self._sparse) and self._sparse[index] >= 0
+
+    def add(self, index : int, actor, value):
+        """Stores the trait of the actor in the given slot, replacing the one 
+        it had.
+
+        Args:
+            index: int, The slot index.
+            actor: Actor, The actor.
+            value: Trait, The trait.
+        """
+        sparse = self._sparse
+        if index >= len(sparse):
+            sparse.extend(array("q", [-1]) * (index + 1 - len(sparse)))
+        position = sparse[index]
+        if position >= 0:
+            self._actors[position] = actor
+            self._values[position] = value
+            return
+        sparse[index] = len(self._indices)
+        self._indices.append(index)
+        self._actors.append(actor)
+        self._values.append(value)
+
+    def remove(self, index : int):
+        """Drops the trait stored for the given slot, if there is one.
+
+        Args:
+            index: int, The slot index.
+        """
+        if index not in self:
+            return
+        sparse = self._sparse
+        position = sparse[index]
+        last = len(self._indices) - 1
+        if position != last:
+            moved = self._indices[last]
+            self._indices[position] = moved
+            self._actors[position] = self._actors[last]
+            self._values[position] = self._values[last]
+            sparse[moved] = position
+        self._indices.pop()
+        self._actors.pop()
+        self._values.pop()
+        sparse[index] = -1
+
+    def get(self, index : int, default = None):
+        """Gets the trait stored for the given slot.
+
+        Args:
+            index: int, The slot index.
+            default: object, What to return if there is none.
+
+        Returns:
+            Trait: The trait or the default.
+        """
+        if index not in self:
+            return default
+        return self._values[self._sparse[index]]
+
+    def get_indices(self):
+        """Gets the slot indices in dense order. Must not be modified."""
+        return self._indices
+
+    def get_actors(self):
+        """Gets the actors in dense order. Must not be modified."""
+        return self._actors
+
+    def get_values(self):
+        """Gets the traits in dense order. Must not be modified."""
+        return self._values
@@ -0,0 +1,200 @@
+import heapq
+import math
+from genie_core.cast.Body import Body
+
+
+class SpatialHash:
+    """A uniform grid of actors keyed by the position of their Body.
+
+    The responsibility of SpatialHash is to answer "which actors are near 
+    here" without looking at every actor. Each actor lives in the square cell 
+    its position falls in, so a query only visits the cells that overlap it.
+
+    Moves are applied lazily. Actors reported as moved are re-bucketed the 
+    next time a query runs, so an actor that moves many times in a frame is 
+    only re-bucketed once.
+
+    Attributes:
+        _cell_size: float, The width and height of a cell.
+        _cells: Dict[Tuple[int, int], Set[Actor]], The actors in each cell.
+        _cell_of: Dict[Actor, Tuple[int, int]], The cell each actor is in.
+        _moved: Set[Actor], The actors to re-bucket before the next query.
+        _is_stale: bool, Whether every actor needs re-bucketing.
+    """
+
+    def __init__(self, cell_size : float = 64):
+        """Initializes a new instance of SpatialHash.
+
+        Args:
+            cell_size: float, The width and height of a cell. Something close 
+                to the typical query radius works best.
+        """
+        self._cell_size = cell_size
+        self._cells = {}
+        self._cell_of = {}
+        self._moved = set()
+        self._is_stale = False
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def add_actor(self, actor):
+        """Starts tracking the given actor, which must have a Body.
+
+        Args:
+            actor: Actor, The actor to add.
+        """
+        if actor in self._cell_of:
+            return
+        cell = self._cell_at(*actor.get_trait(Body).get_position())
+        self._cell_of[actor] = cell
+        self._cells.setdefault(cell, set()).add(actor)
+
+    def remove_actor(self, actor):
+        """Stops tracking the given actor.
+
+        Args:
+            actor: Actor, The actor to remove.
+        """
+        cell = self._cell_of.pop(actor, None)
+        if cell is not None:
+            self._discard(cell, actor)
+        self._moved.discard(actor)
+
+    def mark_moved(self, actor):
+        """Records that the given actor's position changed.
+
+        Args:
+            actor: Actor, The actor that moved.
+        """
+        if actor in self._cell_of:
+            self._moved.add(actor)
+
+    def invalidate(self):
+        """Records that any actor might have moved, for example after a bulk 
+        update of a BodyStore."""
+        self._is_stale = True
+
+    def in_rect(self, left, top, right, bottom):
+        """Finds the actors whose position is inside the given rectangle, 
+        edges included.
+
+        Returns:
+            List[Actor]: The actors found.
+        """
+        self._sync()
+        found = []
+        for actor in self._visit(left, top, right, bottom):
+            x, y = actor.get_trait(Body).get_position()
+            if left <= x <= right and top <= y <= bottom:
+                found.append(actor)
+        return found
+
+    def in_radius(self, x, y, radius):
+        """Finds the actors whose position is within the given distance of 
+        the given point.
+
+        Returns:
+            List[Actor]: The actors found.
+        """
+        self._sync()
+        found = []
+        limit = radius * radius
+        for actor in self._visit(x - radius, y - radius, x + radius, 
+                y + radius):
+            ax, ay = actor.get_trait(Body).get_position()
+            if (ax - x) ** 2 + (ay - y) ** 2 <= limit:
+                found.append(actor)
+        return found
+
+    def nearest(self, x, y, k = 1):
+        """Finds the k actors closest to the given point. Searches rings of 
+        cells outward from the point and stops once no unvisited cell can 
+        hold anything closer than what was found. Falls back to checking 
+        every actor when the rings would visit more cells than are occupied.
+
+        Returns:
+            List[Actor]: Up to k actors, closest first.
+        """
+        self._sync()
+        k = min(k, len(self._cell_of))
+        if k <= 0:
+            return []
+        cx, cy = self._cell_at(x, y)
+        best = []
+        visited = 0
+        ring = 0
+        while True:
+            if len(best) == k:
+                # Anything in this ring or beyond is at least this far away
+                reach = (ring - 1) * self._cell_size
+                if reach > 0 and reach * reach > -best[0][0]:
+                    break
+            visited += max(1, 8 * ring)
+            if visited > len(self._cells):
+                best = []
+                self._push_nearest(best, k, x, y, self._cell_of)
+                break
+            for cell in self._ring(cx, cy, ring):
+                self._push_nearest(best, k, x, y, self._cells.get(cell, ()))
+            ring += 1
+        return [actor for _, _, actor in sorted(best, reverse=True)]
+
+    def _push_nearest(self, best, k, x, y, actors):
+        """Keeps the k actors closest to the point in the max-heap best."""
+        for actor in actors:
+            ax, ay = actor.get_trait(Body).get_position()
+            entry = (-((ax - x) ** 2 + (ay - y) ** 2), id(actor), actor)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+    def _cell_at(self, x, y):
+        size = self._cell_size
+        return (math.floor(x / size), math.floor(y / size))
+
+    def _discard(self, cell, actor):
+        members = self._cells[cell]
+        members.discard(actor)
+        if not members:
+            del self._cells[cell]
+
+    def _ring(self, cx, cy, ring):
+        """Yields the cells exactly the given number of cells away."""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for i in range(-ring, ring + 1):
+            yield (cx + i, cy - ring)
+            yield (cx + i, cy + ring)
+        for i in range(-ring + 1, ring):
+            yield (cx - ring, cy + i)
+            yield (cx + ring, cy + i)
+
+    def _sync(self):
+        """Re-buckets the actors that moved since the last query."""
+        moved = self._cell_of if self._is_stale else self._moved
+        for actor in moved:
+            cell = self._cell_at(*actor.get_trait(Body).get_position())
+            old_cell = self._cell_of[actor]
+            if cell != old_cell:
+                self._discard(old_cell, actor)
+                self._cell_of[actor] = cell
+                self._cells.setdefault(cell, set()).add(actor)
+        self._moved.clear()
+        self._is_stale = False
+
+    def _visit(self, left, top, right, bottom):
+        """Yields the actors in the cells overlapping the given rectangle."""
+        min_x, min_y = self._cell_at(left, top)
+        max_x, max_y = self._cell_at(right, bottom)
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            # Fewer occupied cells than cells in the rectangle
+            for (cx, cy), members in self._cells.items():
+                if min_x <= cx <= max_x and min_y <= cy <= max_y:
+                    yield from members
+            return
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                yield from self._cells.get((cx, cy), ())
@@ -4,6 +4,7 @@ Author(s): Matt Manley, Jacob Oliphant
 Version: 1.0
 Date: 27-01-2021
 """
+import copy
 from abc import ABC
 
 
@@ -21,4 +22,62 @@ class Trait(ABC):
     helps make the whole project more understandable. It also provides a place 
     to make changes in the future if we ever need it. 
     """
-    pass    
\ No newline at end of file
+    __slots__ = ()
+
+    def on_added(self, actor):
+        """Called after the trait is added to an actor. Traits that want to 
+        report changes to their values can remember the actor here and call 
+        its on_trait_changed method.
+
+        Args:
+            actor: Actor, The actor the trait was added to.
+        """
+        pass
+
+    def on_removed(self, actor):
+        """Called after the trait is removed from an actor.
+
+        Args:
+            actor: Actor, The actor the trait was removed from.
+        """
+        pass
+
+    def clone(self):
+        """Makes a copy of the trait that belongs to no actor, for spawning 
+        actors from a prototype. The default makes a shallow copy; traits 
+        that remember their actor or own resources override it.
+
+        Returns:
+            Trait: The copy.
+        """
+        return copy.copy(self)
+
+    def assign(self, other):
+        """Copies the values of another trait of the same type into this one, 
+        for reusing pooled actors. The default copies every slot declared 
+        along the class hierarchy and the instance dictionary, if there is 
+        one. Traits that remember their actor are bound again with on_added 
+        afterwards, so copying the other trait's actor is harmless.
+
+        Args:
+            other: Trait, The trait to copy.
+        """
+        for cls in type(other).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if name.startswith("__") and not name.endswith("__"):
+                    name = f"_{cls.__name__.lstrip('_')}{name}"
+                try:
+                    value = getattr(other, name)
+                except AttributeError:
+                    if hasattr(self, name):
+                        delattr(self, name)
+                else:
+                    setattr(self, name, value)
+        if hasattr(other, "__dict__"):
+            self.__dict__.clear()
+            self.__dict__.update(other.__dict__)
@@ -10,6 +10,9 @@ from .script.action import Action
 from .script.actions import Actions
 from .script.input_action import InputAction
 from .script.output_action import OutputAction
+from .script.profiler import Profiler
+from .script.scene_loader import SceneLoader
+from .script.scheduler import Scheduler
 from .script.update_action import UpdateAction
 
 
@@ -24,15 +27,45 @@ class Director(Action.Callback):
     Attributes:
         _clock: Clock, The animation clock.
         _is_directing: boolm Whether or not it is currently directing a scene.
+        _profiler: Profiler, Times each action and phase, or None.
+        _scheduler: Scheduler, Runs update actions concurrently, or None.
+        _input_services: List[object], The services whose input snapshots 
+            are updated at the start of each frame.
+        _next_scene: Tuple[Actors, Actions], The scene to transition to at 
+            the end of the frame, or None.
+        _loader: SceneLoader, The next scene being built, or None.
+        _update_limit: int, The clock's update count at which run_for stops 
+            cueing updates, or None.
     """
 
-    def __init__(self):
+    def __init__(self, profile : bool = False, clock : Clock = None, 
+                    scheduler : Scheduler = None,
+                    input_services : list = None):
         """Initializes a new instance of Director.
+
+        Args:
+            profile: bool, Whether to time every action and phase. The timings 
+                are available from Clock.get_stats().
+            clock: Clock, The clock to pace the animation with. Pass a Clock 
+                with a target_fps to stop the loop from using a whole core.
+            scheduler: Scheduler, Runs the update actions that declare 
+                non-conflicting reads and writes concurrently, or None to run 
+                them one after the other.
+            input_services: List[object], Services such as KeyBoardService 
+                and MouseService to update once at the start of each frame, 
+                before any input action runs.
         """
         self._actions = Actions()
         self._actors = Actors()
-        self._clock = Clock()
+        self._clock = clock if clock is not None else Clock()
         self._is_directing = True
+        self._profiler = None
+        self._scheduler = scheduler
+        self._input_services = list(input_services or [])
+        self._next_scene = None
+        self._loader = None
+        self._update_limit = None
+        self.set_profiling(profile)
         
     def direct_scene(self, actors, actions):
         """Starts the animation loop for the given scene. Cues input, update 
@@ -49,41 +82,135 @@ class Director(Action.Callback):
             self._do_inputs()
             self._do_updates()
             self._do_outputs()
+            self._clock.wait()
+
+    def run_for(self, actors, actions, updates, outputs : bool = True):
+        """Runs the animation loop for the given scene until the given number 
+        of updates have been cued. Paired with a VirtualClock this simulates 
+        the scene deterministically and as fast as possible. When a frame 
+        owes more updates than are left, the frame only runs those left.
+
+        Args:
+            actors: Actors, The cast to direct.
+            actions: Actions, The script to use.
+            updates: int, The number of updates to run.
+            outputs: bool, Whether to cue the output actions.
+
+        Returns:
+            int: The number of updates that ran, which is less than asked for 
+            if an action stopped the animation.
+        """
+        start = self._clock.get_updates()
+        end = start + updates
+        self._update_limit = end
+        try:
+            self.run_until(actors, actions, 
+                lambda actors, actions, clock: clock.get_updates() >= end, 
+                outputs)
+        finally:
+            self._update_limit = None
+        return self._clock.get_updates() - start
+
+    def run_until(self, actors, actions, predicate, outputs : bool = True):
+        """Runs the animation loop for the given scene until the given 
+        predicate is true or an action stops the animation. The predicate is 
+        checked before every frame.
+
+        Args:
+            actors: Actors, The cast to direct.
+            actions: Actions, The script to use.
+            predicate: Callable[[Actors, Actions, Clock], bool], Whether to 
+                stop.
+            outputs: bool, Whether to cue the output actions.
+
+        Returns:
+            int: The number of updates that ran.
+        """
+        start = self._clock.get_updates()
+        self._actors = actors
+        self._actions = actions
+        self._is_directing = True
+        while (self._is_directing 
+                and not predicate(self._actors, self._actions, self._clock)):
+            self._do_inputs()
+            self._do_updates()
+            if outputs:
+                self._do_outputs()
+            else:
+                self._apply_changes()
+            self._clock.wait()
+        return self._clock.get_updates() - start
     
+    def set_profiling(self, profile : bool):
+        """Turns the timing of actions and phases on or off.
+
+        Args:
+            profile: bool, Whether to time every action and phase.
+        """
+        self._profiler = Profiler() if profile else None
+        self._clock.set_profiler(self._profiler)
+
     def on_stop(self):
         """This Action.Callback override signals the animation to end."""
         self._is_directing = False
 
     def on_next(self, actors, actions):
         """This Action.Callback override transitions the current scene to the 
-        next one.
+        next one. The transition happens at the end of the frame, after the 
+        current cast and script have applied their changes, so every action 
+        of the frame sees the same scene.
 
         Args:
             cast: Cast, The cast for the next scene.
             script: Script, The script for the next scene.
         """
-        # todo: we should exit the directing loop and then make these changes,
-        # restarting the loop again after - need to think about this a bit
-        self._actors = actors
-        self._actions = actions
+        self._next_scene = (actors, actions)
+
+    def on_load(self, build):
+        """This Action.Callback override starts building the next scene on a 
+        background thread. The current scene keeps running and can follow 
+        the progress through the returned loader; the transition happens at 
+        the end of the first frame after the build is over. Starting another 
+        load replaces the one in progress, whose scene is then ignored.
+
+        Args:
+            build: Callable[[SceneLoader], Tuple[Actors, Actions]], Builds 
+                the next scene, see SceneLoader.
+
+        Returns:
+            SceneLoader: The loader.
+        """
+        self._loader = SceneLoader(build)
+        self._loader.start()
+        return self._loader
         
     def _do_inputs(self):
         """Cues the input actions for the given cast and script. This method 
         also ticks the animation clock forward since it is the beginning of the 
-        animation frame.
+        animation frame, and takes this frame's snapshot of the input 
+        services.
         """
         self._clock.tick()
-        for action in self._actions.get_actions(InputAction):
-            action.execute(self._actors, self._actions, self._clock, self)
+        for service in self._input_services:
+            service.update()
+        self._cue(Profiler.INPUT, self._actions.get_actions(InputAction))
 
     def _do_updates(self):
         """Cues the update actions for the given cast and script. This method 
         will execute the actions over and over until the animation time has 
-        caught up with the real time.
+        caught up with the real time, the clock's limit of updates per frame 
+        is reached or run_for has run as many updates as it was asked for.
         """
+        limit = self._update_limit
         while self._clock.is_lagging():
-            for action in self._actions.get_actions(UpdateAction):
-                action.execute(self._actors, self._actions, self._clock, self)
+            if limit is not None and self._clock.get_updates() >= limit:
+                break
+            actions = self._actions.get_actions(UpdateAction)
+            if self._scheduler is not None:
+                self._scheduler.execute(actions, self._actors, self._actions, 
+                    self._clock, self, self._profiler)
+            else:
+                self._cue(Profiler.UPDATE, actions)
             self._clock.catch_up()
     
     def _do_outputs(self):
@@ -91,7 +218,33 @@ class Director(Action.Callback):
         also clean's the cast of any removed actors since it is the end of the 
         animation frame.
         """
-        for action in self._actions.get_actions(OutputAction):
-            action.execute(self._actors, self._actions, self._clock, self)
+        self._cue(Profiler.OUTPUT, self._actions.get_actions(OutputAction))
+        self._apply_changes()
+
+    def _apply_changes(self):
+        """Cleans the cast and script of anything removed during the frame 
+        and then transitions to the next scene, if there is one."""
         self._actors.apply_changes()
-        self._actions.apply_changes()
\ No newline at end of file
+        self._actions.apply_changes()
+        if self._loader is not None and self._loader.is_done():
+            loader = self._loader
+            self._loader = None
+            self._next_scene = loader.get_scene()
+        if self._next_scene is not None:
+            self._actors, self._actions = self._next_scene
+            self._next_scene = None
+
+    def _cue(self, phase, actions):
+        """Executes the given actions in order, timing them if profiling is 
+        on.
+
+        Args:
+            phase: str, The phase the actions belong to.
+            actions: List[Action], The actions to execute.
+        """
+        if self._profiler is not None:
+            self._profiler.execute(phase, actions, self._actors, self._actions, 
+                self._clock, self)
+            return
+        for action in actions:
+            action.execute(self._actors, self._actions, self._clock, self)
\ No newline at end of file
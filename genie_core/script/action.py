@@ -6,6 +6,7 @@ Date: 27-01-2021
 """
 from abc import ABC
 from abc import abstractmethod
+from genie_core.script.scene_loader import SceneLoader
 
 
 class Action(ABC):
@@ -19,7 +20,20 @@ class Action(ABC):
 
     Attributes:
         _type: str, An action type, or one of INPUT, UPDATE or OUTPUT.
+        _priority: int, The order in which the action runs within its type.
+        _observers: Tuple[Action.Observer], The objects watching the action.
     """           
+
+    __slots__ = ("_priority", "_observers", "__weakref__")
+
+    READS = None
+    """Iterable[Type[Trait]]: The types of trait the action reads, or None 
+    if it hasn't declared them. Used to decide which actions may run at the 
+    same time."""
+
+    WRITES = None
+    """Iterable[Type[Trait]]: The types of trait the action changes, or None 
+    if it hasn't declared them."""
         
     class Callback(ABC):
         """An action callback.
@@ -45,8 +59,66 @@ class Action(ABC):
             or has finished."""
             pass
 
+        def on_load(self, build):
+            """This method should be called to build the next scene in the 
+            background while the current one keeps running. The scene is 
+            transitioned to once it is built.
+
+            Callbacks that can't build in the background needn't override 
+            this method: by default the scene is built right away, on the 
+            calling thread, and passed to on_next.
+
+            Args:
+                build: Callable[[SceneLoader], Tuple[Actors, Actions]], 
+                    Builds the next scene, see SceneLoader.
+
+            Returns:
+                SceneLoader: The loader, to follow the progress with.
+            """
+            loader = SceneLoader(build)
+            loader.run()
+            self.on_next(*loader.get_scene())
+            return loader
+
+    class Observer(ABC):
+        """An action observer.
+
+        The responsibility of Observer is to provide a means for an action to 
+        let interested objects, like the script it belongs to, know that its 
+        priority has changed.
+        """
+
+        @abstractmethod
+        def on_priority_changed(self, action):
+            """This method is called after the action's priority changes.
+
+            Args:
+                action: Action, The action that changed.
+            """
+            pass
+
     def __init__(self, priority):
         self._priority = priority
+        self._observers = ()
+
+    def add_observer(self, observer):
+        """Starts notifying the given observer of priority changes.
+
+        Args:
+            observer: Action.Observer, The observer to add.
+        """
+        if observer not in self._observers:
+            self._observers += (observer,)
+
+    def remove_observer(self, observer):
+        """Stops notifying the given observer of priority changes.
+
+        Args:
+            observer: Action.Observer, The observer to remove.
+        """
+        if observer in self._observers:
+            self._observers = tuple(
+                o for o in self._observers if o is not observer)
         
     @abstractmethod
     def execute(self, actors, actions, clock, callback):
@@ -62,8 +134,28 @@ class Action(ABC):
         """
         pass
 
+    def get_reads(self):
+        """Gets the types of trait the action reads.
+
+        Returns:
+            FrozenSet[Type[Trait]]: The types or None if undeclared.
+        """
+        return None if self.READS is None else frozenset(self.READS)
+
+    def get_writes(self):
+        """Gets the types of trait the action changes.
+
+        Returns:
+            FrozenSet[Type[Trait]]: The types or None if undeclared.
+        """
+        return None if self.WRITES is None else frozenset(self.WRITES)
+
     def get_priority(self):
         return self._priority
 
     def set_priority(self, priority):
-        self._priority = priority
\ No newline at end of file
+        if priority == self._priority:
+            return
+        self._priority = priority
+        for observer in self._observers:
+            observer.on_priority_changed(self)
\ No newline at end of file
@@ -4,25 +4,32 @@ Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
 Version: 1.0
 Date: 27-01-2021
 """
+from genie_core.script.action import Action
 from genie_core.script.input_action import InputAction
 from genie_core.script.output_action import OutputAction
 from genie_core.script.update_action import UpdateAction
 
 
-class Actions:
+class Actions(Action.Observer):
     """A collection of actions.
 
     The responsibility of Actions is to keep track of them. It provides methods 
     for adding, removing and finding them in a variety of ways.
     
     Attributes:
-        _actions: Dict[str, List[Action]]), The actions in the script.
+        _current_actions: Set[Action], The actions in the script.
+        _removed_actions: Set[Action], The actions to remove at the end of the 
+            frame.
+        _actions_by_type: Dict[type, List[Action]], The actions of each type 
+            that has been asked for, sorted by priority. Cleared whenever the 
+            script or a priority changes.
     """
 
     def __init__(self):
         """Initializes a new instance of Script."""
         self._current_actions = set()
         self._removed_actions = set()
+        self._actions_by_type = {}
         
     def add_action(self, action):
         """Add the given action to the script.
@@ -30,11 +37,21 @@ class Actions:
         Args:
             action: Action, The action to add.
         """
+        if action in self._current_actions:
+            return
         self._current_actions.add(action)
+        action.add_observer(self)
+        self._actions_by_type.clear()
         
     def apply_changes(self):
         """Permantely removes all of the dead actors."""
-        self._current_actions -= self._removed_actions
+        if not self._removed_actions:
+            return
+        for action in self._removed_actions:
+            if action in self._current_actions:
+                self._current_actions.discard(action)
+                action.remove_observer(self)
+                self._actions_by_type.clear()
         self._removed_actions.clear()
 
     def remove_action(self, action):
@@ -46,7 +63,8 @@ class Actions:
         self._removed_actions.add(action)
  
     def get_actions(self, type_):
-        """Gets the actions with the given type.
+        """Gets the actions with the given type. The returned list is shared 
+        between calls until the script changes so callers must not modify it.
         
         Args:
             type_: base type, The actions's type (InputAction, OutputAction, UpdateAction, etc...).
@@ -54,5 +72,19 @@ class Actions:
         Returns:
             List[Action]: A list of actions.
         """
-        return sorted([a for a in self._current_actions if isinstance(a, type_)],
-            key=lambda x: x.get_priority())
\ No newline at end of file
+        actions = self._actions_by_type.get(type_)
+        if actions is None:
+            actions = sorted(
+                [a for a in self._current_actions if isinstance(a, type_)],
+                key=lambda x: x.get_priority())
+            self._actions_by_type[type_] = actions
+        return actions
+
+    def on_priority_changed(self, action):
+        """This Action.Observer override re-sorts the actions the next time 
+        they are asked for.
+
+        Args:
+            action: Action, The action that changed.
+        """
+        self._actions_by_type.clear()
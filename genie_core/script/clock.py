@@ -22,28 +22,93 @@ class Clock:
         _seconds (float): A running total of seconds.
         _updates (float): A running total of updates.
         _ups (float): The number of updates that happen every second.
+        _stats (dict): The running totals and, when profiling, the timings.
+        _profiler (Profiler): The profiler timing the frames, or None.
+        _frame_time (float): The shortest a frame may be, or 0 to run as fast 
+            as possible.
+        _max_updates (int): The most updates to catch up on per frame, or None.
+        _drop_lag (bool): Whether to forget the lag that couldn't be caught up 
+            on in a frame instead of carrying it over.
+        _frame_updates (int): The number of updates so far this frame.
+        _dropped (float): A running total of seconds of lag forgotten.
     """
 
+    __slots__ = ("_lag", "_previous", "_frames", "_seconds", "_updates", 
+        "_stats", "_profiler", "_frame_time", "_max_updates", "_drop_lag", 
+        "_frame_updates", "_dropped")
+
     TIME_STEP = 1/60
     """float: The fixed frame rate (about 16 ms)."""
 
+    MAX_UPDATES = 5
+    """int: The default limit of updates per frame."""
+
+    SPIN_TIME = 0.002
+    """float: How long before the end of a frame wait() stops sleeping and 
+    only yields, since sleep can overshoot by about a millisecond."""
+
+
+    def __init__(self, target_fps : float = None, 
+                    max_updates : int = MAX_UPDATES,
+                    drop_lag : bool = True):
+        """Initializes a new instance of Clock.
 
-    def __init__(self):
-        """Initializes a new instance of Clock."""
+        Args:
+            target_fps: float, The frame rate wait() paces frames to, or None 
+                to run frames as fast as possible.
+            max_updates: int, The most updates to catch up on per frame, or 
+                None for no limit. Limiting them keeps one slow frame from 
+                making the next one slower still.
+            drop_lag: bool, Whether to forget the lag that is left when the 
+                limit is hit, letting the animation run slower than real time, 
+                or to carry it over to the next frames.
+        """
         self._lag = 0.0
-        self._previous = time.time()
+        self._previous = time.perf_counter()
         self._frames = 0
         self._seconds = 0.0
         self._updates = 0
         self._stats = {}
+        self._profiler = None
+        self._frame_time = 1 / target_fps if target_fps else 0
+        self._max_updates = max_updates
+        self._drop_lag = drop_lag
+        self._frame_updates = 0
+        self._dropped = 0.0
         
     def catch_up(self):
         """Catches animation time up by one fixed time step. This method should be called once at the end of each frame's update phase.
         """
         self._lag -= self.TIME_STEP
         self._updates += 1
+        self._frame_updates += 1
+
+    def get_frames(self):
+        """Gets the number of frames so far.
+
+        Returns:
+            int: The running total of frames.
+        """
+        return self._frames
+
+    def get_updates(self):
+        """Gets the number of updates so far.
+
+        Returns:
+            int: The running total of updates.
+        """
+        return self._updates
 
     def get_stats(self):
+        """Gets the running totals of frames, updates, seconds and seconds of 
+        lag dropped. When a profiler is set, the stats also include its 
+        "phases" and "actions" timings.
+
+        Returns:
+            dict: The stats.
+        """
+        if self._profiler is not None:
+            self._stats.update(self._profiler.get_stats())
         return self._stats
 
     def is_lagging(self):
@@ -54,16 +119,75 @@ class Clock:
             bool: True if lag is greater than the fixed time step; false if 
             otherwise.
         """
-        return self._lag >= self.TIME_STEP
+        if self._lag < self.TIME_STEP:
+            return False
+        if (self._max_updates is not None 
+                and self._frame_updates >= self._max_updates):
+            if self._drop_lag:
+                dropped = self._lag - self._lag % self.TIME_STEP
+                self._lag -= dropped
+                self._dropped += dropped
+            return False
+        return True
+
+    def set_profiler(self, profiler):
+        """Sets the profiler that frame times are reported to and whose 
+        timings get_stats includes.
+
+        Args:
+            profiler: Profiler, The profiler or None to stop profiling.
+        """
+        self._profiler = profiler
+        self._stats = {}
 
     def tick(self):
         """Marks the real world time so that we are able to measure lag. This 
         should be called once at the beginning of each frame.
         """
-        current: float = time.time()
+        current: float = time.perf_counter()
         elapsed: float = current - self._previous
         self._previous = current
         self._lag += elapsed
         self._frames += 1
-        # self._calc_stats(elapsed)
+        self._frame_updates = 0
+        self._calc_stats(elapsed)
+
+    def get_wait_time(self):
+        """Gets what is left of the frame when a target frame rate is set, 
+        for loops that wait on their own, such as an asyncio event loop.
+
+        Returns:
+            float: The seconds left, or 0 if the frame is over or there is no 
+            target frame rate.
+        """
+        if not self._frame_time:
+            return 0
+        return max(0, self._previous + self._frame_time - time.perf_counter())
+
+    def wait(self):
+        """Sleeps away whatever is left of the frame when a target frame rate 
+        is set. This should be called once at the end of each frame.
+        """
+        if not self._frame_time:
+            return
+        end = self._previous + self._frame_time
+        remaining = end - time.perf_counter()
+        if remaining > self.SPIN_TIME:
+            time.sleep(remaining - self.SPIN_TIME)
+        while time.perf_counter() < end:
+            time.sleep(0)
+
+    def _calc_stats(self, elapsed):
+        """Updates the running totals with the last frame.
+
+        Args:
+            elapsed: float, The length of the last frame in seconds.
+        """
+        self._seconds += elapsed
+        self._stats["frames"] = self._frames
+        self._stats["updates"] = self._updates
+        self._stats["seconds"] = self._seconds
+        self._stats["dropped"] = self._dropped
+        if self._profiler is not None:
+            self._profiler.record(self._profiler.FRAME, elapsed)
         
@@ -0,0 +1,114 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import math
+import time
+from collections import deque
+
+
+class Profiler:
+    """Measures how long actions take.
+
+    The responsibility of Profiler is to time every action a director cues 
+    and every phase of the frame, and to summarize those times as call counts 
+    and rolling percentiles. Recording only appends to a bounded deque; 
+    sorting for the percentiles happens when the stats are asked for, so the 
+    profiler is cheap enough to leave on.
+
+    Attributes:
+        _window: int, The number of most recent samples kept per key.
+        _samples: Dict[object, Deque[float]], The recent times in seconds, 
+            keyed by phase name or action.
+        _counts: Dict[object, int], The total number of samples per key.
+    """
+
+    FRAME = "frame"
+    INPUT = "input"
+    UPDATE = "update"
+    OUTPUT = "output"
+    PHASES = (FRAME, INPUT, UPDATE, OUTPUT)
+    """Tuple[str]: The keys used for phases."""
+
+    def __init__(self, window : int = 600):
+        """Initializes a new instance of Profiler.
+
+        Args:
+            window: int, The number of most recent samples to compute the 
+                percentiles from, per phase and per action.
+        """
+        self._window = window
+        self._samples = {}
+        self._counts = {}
+
+    def record(self, key, seconds):
+        """Adds a sample.
+
+        Args:
+            key: object, A phase name or an action.
+            seconds: float, The time it took.
+        """
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._window)
+            self._counts[key] = 0
+        samples.append(seconds)
+        self._counts[key] += 1
+
+    def execute(self, phase, actions, actors, script, clock, callback):
+        """Executes the given actions in order, timing each of them and the 
+        phase as a whole.
+
+        Args:
+            phase: str, One of INPUT, UPDATE or OUTPUT.
+            actions: List[Action], The actions to execute.
+            actors: Actors, The cast to pass on.
+            script: Actions, The script to pass on.
+            clock: Clock, The clock to pass on.
+            callback: Action.Callback, The callback to pass on.
+        """
+        perf_counter = time.perf_counter
+        record = self.record
+        start = perf_counter()
+        for action in actions:
+            before = perf_counter()
+            action.execute(actors, script, clock, callback)
+            record(action, perf_counter() - before)
+        record(phase, perf_counter() - start)
+
+    def get_stats(self):
+        """Summarizes the samples. Times are in seconds.
+
+        Returns:
+            Dict[str, Dict]: {"phases": {name: summary}, "actions": {action: 
+            summary}}, where each summary is a dict with the keys "count", 
+            "p50", "p95", "p99" and "max".
+        """
+        phases = {}
+        actions = {}
+        for key, samples in self._samples.items():
+            summary = self._summarize(samples, self._counts[key])
+            if isinstance(key, str):
+                phases[key] = summary
+            else:
+                actions[key] = summary
+        return {"phases": phases, "actions": actions}
+
+    def reset(self):
+        """Discards every sample."""
+        self._samples.clear()
+        self._counts.clear()
+
+    def _summarize(self, samples, count):
+        """Computes the nearest-rank percentiles of the given samples."""
+        ordered = sorted(samples)
+        size = len(ordered)
+        return {
+            "count": count,
+            "p50": ordered[math.ceil(size * 0.50) - 1],
+            "p95": ordered[math.ceil(size * 0.95) - 1],
+            "p99": ordered[math.ceil(size * 0.99) - 1],
+            "max": ordered[-1]
+        }
@@ -0,0 +1,114 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import threading
+
+
+class SceneLoader:
+    """A scene being built in the background.
+
+    The responsibility of SceneLoader is to run the function that builds the 
+    next scene, and preloads its assets, on a background thread so that the 
+    current scene keeps running meanwhile. The build function is given the 
+    loader and can report how far along it is with set_progress, which the 
+    running scene can show with get_progress.
+
+    The build function runs alongside the current scene, so it should only 
+    touch the objects it creates, and caches that are shared with the 
+    current scene should only be preloaded into, never cleared. LruCache, 
+    and the caches built on it, lock around every call, so preloading into 
+    them from the build function is safe.
+
+    Attributes:
+        _build: Callable[[SceneLoader], Tuple[Actors, Actions]], Builds the 
+            scene.
+        _progress: float, How much of the scene is built, from 0 to 1.
+        _scene: Tuple[Actors, Actions], The built scene, or None.
+        _error: BaseException, What the build function raised, or None.
+        _done: threading.Event, Set once the build function has returned.
+        _thread: threading.Thread, The thread running the build function.
+    """
+
+    def __init__(self, build):
+        """Initializes a new instance of SceneLoader.
+
+        Args:
+            build: Callable[[SceneLoader], Tuple[Actors, Actions]], Builds 
+                the scene, reporting its progress to the given loader, and 
+                returns its cast and script.
+        """
+        self._build = build
+        self._progress = 0.0
+        self._scene = None
+        self._error = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        """Starts building the scene on a background thread."""
+        self._thread.start()
+
+    def get_progress(self):
+        """Gets how much of the scene is built.
+
+        Returns:
+            float: The progress, from 0 to 1.
+        """
+        return self._progress
+
+    def set_progress(self, progress : float):
+        """Reports how much of the scene is built. The build function calls 
+        this as it goes.
+
+        Args:
+            progress: float, The progress, from 0 to 1.
+        """
+        self._progress = min(max(progress, 0.0), 1.0)
+
+    def is_done(self):
+        """Whether the build function has returned or raised.
+
+        Returns:
+            bool: True if the build is over; false if otherwise.
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout : float = None):
+        """Waits for the build to be over.
+
+        Args:
+            timeout: float, The most seconds to wait, or None to wait as 
+                long as it takes.
+
+        Returns:
+            bool: True if the build is over; false if it timed out.
+        """
+        return self._done.wait(timeout)
+
+    def get_scene(self):
+        """Gets the built scene.
+
+        Returns:
+            Tuple[Actors, Actions]: The cast and script, or None if the 
+            build isn't over.
+
+        Raises:
+            BaseException: Whatever the build function raised.
+        """
+        if self._error is not None:
+            raise self._error
+        return self._scene
+
+    def run(self):
+        """Runs the build function on the calling thread and keeps what it 
+        returns or raises. start calls this on a background thread."""
+        try:
+            self._scene = self._build(self)
+            self._progress = 1.0
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._done.set()
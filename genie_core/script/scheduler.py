@@ -0,0 +1,137 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Scheduler:
+    """Runs actions that don't interfere with each other at the same time.
+
+    The responsibility of Scheduler is to execute a priority-ordered list of 
+    actions on a thread pool. Two actions conflict when one of them writes a 
+    type of trait the other reads or writes, or when either hasn't declared 
+    its reads and writes. Each action is put in the first stage after every 
+    conflicting action that comes before it, so conflicting actions keep 
+    their priority order while the actions within a stage run concurrently.
+
+    Adding and removing actors, spawning them, searching the cast with 
+    in_rect, in_radius or nearest and using a query are safe from actions 
+    that share a stage: the cast holds a lock while its actors or its lazy 
+    indexes change.
+
+    The stages are worked out once and reused for as long as the script hands 
+    back the same list, that is until the script changes.
+
+    Threads only help actions that release the interpreter lock, for example 
+    by working on NumPy arrays or waiting on I/O.
+
+    Attributes:
+        _max_workers: int, The size of the thread pool.
+        _executor: ThreadPoolExecutor, The pool, created on first use.
+        _source: List[Action], The list the stages were built from.
+        _stages: List[List[Action]], The actions grouped into stages.
+    """
+
+    def __init__(self, max_workers : int = None):
+        """Initializes a new instance of Scheduler.
+
+        Args:
+            max_workers: int, The size of the thread pool. Defaults to the 
+                ThreadPoolExecutor default.
+        """
+        self._max_workers = max_workers
+        self._executor = None
+        self._source = None
+        self._stages = []
+
+    def get_stages(self, actions):
+        """Gets the given actions grouped into stages.
+
+        Args:
+            actions: List[Action], The actions in priority order.
+
+        Returns:
+            List[List[Action]]: The stages, in the order they run.
+        """
+        if actions is not self._source:
+            self._stages = self._build_stages(actions)
+            self._source = actions
+        return self._stages
+
+    def execute(self, actions, actors, script, clock, callback, 
+            profiler = None):
+        """Executes the given actions stage by stage, and the actions of each 
+        stage concurrently. An exception raised by an action is raised again 
+        once its stage has finished.
+
+        Args:
+            actions: List[Action], The actions in priority order.
+            actors: Actors, The cast to pass on.
+            script: Actions, The script to pass on.
+            clock: Clock, The clock to pass on.
+            callback: Action.Callback, The callback to pass on.
+            profiler: Profiler, Times each action and the whole phase, or 
+                None.
+
+        Raises:
+            TypeError: If an action's execute method is a coroutine.
+        """
+        start = time.perf_counter()
+        for stage in self.get_stages(actions):
+            if len(stage) == 1:
+                self._run(stage[0], actors, script, clock, callback, profiler)
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers)
+            futures = [self._executor.submit(self._run, action, actors, 
+                script, clock, callback, profiler) for action in stage]
+            for future in futures:
+                future.result()
+        if profiler is not None:
+            profiler.record(profiler.UPDATE, time.perf_counter() - start)
+
+    def shutdown(self):
+        """Stops the thread pool. It is started again when needed."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _build_stages(self, actions):
+        """Puts each action in the stage after the last one holding an 
+        action it conflicts with."""
+        stages = []
+        placed = []
+        for action in actions:
+            stage = 0
+            for other, other_stage in placed:
+                if other_stage >= stage and self._conflict(action, other):
+                    stage = other_stage + 1
+            if stage == len(stages):
+                stages.append([])
+            stages[stage].append(action)
+            placed.append((action, stage))
+        return stages
+
+    def _conflict(self, action, other):
+        """Whether the two actions may not run at the same time."""
+        reads, writes = action.get_reads(), action.get_writes()
+        other_reads, other_writes = other.get_reads(), other.get_writes()
+        if None in (reads, writes, other_reads, other_writes):
+            return True
+        return bool(writes & (other_reads | other_writes) 
+            or other_writes & reads)
+
+    def _run(self, action, actors, script, clock, callback, profiler):
+        before = time.perf_counter()
+        result = action.execute(actors, script, clock, callback)
+        if profiler is not None:
+            profiler.record(action, time.perf_counter() - before)
+        if asyncio.iscoroutine(result):
+            result.close()
+            raise TypeError(f"{type(action).__name__}.execute is a coroutine; "
+                "the Scheduler can't run coroutine actions")
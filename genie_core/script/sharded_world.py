@@ -0,0 +1,223 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from genie_core.cast import body_store
+from genie_core.cast.body_store import BodyStore
+from genie_core.script.update_action import UpdateAction
+
+
+def move_bodies(data, rows, time_step):
+    """A kernel that moves the given bodies by their velocity.
+
+    Args:
+        data: numpy.ndarray, The (6, capacity) columns of the shared store.
+        rows: numpy.ndarray, The slots the shard owns.
+        time_step: float, The length of the update in seconds.
+    """
+    data[BodyStore.X, rows] += data[BodyStore.VX, rows]
+    data[BodyStore.Y, rows] += data[BodyStore.VY, rows]
+
+
+def _work(name, capacity, shard, kernels, connection):
+    """The loop each worker process runs. Waits for a step, runs the kernels 
+    over the slots its shard owns and reports how many there were."""
+    numpy = body_store.numpy
+    memory = SharedMemory(name=name)
+    try:
+        data, owners = ShardedWorld._views(memory, capacity)
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            size, time_step = message
+            rows = numpy.flatnonzero(owners[:size] == shard)
+            for kernel in kernels:
+                kernel(data, rows, time_step)
+            connection.send(len(rows))
+        del data, owners
+    finally:
+        memory.close()
+
+
+class ShardedWorld:
+    """Bodies simulated by several processes at once.
+
+    The responsibility of ShardedWorld is to split the bodies of a BodyStore 
+    into vertical strips, one per worker process, and have every worker run 
+    the update kernels over its own strip. The store's columns and the owner 
+    of each slot live in shared memory, so nothing is copied between 
+    processes: the parent's Body views see the workers' changes directly. 
+    After every step the parent re-assigns the bodies that crossed a strip 
+    border to their new shard.
+
+    Kernels are functions taking (data, rows, time_step) that update the 
+    given slots of the columns in place. They run in other processes, so 
+    they must be importable module-level functions and can only use the 
+    store's columns, not the Actor objects of the parent. A kernel may read 
+    slots owned by other shards, but those may be mid-update.
+
+    Attributes:
+        _capacity: int, The number of bodies the shared store holds.
+        _left: float, The left edge of the first strip.
+        _width: float, The width of each strip.
+        _shards: int, The number of strips and workers.
+        _memory: SharedMemory, The columns followed by the slot owners.
+        _store: BodyStore, The store over the shared columns.
+        _owners: numpy.ndarray, The shard each slot belongs to, or -1.
+        _connections: List[Connection], The pipes to the workers.
+        _processes: List[Process], The workers.
+        _migrations: int, A running total of bodies that changed shards.
+    """
+
+    def __init__(self, capacity, kernels, shards = None, bounds = (0, 1)):
+        """Initializes a new instance of ShardedWorld and starts its workers.
+
+        Args:
+            capacity: int, The most bodies the world can hold.
+            kernels: List[Callable], The functions to run on every step, in 
+                order.
+            shards: int, The number of workers. Defaults to the CPU count.
+            bounds: Tuple[float, float], The left and right edges of the 
+                area split into strips. Bodies outside it belong to the 
+                first or last strip.
+        """
+        if body_store.numpy is None:
+            raise ImportError("ShardedWorld requires numpy to be installed")
+        self._capacity = capacity
+        self._shards = shards or multiprocessing.cpu_count()
+        self._left = bounds[0]
+        self._width = (bounds[1] - bounds[0]) / self._shards
+        data_size = len(BodyStore.COLUMNS) * capacity * 8
+        self._memory = SharedMemory(create=True, size=data_size + capacity * 4)
+        data, self._owners = self._views(self._memory, capacity)
+        self._owners[:] = -1
+        self._store = BodyStore(capacity, buffer=self._memory.buf)
+        self._migrations = 0
+        self._connections = []
+        self._processes = []
+        for shard in range(self._shards):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_work, daemon=True, 
+                args=(self._memory.name, capacity, shard, kernels, child))
+            process.start()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get_store(self):
+        """Gets the store to create the world's bodies with.
+
+        Returns:
+            BodyStore: The shared store.
+        """
+        return self._store
+
+    def get_migrations(self):
+        """Gets the number of times a body moved to another shard.
+
+        Returns:
+            int: The running total.
+        """
+        return self._migrations
+
+    def get_shard_sizes(self):
+        """Gets the number of bodies each shard owns.
+
+        Returns:
+            List[int]: The sizes, by shard.
+        """
+        self._assign()
+        numpy = body_store.numpy
+        owners = self._owners[:len(self._store.get_data()[0])]
+        return numpy.bincount(owners[owners >= 0], 
+            minlength=self._shards).tolist()
+
+    def step(self, time_step):
+        """Runs the kernels once on every shard in parallel and waits for 
+        them, then moves the bodies that crossed a border to their new shard.
+
+        Args:
+            time_step: float, The length of the update in seconds.
+        """
+        self._assign()
+        size = self._store.get_data().shape[1]
+        for connection in self._connections:
+            connection.send((size, time_step))
+        for connection in self._connections:
+            connection.recv()
+        self._assign()
+
+    def close(self):
+        """Stops the workers and frees the shared memory. The store and its 
+        bodies keep working in this process on a private copy of the 
+        columns."""
+        if self._memory is None:
+            return
+        for connection in self._connections:
+            connection.send(None)
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+        self._owners = None
+        self._store.unshare()
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+    def _assign(self):
+        """Gives every slot in use to the shard its position falls in."""
+        numpy = body_store.numpy
+        data = self._store.get_data()
+        size = data.shape[1]
+        shard = (data[BodyStore.X] - self._left) // self._width
+        shard = numpy.clip(shard, 0, self._shards - 1).astype(numpy.int32)
+        shard[self._store.get_free_slots()] = -1
+        owners = self._owners[:size]
+        moved = (owners != shard) & (owners >= 0) & (shard >= 0)
+        self._migrations += int(numpy.count_nonzero(moved))
+        owners[:] = shard
+
+    @staticmethod
+    def _views(memory, capacity):
+        """Gets the columns and the owners over the given shared memory."""
+        numpy = body_store.numpy
+        columns = len(BodyStore.COLUMNS)
+        data = numpy.ndarray((columns, capacity), dtype=numpy.float64, 
+            buffer=memory.buf)
+        owners = numpy.ndarray((capacity,), dtype=numpy.int32, 
+            buffer=memory.buf, offset=columns * capacity * 8)
+        return data, owners
+
+
+class ShardedUpdateAction(UpdateAction):
+    """An update action that steps a ShardedWorld.
+
+    The responsibility of ShardedUpdateAction is to let the director drive 
+    the sharded simulation with its fixed time step, in priority order with 
+    the other update actions.
+    """
+
+    def __init__(self, priority, world):
+        """Initializes a new instance of ShardedUpdateAction.
+
+        Args:
+            priority: int, The order in which the action runs.
+            world: ShardedWorld, The world to step.
+        """
+        super().__init__(priority)
+        self._world = world
+
+    def execute(self, actors, actions, clock, callback):
+        self._world.step(clock.TIME_STEP)
+        actors.invalidate_positions([self._world.get_store()])
@@ -0,0 +1,62 @@
+"""
+Copyright 2021, BYU-Idaho.
+Author(s): Matt Manley, Jacob Oliphant, Jeremy Duong
+Version: 1.0
+Date: 27-01-2021
+"""
+from genie_core.script.clock import Clock
+
+
+class VirtualClock(Clock):
+    """An animation clock that ignores the real world.
+
+    The responsibility of VirtualClock is to let a director run the fixed-step 
+    update loop as fast as the CPU allows and with the same result every time. 
+    Each frame simply owes a fixed number of updates; lag is counted in whole 
+    time steps so no floating point drift can skip or add an update.
+
+    Attributes:
+        _updates_per_frame (int): The number of updates each tick adds.
+        _pending (int): The number of updates owed this frame.
+    """
+
+    __slots__ = ("_updates_per_frame", "_pending")
+
+    def __init__(self, updates_per_frame : int = 1):
+        """Initializes a new instance of VirtualClock.
+
+        Args:
+            updates_per_frame: int, The number of updates to run per frame. 
+                Raising it runs fewer input and output phases per update.
+        """
+        super().__init__(max_updates=None)
+        self._updates_per_frame = updates_per_frame
+        self._pending = 0
+
+    def catch_up(self):
+        """Catches animation time up by one fixed time step."""
+        self._pending -= 1
+        self._lag = self._pending * self.TIME_STEP
+        self._updates += 1
+        self._frame_updates += 1
+
+    def is_lagging(self):
+        """Whether or not updates are still owed this frame.
+
+        Returns:
+            bool: True if updates are owed; false if otherwise.
+        """
+        return self._pending > 0
+
+    def tick(self):
+        """Starts a frame that owes updates_per_frame updates."""
+        elapsed = self._updates_per_frame * self.TIME_STEP
+        self._pending += self._updates_per_frame
+        self._lag = self._pending * self.TIME_STEP
+        self._frames += 1
+        self._frame_updates = 0
+        self._calc_stats(elapsed)
+
+    def wait(self):
+        """Returns immediately since virtual frames have no length."""
+        pass
@@ -1,4 +1,214 @@
+from genie_core.assets.lru_cache import LruCache
+from genie_core.cast.actor import Actor
+from genie_core.cast.Sound import Sound
+from genie_core.services.NullAudioDevice import NullAudioDevice
+
+class AudioService(Actor.Observer):
+    """Plays the sounds actors ask for.
+
+    The responsibility of AudioService is to turn the Sound traits triggered 
+    each frame into voices on an output device without stalling the frame. 
+    Clips are decoded once, ahead of time with preload or on first use, and 
+    kept in a cache under a memory budget. Triggers of the same clip within a 
+    frame are played once, at the loudest volume and highest priority asked 
+    for. The device has a fixed number of voices; when they are all busy a 
+    new sound takes the voice of the lowest priority sound, the oldest one 
+    among equals, as long as that priority is no higher than its own. 
+    Otherwise the new sound is dropped.
+
+    The service watches every actor with a Sound and queues each sound as 
+    it is played, so a sound played after play_sounds has run in a frame is 
+    heard at the next call instead of being lost.
+
+    Decoding depends on the audio backend, so the loader is given to the 
+    service; it must return the decoded samples as a bytes-like object.
+
+    Attributes:
+        _loader: Callable[[str], bytes], Decodes the clip at a path.
+        _device: object, The output device, see NullAudioDevice.
+        _cache: LruCache, The decoded clips keyed by path.
+        _actors: Actors, The cast being watched.
+        _query: Query, The actors of the cast with a Sound.
+        _frame: int, The cast's frame at the last call to play_sounds.
+        _queue: Dict[Sound, None], The sounds played since the last call to 
+            play_sounds, in order.
+        _voices: List[Tuple[int, int, str]], The (priority, start, path) of 
+            the sound last started on each voice, or None.
+        _starts: int, A running total of sounds started.
+        _dropped: int, A running total of sounds dropped.
+        _stolen: int, A running total of voices stolen.
+        _coalesced: int, A running total of triggers merged with another.
+    """
+
+    def __init__(self, loader, device = None, 
+                    voices : int = 16,
+                    budget : int = 32 * 1024 * 1024):
+        """Initializes a new instance of AudioService.
+
+        Args:
+            loader: Callable[[str], bytes], Decodes the clip at a path.
+            device: object, The output device, or None for a NullAudioDevice.
+            voices: int, The number of sounds that can play at once.
+            budget: int, The most bytes the decoded clips may take.
+        """
+        self._loader = loader
+        self._device = device if device is not None else NullAudioDevice()
+        self._cache = LruCache(budget, len)
+        self._actors = None
+        self._query = None
+        self._frame = None
+        self._queue = {}
+        self._voices = [None] * voices
+        self._starts = 0
+        self._dropped = 0
+        self._stolen = 0
+        self._coalesced = 0
 
-class AudioService:
     def play_sounds(self, actors):
-        pass
\ No newline at end of file
+        """Plays the sounds triggered this frame. This should be called once 
+        per frame in the output phase, before the cast applies its changes.
+
+        Args:
+            actors: Actors, The cast.
+        """
+        self._watch(actors)
+        queue = self._queue
+        self._queue = {}
+        requests = {}
+        for sound in queue:
+            if not sound.is_triggered():
+                continue
+            sound.reset()
+            path = sound.get_path()
+            request = requests.get(path)
+            if request is None:
+                requests[path] = [sound.get_priority(), sound.get_volume()]
+            else:
+                request[0] = max(request[0], sound.get_priority())
+                request[1] = max(request[1], sound.get_volume())
+                self._coalesced += 1
+        ordered = sorted(requests.items(), key=lambda item: -item[1][0])
+        for path, (priority, volume) in ordered:
+            self.play(path, volume, priority)
+
+    def play(self, path : str, volume : float = 1, priority : int = 0):
+        """Plays the clip at the given path on a free or stolen voice.
+
+        Args:
+            path: str, The path of the sound file.
+            volume: float, The volume.
+            priority: int, The priority.
+
+        Returns:
+            int: The voice the clip is playing on, or None if it was dropped.
+        """
+        voice = self._find_voice(priority)
+        if voice is None:
+            self._dropped += 1
+            return None
+        self._device.play(voice, self._load(path), volume)
+        self._voices[voice] = (priority, self._starts, path)
+        self._starts += 1
+        return voice
+
+    def preload(self, *paths):
+        """Decodes the clips at the given paths ahead of their first use.
+
+        Args:
+            paths: Tuple[str], The paths of the sound files.
+        """
+        for path in paths:
+            self._load(path)
+
+    def stop_all(self):
+        """Stops every voice."""
+        for voice in range(len(self._voices)):
+            self._device.stop(voice)
+            self._voices[voice] = None
+
+    def get_stats(self):
+        """Gets the cache and voice counters.
+
+        Returns:
+            dict: The cache's "hits", "misses", "evictions", "entries" and 
+            "bytes", and the "started", "dropped", "stolen" and "coalesced" 
+            sounds.
+        """
+        stats = self._cache.get_stats()
+        stats["started"] = self._starts
+        stats["dropped"] = self._dropped
+        stats["stolen"] = self._stolen
+        stats["coalesced"] = self._coalesced
+        return stats
+
+    def on_trait_added(self, actor, trait):
+        """This Actor.Observer override queues a sound added already played.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait that was added.
+        """
+        self.on_trait_changed(actor, trait)
+
+    def on_trait_removed(self, actor, trait):
+        """This Actor.Observer override forgets a sound removed unheard.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait that was removed.
+        """
+        self._queue.pop(trait, None)
+
+    def on_trait_changed(self, actor, trait):
+        """This Actor.Observer override queues the sound that was played.
+
+        Args:
+            actor: Actor, The actor that changed.
+            trait: Trait, The trait whose values changed.
+        """
+        if type(trait) is Sound and trait.is_triggered():
+            self._queue[trait] = None
+
+    def _watch(self, actors):
+        """Starts watching the actors with a Sound that joined the cast since 
+        the last call, queueing those already played, and stops watching 
+        those that left."""
+        frame = actors.get_frame()
+        if actors is not self._actors or frame > self._frame + 1:
+            if actors is not self._actors:
+                self._queue = {}
+            self._actors = actors
+            self._query = actors.query(Sound)
+            joined = list(self._query)
+        else:
+            # Joined after the last call in the previous frame, or this frame
+            for actor in self._query.get_removed():
+                actor.remove_observer(self)
+            joined = list(self._query.get_added())
+            joined.extend(self._query.get_joined())
+        self._frame = frame
+        for actor in joined:
+            actor.add_observer(self)
+            self.on_trait_changed(actor, actor.get_trait(Sound))
+
+    def _find_voice(self, priority):
+        """Gets a free voice or the one to steal, or None if there is none."""
+        victim = None
+        for voice, playing in enumerate(self._voices):
+            if playing is None or not self._device.is_busy(voice):
+                return voice
+            if victim is None or playing[:2] < self._voices[victim][:2]:
+                victim = voice
+        if victim is None or self._voices[victim][0] > priority:
+            return None
+        self._device.stop(victim)
+        self._stolen += 1
+        return victim
+
+    def _load(self, path):
+        """Gets the decoded clip at the given path, decoding it if needed."""
+        samples = self._cache.get(path)
+        if samples is None:
+            samples = self._loader(path)
+            self._cache.put(path, samples)
+        return samples
@@ -0,0 +1,95 @@
+class InputSnapshot:
+    """The state of an input device for one frame.
+
+    The responsibility of InputSnapshot is to answer questions about the 
+    input during a frame without asking the device, however often they are 
+    asked. Keys and buttons are small non-negative integer codes and each set 
+    of them is an integer bitset, so every lookup is a mask test. A snapshot 
+    never changes once it is made; the services make a new one each frame.
+
+    Keys are held while they are down, pressed in the frame they went down 
+    and released in the frame they came up. A key that goes down and up 
+    within one frame is both pressed and released but not held.
+
+    Attributes:
+        _held: int, The bitset of keys down at the end of the frame.
+        _pressed: int, The bitset of keys that went down during the frame.
+        _released: int, The bitset of keys that came up during the frame.
+        _position: Tuple[float, float], The pointer position, if any.
+        _motion: Tuple[float, float], How far the pointer moved during the 
+            frame.
+    """
+
+    __slots__ = ("_held", "_pressed", "_released", "_position", "_motion")
+
+    def __init__(self, held : int = 0, pressed : int = 0, released : int = 0,
+                    position = (0, 0), motion = (0, 0)):
+        self._held = held
+        self._pressed = pressed
+        self._released = released
+        self._position = position
+        self._motion = motion
+
+    def is_held(self, *codes):
+        """Whether any of the given keys is down."""
+        return bool(self._held & self._get_mask(codes))
+
+    def is_pressed(self, *codes):
+        """Whether any of the given keys went down this frame."""
+        return bool(self._pressed & self._get_mask(codes))
+
+    def is_released(self, *codes):
+        """Whether any of the given keys came up this frame."""
+        return bool(self._released & self._get_mask(codes))
+
+    def get_held(self):
+        return self._held
+
+    def get_pressed(self):
+        return self._pressed
+
+    def get_released(self):
+        return self._released
+
+    def get_position(self):
+        return self._position
+
+    def get_motion(self):
+        return self._motion
+
+    def next(self, events, position = None):
+        """Makes the snapshot of the following frame.
+
+        Args:
+            events: Iterable[Tuple[int, bool]], The (code, is_down) events 
+                that happened during the frame, oldest first.
+            position: Tuple[float, float], The pointer position at the end 
+                of the frame, or None if it didn't move.
+
+        Returns:
+            InputSnapshot: The new snapshot.
+        """
+        held = self._held
+        pressed = 0
+        released = 0
+        for code, is_down in events:
+            bit = 1 << code
+            if is_down:
+                if not held & bit:
+                    pressed |= bit
+                held |= bit
+            else:
+                if held & bit:
+                    released |= bit
+                held &= ~bit
+        if position is None:
+            position = self._position
+        motion = (position[0] - self._position[0], 
+            position[1] - self._position[1])
+        return InputSnapshot(held, pressed, released, position, motion)
+
+    def _get_mask(self, codes):
+        mask = 0
+        for code in codes:
+            mask |= 1 << code
+        return mask
@@ -1,10 +1,68 @@
+from collections import deque
+from genie_core.services.InputSnapshot import InputSnapshot
 
 class KeyBoardService():
-    def __init__(self):
+    """The keyboard.
+
+    The responsibility of KeyBoardService is to answer questions about the 
+    keyboard from a snapshot taken once per frame, so input actions can ask 
+    as often as they like without going to the backend. Backends report key 
+    events with push_key, from any thread, into a ring buffer, or override 
+    poll to pull them when update is called. The Director calls update at 
+    the start of each frame's input phase.
+
+    Keys are small non-negative integer codes; backends map their own key 
+    constants to them. When more events arrive in a frame than the buffer 
+    holds, the oldest are dropped.
+
+    Attributes:
+        _events: deque, The (key, is_down) events not yet in a snapshot.
+        _snapshot: InputSnapshot, The keyboard state this frame.
+    """
+
+    def __init__(self, capacity : int = 256):
+        """Initializes a new instance of KeyBoardService.
+
+        Args:
+            capacity: int, The most events buffered between frames.
+        """
+        self._events = deque(maxlen=capacity)
+        self._snapshot = InputSnapshot()
+
+    def push_key(self, key : int, is_down : bool):
+        """Records that a key went down or came up.
+
+        Args:
+            key: int, The key code.
+            is_down: bool, True if the key went down; false if it came up.
+        """
+        self._events.append((key, is_down))
+
+    def poll(self):
+        """Pulls pending events from the backend. Backends that don't push 
+        their events override this method."""
         pass
 
+    def update(self):
+        """Drains the buffered events into this frame's snapshot."""
+        self.poll()
+        events = self._events
+        drained = []
+        while events:
+            drained.append(events.popleft())
+        self._snapshot = self._snapshot.next(drained)
+
+    def get_snapshot(self):
+        return self._snapshot
+
     def is_key_pressed(self, *keys):
-        pass
+        """Whether any of the given keys went down this frame."""
+        return self._snapshot.is_pressed(*keys)
+
+    def is_key_released(self, *keys):
+        """Whether any of the given keys came up this frame."""
+        return self._snapshot.is_released(*keys)
 
-    def is_key_released(self, *key):
-        pass
\ No newline at end of file
+    def is_key_held(self, *keys):
+        """Whether any of the given keys is down."""
+        return self._snapshot.is_held(*keys)
@@ -1,19 +1,92 @@
+from collections import deque
+from genie_core.services.InputSnapshot import InputSnapshot
 
 class MouseService:
-    def __init__(self):
+    """The mouse.
+
+    The responsibility of MouseService is to answer questions about the 
+    mouse from a snapshot taken once per frame. Backends report button 
+    events with push_button into a ring buffer and pointer positions with 
+    push_motion, from any thread, or override poll to pull them when update 
+    is called. Motion is not buffered: only the latest position is kept, so 
+    however many motion events arrive in a frame they add up to one delta.
+
+    Attributes:
+        _events: deque, The (button, is_down) events not yet in a snapshot.
+        _position: Tuple[float, float], The latest pointer position reported.
+        _snapshot: InputSnapshot, The mouse state this frame.
+    """
+
+    def __init__(self, capacity : int = 64):
+        """Initializes a new instance of MouseService.
+
+        Args:
+            capacity: int, The most button events buffered between frames.
+        """
+        self._events = deque(maxlen=capacity)
+        self._position = (0, 0)
+        self._snapshot = InputSnapshot()
+
+    def push_button(self, button : int, is_down : bool):
+        """Records that a button went down or came up.
+
+        Args:
+            button: int, The button code.
+            is_down: bool, True if the button went down; false if it came up.
+        """
+        self._events.append((button, is_down))
+
+    def push_motion(self, x : float, y : float):
+        """Records that the pointer moved.
+
+        Args:
+            x: float, The new x position.
+            y: float, The new y position.
+        """
+        self._position = (x, y)
+
+    def poll(self):
+        """Pulls pending events from the backend. Backends that don't push 
+        their events override this method."""
         pass
 
+    def update(self):
+        """Drains the buffered events into this frame's snapshot."""
+        self.poll()
+        events = self._events
+        drained = []
+        while events:
+            drained.append(events.popleft())
+        self._snapshot = self._snapshot.next(drained, self._position)
+
+    def get_snapshot(self):
+        return self._snapshot
+
     def is_button_pressed(self, *buttons):
-        pass
+        """Whether any of the given buttons went down this frame."""
+        return self._snapshot.is_pressed(*buttons)
 
     def is_button_released(self, *buttons):
-        pass
+        """Whether any of the given buttons came up this frame."""
+        return self._snapshot.is_released(*buttons)
 
-    def has_mouse_moved(self, x, y, dx, dy):
-        pass
+    def is_button_held(self, *buttons):
+        """Whether any of the given buttons is down."""
+        return self._snapshot.is_held(*buttons)
+
+    def has_mouse_moved(self):
+        """Whether the pointer moved this frame."""
+        return self._snapshot.get_motion() != (0, 0)
+
+    def get_motion(self):
+        """Gets how far the pointer moved this frame as (dx, dy)."""
+        return self._snapshot.get_motion()
 
     def get_current_coordinates(self):
-        pass
+        return self._snapshot.get_position()
 
     def get_last_coordinates(self):
-        pass
\ No newline at end of file
+        """Gets the pointer position at the end of the previous frame."""
+        x, y = self._snapshot.get_position()
+        dx, dy = self._snapshot.get_motion()
+        return (x - dx, y - dy)
@@ -1,3 +1,389 @@
+import select
+import struct
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+
+# Fields of a synced actor, in the order of the bits of an entry's mask
+_X, _Y, _VX, _VY, _HEIGHT, _WIDTH, _PATH, _SCALE, _ROTATION, _LAYER = range(10)
+_FIELDS = 10
+_ALL_FIELDS = (1 << _FIELDS) - 1
+_REMOVED = 1 << 15
+
+_HEADER = struct.Struct("<IIHH")
+_ENTRY = struct.Struct("<IH")
+_INT = struct.Struct("<i")
+_LENGTH = struct.Struct("<H")
+_ACK = struct.Struct("<I")
+_INT_MIN = -2 ** 31
+_INT_MAX = 2 ** 31 - 1
+
+_EMPTY = (0, 0, 0, 0, 0, 0, "", 0, 0, 0)
 
 class NetworkService:
-    pass
\ No newline at end of file
+    """Keeps the cast in sync across the network.
+
+    The responsibility of NetworkService is to send the Body and Image
+    fields of a server's cast to its clients, and to rebuild them on the
+    clients, using as little bandwidth and time as it can. One service can
+    play either role over a UDP socket.
+
+    A server gives every synced actor an id and sends, once per frame, a
+    state numbered with a sequence number. Each state is a delta against
+    the last state the client acknowledged: only the actors, and only the
+    fields, that changed since then are sent, so both the bandwidth and the
+    server's time grow with what changed rather than with the size of the
+    cast. Floats are sent as 32 bit integers in steps of precision, so they
+    must stay within about 21 million at the default precision, and changes
+    smaller than a step are not sent at all. All the entries of a
+    frame are packed into as few datagrams as fit max_datagram bytes,
+    usually one. When a client's acknowledged state is too old, or it has
+    none yet, it is sent everything.
+
+    The server finds what changed from the cast's changed and removed 
+    actors of this frame and of the previous one, so changes made after the 
+    last send, by later output actions, go out with the next one. When it 
+    sends less often than once a frame it notices the frames it missed and 
+    compares every actor against what it last sent instead.
+
+    A client puts the parts of each state together, applies them to the
+    state they are based on, acknowledges the result and makes it available
+    from get_state. States that arrive late are ignored.
+
+    Attributes:
+        _socket: socket, The non-blocking UDP socket.
+        _precision: float, The step floats are rounded to.
+        _max_datagram: int, The most bytes sent in one datagram.
+        _history: int, The most states kept to base deltas on.
+        _sequence: int, The number of the last state sent or received.
+        _actors: Actors, The cast last sent.
+        _frame: int, The cast's frame when a state was last sent.
+        _ids: Dict[Actor, int], The id of every synced actor.
+        _next_id: int, The id the next synced actor gets.
+        _records: Dict[int, tuple], The quantized fields last sent per id.
+        _changes: Dict[int, Dict[int, int]], Per sequence number, the mask
+            of fields that changed for each id.
+        _clients: Dict[tuple, int], The last state each client acknowledged.
+        _states: Dict[int, Dict[int, tuple]], Per sequence number, the
+            states a client has put together.
+        _parts: Dict[int, tuple], The parts of states still incomplete.
+        _stats: dict, The running totals of what was sent and received.
+    """
+
+    def __init__(self, socket, precision : float = 0.01,
+                    max_datagram : int = 1200,
+                    history : int = 32):
+        """Initializes a new instance of NetworkService.
+
+        Args:
+            socket: socket, A bound UDP socket. It is made non-blocking.
+            precision: float, The step floats are rounded to.
+            max_datagram: int, The most bytes sent in one datagram.
+            history: int, The most states kept to base deltas on.
+        """
+        socket.setblocking(False)
+        self._socket = socket
+        self._precision = precision
+        self._max_datagram = max_datagram
+        self._history = history
+        self._sequence = 0
+        self._actors = None
+        self._frame = None
+        self._ids = {}
+        self._next_id = 1
+        self._records = {}
+        self._changes = {}
+        self._clients = {}
+        self._states = {0: {}}
+        self._parts = {}
+        self._stats = {"datagrams": 0, "bytes": 0, "entries": 0, "acks": 0}
+
+    def add_client(self, address):
+        """Starts sending states to the given address.
+
+        Args:
+            address: tuple, The client's socket address.
+        """
+        self._clients[address] = 0
+
+    def remove_client(self, address):
+        """Stops sending states to the given address.
+
+        Args:
+            address: tuple, The client's socket address.
+        """
+        self._clients.pop(address, None)
+
+    def get_id(self, actor):
+        """Gets the id the given actor is synced under, or None.
+
+        Args:
+            actor: Actor, The actor.
+
+        Returns:
+            int: The id.
+        """
+        return self._ids.get(actor)
+
+    def send_state(self, actors):
+        """Sends this frame's state to every client. This should be called
+        once per frame, or once per network tick, in the output phase before 
+        the cast applies its changes. Changes made later in the frame are 
+        sent with the next state.
+
+        Args:
+            actors: Actors, The cast.
+
+        Raises:
+            ValueError: If a field is too large to send at this precision.
+        """
+        self._receive_acks()
+        self._sequence += 1
+        changes = {}
+        frame = actors.get_frame()
+        removed = set(actors.get_removed_actors())
+        if actors is not self._actors or frame > self._frame + 1:
+            # A new cast, or frames were missed: compare everything
+            if actors is not self._actors:
+                self._actors = actors
+                removed.update(self._ids)
+            else:
+                removed.update(a for a in self._ids 
+                    if actors.get_id(a) is None)
+            changed = actors.with_traits()
+        elif frame == self._frame + 1:
+            # Also pick up what changed after the last send
+            changed = actors.get_last_changed_actors() \
+                | actors.get_changed_actors()
+            removed.update(a for a in actors.get_last_removed_actors() 
+                if actors.get_id(a) is None)
+        else:
+            changed = actors.get_changed_actors()
+        self._frame = frame
+        for actor in removed:
+            self._update(actor, None, changes)
+        leaving = actors.get_removed_actors()
+        for actor in changed:
+            if actor not in leaving and actors.get_id(actor) is not None:
+                self._update(actor, self._get_record(actor), changes)
+        self._changes[self._sequence] = changes
+        self._changes.pop(self._sequence - self._history, None)
+        for address, acked in self._clients.items():
+            self._send(address, acked)
+
+    def receive_state(self, timeout : float = 0):
+        """Receives and acknowledges the states the server sent.
+
+        Args:
+            timeout: float, How long to wait for a datagram if none has
+                arrived yet, in seconds.
+
+        Returns:
+            bool: True if a newer state was put together; false if otherwise.
+        """
+        sequence = self._sequence
+        if timeout:
+            select.select([self._socket], [], [], timeout)
+        for data, address in self._drain():
+            self._receive_part(data, address)
+        return self._sequence != sequence
+
+    def get_state(self):
+        """Gets the last state put together by a client.
+
+        Returns:
+            Dict[int, tuple]: The (x, y, vx, vy, height, width, path, scale,
+            rotation, layer) of every synced actor, by id.
+        """
+        step = self._precision
+        state = {}
+        for id_, record in self._states[self._sequence].items():
+            values = list(record)
+            for field in (_X, _Y, _VX, _VY, _HEIGHT, _WIDTH, _SCALE, 
+                    _ROTATION):
+                values[field] *= step
+            state[id_] = tuple(values)
+        return state
+
+    def get_stats(self):
+        """Gets the running totals of "datagrams" and "bytes" sent,
+        "entries" sent and "acks" received.
+
+        Returns:
+            dict: The stats.
+        """
+        return self._stats
+
+    def _get_record(self, actor):
+        """Gets the quantized fields of the given actor, or None if it has
+        nothing to sync."""
+        body = actor.get_trait(Body)
+        image = actor.get_trait(Image)
+        if body is None and image is None:
+            return None
+        quantize = self._quantize
+        record = list(_EMPTY)
+        if body is not None:
+            x, y = body.get_position()
+            record[_X] = quantize(x)
+            record[_Y] = quantize(y)
+            record[_VX] = quantize(body.get_vx())
+            record[_VY] = quantize(body.get_vy())
+            record[_HEIGHT] = quantize(body.get_height())
+            record[_WIDTH] = quantize(body.get_width())
+        if image is not None:
+            record[_PATH] = image.get_path()
+            record[_SCALE] = quantize(image.get_scale())
+            record[_ROTATION] = quantize(image.get_rotation())
+            record[_LAYER] = quantize(image.get_layer(), 1)
+        return tuple(record)
+
+    def _quantize(self, value, step = None):
+        """Rounds a value to a whole number of steps that fits 32 bits."""
+        steps = round(value / (step or self._precision))
+        if not _INT_MIN <= steps <= _INT_MAX:
+            raise ValueError(f"{value} is too large to send in steps of "
+                f"{step or self._precision}")
+        return steps
+
+    def _update(self, actor, record, changes):
+        """Records the new fields of the given actor, or that it is gone."""
+        id_ = self._ids.get(actor)
+        if record is None:
+            if id_ is not None:
+                del self._ids[actor]
+                del self._records[id_]
+                changes[id_] = _REMOVED
+            return
+        if id_ is None:
+            id_ = self._next_id
+            self._next_id += 1
+            self._ids[actor] = id_
+            previous = None
+        else:
+            previous = self._records[id_]
+        self._records[id_] = record
+        if previous is None:
+            mask = _ALL_FIELDS
+        else:
+            mask = 0
+            for field in range(_FIELDS):
+                if record[field] != previous[field]:
+                    mask |= 1 << field
+        if mask:
+            changes[id_] = changes.get(id_, 0) | mask
+
+    def _send(self, address, acked):
+        """Sends the delta between the acknowledged and the current state."""
+        if self._sequence - acked >= self._history:
+            acked = 0
+        masks = {}
+        if acked == 0:
+            masks = dict.fromkeys(self._records, _ALL_FIELDS)
+        else:
+            for sequence in range(acked + 1, self._sequence + 1):
+                for id_, mask in self._changes[sequence].items():
+                    masks[id_] = masks.get(id_, 0) | mask
+        entries = [self._encode(id_, mask) for id_, mask in masks.items()]
+        datagrams = []
+        payload = []
+        size = _HEADER.size
+        for entry in entries:
+            if payload and size + len(entry) > self._max_datagram:
+                datagrams.append(payload)
+                payload = []
+                size = _HEADER.size
+            payload.append(entry)
+            size += len(entry)
+        datagrams.append(payload)
+        for part, payload in enumerate(datagrams):
+            header = _HEADER.pack(self._sequence, acked, part, len(datagrams))
+            data = header + b"".join(payload)
+            self._socket.sendto(data, address)
+            self._stats["datagrams"] += 1
+            self._stats["bytes"] += len(data)
+        self._stats["entries"] += len(entries)
+
+    def _encode(self, id_, mask):
+        """Packs the changed fields of one actor."""
+        record = self._records.get(id_)
+        if record is None:
+            return _ENTRY.pack(id_, _REMOVED)
+        chunks = [_ENTRY.pack(id_, mask)]
+        for field in range(_FIELDS):
+            if not mask & (1 << field):
+                continue
+            if field == _PATH:
+                path = record[_PATH].encode("utf-8")
+                chunks.append(_LENGTH.pack(len(path)))
+                chunks.append(path)
+            else:
+                chunks.append(_INT.pack(record[field]))
+        return b"".join(chunks)
+
+    def _receive_acks(self):
+        """Notes the newest state each client acknowledged."""
+        for data, address in self._drain():
+            if address not in self._clients or len(data) != _ACK.size:
+                continue
+            sequence, = _ACK.unpack(data)
+            if sequence > self._clients[address]:
+                self._clients[address] = sequence
+            self._stats["acks"] += 1
+
+    def _receive_part(self, data, address):
+        """Puts a state together from its parts and applies it once it is
+        complete."""
+        if len(data) < _HEADER.size:
+            return
+        sequence, base, part, count = _HEADER.unpack_from(data)
+        if sequence <= self._sequence:
+            return
+        _, _, received = self._parts.setdefault(sequence, (base, count, {}))
+        received[part] = data
+        if len(received) < count:
+            return
+        del self._parts[sequence]
+        if base not in self._states:
+            return
+        state = dict(self._states[base])
+        for part in range(count):
+            self._apply(received[part], state)
+        self._sequence = sequence
+        self._states[sequence] = state
+        for old in [s for s in self._states 
+                if 0 < s <= sequence - self._history]:
+            del self._states[old]
+        for old in [s for s in self._parts if s <= sequence]:
+            del self._parts[old]
+        self._socket.sendto(_ACK.pack(sequence), address)
+
+    def _apply(self, data, state):
+        """Applies the entries of one datagram to the given state."""
+        offset = _HEADER.size
+        while offset < len(data):
+            id_, mask = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            if mask & _REMOVED:
+                state.pop(id_, None)
+                continue
+            record = list(state.get(id_, _EMPTY))
+            for field in range(_FIELDS):
+                if not mask & (1 << field):
+                    continue
+                if field == _PATH:
+                    length, = _LENGTH.unpack_from(data, offset)
+                    offset += _LENGTH.size
+                    record[_PATH] = data[offset:offset + length].decode("utf-8")
+                    offset += length
+                else:
+                    record[field], = _INT.unpack_from(data, offset)
+                    offset += _INT.size
+            state[id_] = tuple(record)
+
+    def _drain(self):
+        """Reads every datagram waiting on the socket."""
+        while True:
+            try:
+                yield self._socket.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
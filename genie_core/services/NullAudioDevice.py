@@ -0,0 +1,76 @@
+import time
+from collections import deque
+
+class NullAudioDevice:
+    """An audio device that plays nothing.
+
+    The responsibility of NullAudioDevice is to stand in for a real output 
+    device in tests and headless runs. It keeps the same books a real device 
+    would: each voice is busy for as long as its samples would take to play. 
+    Real devices implement the same three methods.
+
+    Attributes:
+        _bytes_per_second: float, How many bytes of samples play per second.
+        _timer: Callable[[], float], Gets the current time in seconds.
+        _ends: Dict[int, float], When each busy voice finishes.
+        _played: deque, The last (voice, samples, volume) started, oldest 
+            first.
+    """
+
+    def __init__(self, bytes_per_second : float = 44100 * 2 * 2,
+                    timer = time.perf_counter,
+                    history : int = 64):
+        """Initializes a new instance of NullAudioDevice.
+
+        Args:
+            bytes_per_second: float, How many bytes of samples play per 
+                second. The default is 16 bit stereo at 44.1 kHz.
+            timer: Callable[[], float], Gets the current time in seconds.
+            history: int, The most started sounds get_played remembers.
+        """
+        self._bytes_per_second = bytes_per_second
+        self._timer = timer
+        self._ends = {}
+        self._played = deque(maxlen=history)
+
+    def play(self, voice : int, samples, volume : float):
+        """Starts playing the given samples on a voice, replacing whatever 
+        it was playing.
+
+        Args:
+            voice: int, The voice.
+            samples: bytes, The decoded samples.
+            volume: float, The volume.
+        """
+        length = len(samples) / self._bytes_per_second
+        self._ends[voice] = self._timer() + length
+        self._played.append((voice, samples, volume))
+
+    def stop(self, voice : int):
+        """Stops the given voice.
+
+        Args:
+            voice: int, The voice.
+        """
+        self._ends.pop(voice, None)
+
+    def is_busy(self, voice : int):
+        """Whether the given voice is still playing.
+
+        Args:
+            voice: int, The voice.
+
+        Returns:
+            bool: True if the voice is playing; false if otherwise.
+        """
+        end = self._ends.get(voice)
+        return end is not None and self._timer() < end
+
+    def get_played(self):
+        """Gets the last sounds started, up to the history given to the 
+        constructor, so that a long headless run doesn't keep every clip.
+
+        Returns:
+            deque: The (voice, samples, volume) of each, oldest first.
+        """
+        return self._played
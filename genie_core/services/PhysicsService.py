@@ -1,10 +1,143 @@
+from genie_core.cast.Body import Body
+from genie_core.cast import body_store
+from genie_core.cast.body_store import BodyStore
 
 class PhysicsService:
-    def __init__(self):
-        pass
+    """Moves actors according to their bodies.
+
+    The responsibility of PhysicsService is to integrate the positions and 
+    velocities of every actor with a Body once per update. Bodies that live in 
+    a BodyStore are moved in batch, one vectorized pass per store; plain 
+    bodies are moved one at a time.
+
+    Attributes:
+        _damping: float, The fraction of velocity lost every step.
+        _bounds: Tuple[float, float, float, float], The (left, top, right, 
+            bottom) limits positions are clamped to, or None.
+        _actors: Actors, The cast the cached bodies were gathered from.
+        _versions: Tuple[int], The cast and store versions when the bodies 
+            were gathered.
+        _plain_bodies: List[Body], The cached bodies without a store.
+        _stored_rows: Dict[BodyStore, numpy.ndarray], The cached slots of the 
+            stored bodies, or None when every slot of a store is in use.
+    """
+
+    def __init__(self, damping : float = 0, bounds = None):
+        """Initializes a new instance of PhysicsService.
+
+        Args:
+            damping: float, The fraction of velocity lost every step, between 
+                0 and 1.
+            bounds: Tuple[float, float, float, float], The (left, top, right, 
+                bottom) limits to clamp positions to. A body that hits a 
+                limit stops moving along that axis.
+        """
+        self._damping = damping
+        self._bounds = bounds
+        self._actors = None
+        self._versions = None
+        self._plain_bodies = []
+        self._stored_rows = {}
 
     def move_actors(self, actors):
-        pass
+        """Moves every actor with a Body by one step.
+
+        Args:
+            actors: Actors, The cast to move.
+        """
+        self._gather(actors)
+        for store, rows in self._stored_rows.items():
+            self._move_stored(store, rows)
+        if self._stored_rows:
+            actors.invalidate_positions(self._stored_rows)
+        for body in self._plain_bodies:
+            self._move_plain(body)
 
     def check_collision(self, actor1, actor2):
-        pass
\ No newline at end of file
+        pass
+
+    def _gather(self, actors):
+        """Sorts the cast's bodies into plain ones and slots per store. The 
+        result is cached until the cast or one of the stores changes.
+
+        Args:
+            actors: Actors, The cast to gather from.
+        """
+        if actors is self._actors and self._versions == self._get_versions():
+            return
+        plain_bodies = []
+        stored_bodies = {}
+        for actor in actors.with_traits(Body):
+            body = actor.get_trait(Body)
+            store = body.get_store()
+            if store is None:
+                plain_bodies.append(body)
+            else:
+                stored_bodies.setdefault(store, []).append(body._row)
+        stored_rows = {}
+        for store, rows in stored_bodies.items():
+            if len(rows) == len(store) == store.get_data().shape[1]:
+                stored_rows[store] = None
+            else:
+                stored_rows[store] = body_store.numpy.array(rows)
+        self._actors = actors
+        self._plain_bodies = plain_bodies
+        self._stored_rows = stored_rows
+        self._versions = self._get_versions()
+
+    def _get_versions(self):
+        """Gets the versions of the cached cast and stores."""
+        if self._actors is None:
+            return None
+        return (self._actors.get_version(),) + tuple(
+            store.get_version() for store in self._stored_rows)
+
+    def _move_stored(self, store, rows):
+        """Moves the bodies in the given slots of a store in one pass.
+
+        Args:
+            store: BodyStore, The store holding the bodies.
+            rows: numpy.ndarray, The slots to move or None for all of them.
+        """
+        numpy = body_store.numpy
+        data = store.get_data()
+        columns = data if rows is None else data[:, rows]
+        position = columns[BodyStore.X:BodyStore.VX]
+        velocity = columns[BodyStore.VX:BodyStore.HEIGHT]
+        if self._damping:
+            velocity *= 1 - self._damping
+        position += velocity
+        if self._bounds is not None:
+            left, top, right, bottom = self._bounds
+            lower = numpy.array([[left], [top]])
+            upper = numpy.array([[right], [bottom]])
+            outside = (position < lower) | (position > upper)
+            numpy.clip(position, lower, upper, out=position)
+            velocity[outside] = 0
+        if rows is not None:
+            data[:, rows] = columns
+
+    def _move_plain(self, body):
+        """Moves a body that stores its own values.
+
+        Args:
+            body: Body, The body to move.
+        """
+        vx = body.get_vx()
+        vy = body.get_vy()
+        if self._damping:
+            vx *= 1 - self._damping
+            vy *= 1 - self._damping
+        x = body.get_x() + vx
+        y = body.get_y() + vy
+        if self._bounds is not None:
+            left, top, right, bottom = self._bounds
+            if x < left or x > right:
+                x = min(max(x, left), right)
+                vx = 0
+            if y < top or y > bottom:
+                y = min(max(y, top), bottom)
+                vy = 0
+        body.set_position(x, y)
+        body.set_vx(vx)
+        body.set_vy(vy)
@@ -1,7 +1,110 @@
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.services.SpriteBatch import SpriteBatch
 
 class ScreenService:
+    """Draws actors in batches.
+
+    The responsibility of ScreenService is to put every actor with a Body and 
+    an Image in draw order, lowest layer first, and to group consecutive 
+    actors sharing an image into a SpriteBatch, so that a backend can submit 
+    one draw call per texture and layer instead of one per actor. Backends 
+    subclass it and override draw_batch.
+
+    The draw order is kept between frames. It is only re-sorted when actors 
+    join or leave the cast or an image's path or layer changes, and since the 
+    order is nearly sorted already that takes about linear time. Key changes 
+    are found by comparing each image against its sorted key while the 
+    batches are built, so they are never missed however long ago they 
+    happened.
+
+    Attributes:
+        _actors: Actors, The cast the draw order belongs to.
+        _version: int, The cast's version when the draw order was updated.
+        _order: List[Actor], The actors in draw order.
+        _keys: Dict[Actor, Tuple[int, str]], The (layer, path) of each actor 
+            when it was last sorted.
+    """
+
     def __init__(self):
-        pass
+        self._actors = None
+        self._version = None
+        self._order = []
+        self._keys = {}
 
     def draw_actors(self, actors):
-        pass
\ No newline at end of file
+        """Draws the given cast, one batch at a time.
+
+        Args:
+            actors: Actors, The cast to draw.
+        """
+        for batch in self.get_batches(actors):
+            self.draw_batch(batch)
+
+    def draw_batch(self, batch):
+        """Draws the given batch. Backends override this method.
+
+        Args:
+            batch: SpriteBatch, The sprites to draw.
+        """
+        pass
+
+    def get_batches(self, actors):
+        """Groups the given cast into batches, in draw order.
+
+        Args:
+            actors: Actors, The cast to draw.
+
+        Returns:
+            List[SpriteBatch]: The batches.
+        """
+        self._update_order(actors)
+        batches = self._build_batches()
+        if batches is None:
+            self._order.sort(key=self._keys.__getitem__)
+            batches = self._build_batches()
+        return batches
+
+    def _build_batches(self):
+        """Groups the actors into batches in the current draw order, taking 
+        the path and layer from each actor's image as it is now. Returns None 
+        if any image's key moved since it was sorted, after updating its key, 
+        so the order can be sorted again."""
+        batches = []
+        batch = None
+        keys = self._keys
+        is_stale = False
+        for actor in self._order:
+            body = actor.get_trait(Body)
+            image = actor.get_trait(Image)
+            key = (image.get_layer(), image.get_path())
+            if key != keys[actor]:
+                keys[actor] = key
+                is_stale = True
+            if is_stale:
+                continue
+            layer, path = key
+            if batch is None or batch.get_path() != path \
+                    or batch.get_layer() != layer:
+                batch = SpriteBatch(path, layer)
+                batches.append(batch)
+            x, y = body.get_position()
+            batch.add(actor, x, y, image.get_scale(), image.get_rotation())
+        return None if is_stale else batches
+
+    def _update_order(self, actors):
+        """Brings the draw order up to date with the members of the cast."""
+        if actors is not self._actors or actors.get_version() != self._version:
+            members = actors.with_traits(Body, Image)
+            keys = {actor: self._keys.get(actor) or self._get_key(actor) 
+                for actor in members}
+            self._order = [a for a in self._order if a in keys]
+            self._order.extend(a for a in members if a not in self._keys)
+            self._keys = keys
+            self._actors = actors
+            self._version = actors.get_version()
+            self._order.sort(key=self._keys.__getitem__)
+
+    def _get_key(self, actor):
+        image = actor.get_trait(Image)
+        return (image.get_layer(), image.get_path())
@@ -0,0 +1,69 @@
+from array import array
+
+class SpriteBatch:
+    """Sprites that share an image and a layer.
+
+    The responsibility of SpriteBatch is to hand a rendering backend 
+    everything it needs to draw many copies of one texture in a single call. 
+    The positions, scales and rotations are kept in flat float64 arrays, one 
+    entry per actor, which backends can pass on as they are or wrap without 
+    copying, for example with numpy.frombuffer.
+
+    Attributes:
+        _path: str, The image path shared by the sprites.
+        _layer: int, The layer shared by the sprites.
+        _actors: List[Actor], The actors drawn, in draw order.
+        _xs: array, The x positions.
+        _ys: array, The y positions.
+        _scales: array, The scales.
+        _rotations: array, The rotations in degrees.
+    """
+
+    def __init__(self, path : str, layer : int):
+        self._path = path
+        self._layer = layer
+        self._actors = []
+        self._xs = array("d")
+        self._ys = array("d")
+        self._scales = array("d")
+        self._rotations = array("d")
+
+    def __len__(self):
+        return len(self._actors)
+
+    def add(self, actor, x, y, scale, rotation):
+        """Adds a sprite to the end of the batch.
+
+        Args:
+            actor: Actor, The actor the sprite is for.
+            x: float, The x position.
+            y: float, The y position.
+            scale: float, The scale.
+            rotation: float, The rotation in degrees.
+        """
+        self._actors.append(actor)
+        self._xs.append(x)
+        self._ys.append(y)
+        self._scales.append(scale)
+        self._rotations.append(rotation)
+
+    def get_path(self):
+        return self._path
+
+    def get_layer(self):
+        return self._layer
+
+    def get_actors(self):
+        return self._actors
+
+    def get_xs(self):
+        return self._xs
+
+    def get_ys(self):
+        return self._ys
+
+    def get_scales(self):
+        return self._scales
+
+    def get_rotations(self):
+        return self._rotations
@@ -22,5 +22,8 @@ setuptools.setup(
     # package_dir={"": ""},
     packages=setuptools.find_packages(),
     python_requires=">=3.9.7",
-    install_requires=[]        # List dependencies of this project
+    install_requires=[],       # List dependencies of this project
+    extras_require={
+        "numpy": ["numpy"]     # Needed for BodyStore
+    }
 )
\ No newline at end of file
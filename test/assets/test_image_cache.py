@@ -0,0 +1,92 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.assets.image_cache import ImageCache
+from genie_core.cast.Image import Image
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self._loads = []
+        self._transforms = []
+        # Images are byte strings of 100 bytes; variants record what was done
+        self._cache = ImageCache(self._load, self._transform, budget=350, 
+            sizer=len, rotation_step=15)
+
+    def _load(self, path):
+        self._loads.append(path)
+        return path.encode().ljust(100, b".")
+
+    def _transform(self, image, scale, rotation):
+        self._transforms.append((scale, rotation))
+        return image[:80] + f"{scale}/{rotation}".encode().ljust(20, b".")
+
+    def test_images_and_variants_are_made_once(self):
+        """
+        Ensures that an image is decoded once however many times it is used,
+        and that each variant is transformed once from the decoded image
+        """
+        original = self._cache.get("ship.png")
+        self.assertIs(self._cache.get("ship.png"), original)
+        variant = self._cache.get_image(Image("ship.png", 2, 90))
+        self.assertIs(self._cache.get("ship.png", 2, 90), variant)
+        self.assertEqual(self._loads, ["ship.png"])
+        self.assertEqual(self._transforms, [(2, 90)])
+
+        stats = self._cache.get_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["bytes"], 200)
+
+    def test_rotations_are_quantized(self):
+        """
+        Ensures that rotations close to each other share one variant and
+        that rotations wrap around at 360 degrees
+        """
+        variant = self._cache.get("ship.png", 1, 44)
+        self.assertIs(self._cache.get("ship.png", 1, 50), variant)
+        self.assertIs(self._cache.get("ship.png", 1, 405), variant)
+        self.assertIs(self._cache.get("ship.png", 1, 359), 
+            self._cache.get("ship.png"))
+        self.assertEqual(self._transforms, [(1, 45)])
+
+    def test_least_recently_used_images_are_evicted_over_budget(self):
+        """
+        Ensures that going over the byte budget evicts the images that went
+        unused the longest, and that the counters report it
+        """
+        self._cache.get("a.png")
+        self._cache.get("b.png")
+        self._cache.get("c.png")
+        self._cache.get("a.png")
+        self._cache.get("d.png")
+        self._cache.get("a.png")
+        self._cache.get("b.png")
+        self.assertEqual(self._loads, 
+            ["a.png", "b.png", "c.png", "d.png", "b.png"])
+        self.assertEqual(self._cache.get_stats(), {
+            "hits": 2,
+            "misses": 5,
+            "evictions": 2,
+            "entries": 3,
+            "bytes": 300
+        })
+
+    def test_default_sizer_counts_the_bytes_of_the_image(self):
+        """
+        Ensures that without a sizer bytes-like images are measured by their
+        length, so the budget evicts them
+        """
+        cache = ImageCache(self._load, budget=250)
+        for path in ("a.png", "b.png", "c.png"):
+            cache.get(path)
+        stats = cache.get_stats()
+        self.assertEqual((stats["entries"], stats["bytes"]), (2, 200))
+        self.assertEqual(stats["evictions"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import threading
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.assets.lru_cache import LruCache
+
+class TestLruCache(unittest.TestCase):
+
+    def test_sharing_the_cache_between_threads(self):
+        """
+        Ensures that reading the cache while another thread fills it and
+        evicts from it never fails and keeps the byte count right
+        """
+        cache = LruCache(50, len)
+        errors = []
+
+        def preload():
+            try:
+                for i in range(20_000):
+                    cache.put(i % 100, b"x" * 10)
+            except Exception as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=preload)
+        thread.start()
+        try:
+            while thread.is_alive():
+                for key in range(100):
+                    cache.get(key)
+        except Exception as error:
+            errors.append(error)
+        thread.join()
+        self.assertEqual(errors, [])
+        stats = cache.get_stats()
+        self.assertEqual(stats["bytes"], 10 * stats["entries"])
+        self.assertLessEqual(stats["bytes"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import sys
+import weakref
   
 # setting path
 sys.path.append('..\\..')
@@ -179,6 +180,26 @@ class TestActor(unittest.TestCase):
         # the same as its initial state.
         self.assertDictEqual(initialDict, self._actor._traits)
 
+    def test_subclasses_of_slotted_actor_can_add_attributes(self):
+        """
+        Ensures that Actor carries no instance dictionary of its own, while
+        subclasses defined by games can still add their own attributes
+        """
+        self.assertFalse(hasattr(self._actor, "__dict__"))
+
+        class Player(Actor):
+            pass
+
+        player = Player()
+        player.name = "player one"
+        player.add_trait(self._trait1)
+        self.assertEqual(player.name, "player one")
+        self.assertTrue(player.has_traits(type(self._trait1)))
+
+        # Slots still allow weak references, as before
+        actor = Actor()
+        self.assertIs(weakref.ref(actor)(), actor)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
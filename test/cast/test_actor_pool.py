@@ -0,0 +1,105 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actor_pool import ActorPool
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.cast.trait import Trait
+from stub.traits import Red
+
+class Health(Trait):
+    __slots__ = ("hp",)
+
+    def __init__(self, hp = 100):
+        self.hp = hp
+
+class TestActorPool(unittest.TestCase):
+
+    def setUp(self):
+        self._pool = ActorPool(capacity=2)
+        self._actors = Actors(pool=self._pool)
+        self._prototype = Actor()
+        self._prototype.add_trait(Body(0, 0, 1, 1))
+        self._prototype.add_trait(Image("bullet.png"))
+
+    def test_removed_actors_are_reused_by_spawn(self):
+        """
+        Ensures that actors removed from the cast are pooled at
+        apply_changes and reused, reset to the prototype, by the next spawn
+        """
+        first = self._actors.spawn(self._prototype, 2)
+        first[0].get_trait(Body).set_position(50, 50)
+        first[0].get_trait(Image).set_scale(3)
+        self._actors.remove_actors(first)
+        self.assertEqual(self._pool.get_stats()["pooled"], 0)
+        self._actors.apply_changes()
+        self.assertEqual(self._pool.get_stats()["pooled"], 2)
+
+        second = self._actors.spawn(self._prototype, 3, x=[1, 2, 3])
+        self.assertEqual(set(second[:2]), set(first))
+        self.assertEqual(sorted(a.get_trait(Body).get_position() 
+            for a in second), [(1, 0), (2, 0), (3, 0)])
+        self.assertTrue(all(a.get_trait(Image).get_scale() == 1 
+            for a in second))
+        self.assertEqual(len(self._actors.with_traits(Body, Image)), 3)
+
+        # Reused actors tell the cast about their changes again
+        self._actors.apply_changes()
+        second[0].get_trait(Body).set_x(9)
+        self.assertIn(second[0], self._actors.get_changed_actors())
+
+        stats = self._pool.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 3))
+        self.assertEqual(stats["hit_rate"], 0.4)
+
+    def test_free_lists_are_per_archetype_and_bounded(self):
+        """
+        Ensures that actors only come back for spawns of the same types of
+        trait and that a full free list drops the extra actors
+        """
+        other = Actor()
+        other.add_trait(Red())
+        self._actors.remove_actors(self._actors.spawn(other, 3))
+        self._actors.apply_changes()
+        stats = self._pool.get_stats()
+        self.assertEqual((stats["released"], stats["discarded"]), (2, 1))
+
+        spawned = self._actors.spawn(self._prototype, 1)
+        self.assertEqual(len(spawned[0]._traits), 2)
+        self.assertEqual(self._pool.get_stats()["pooled"], 2)
+
+    def test_reused_slotted_traits_are_reset(self):
+        """
+        Ensures that a slotted trait without its own assign gets the
+        prototype's values back when its actor is reused
+        """
+        self._prototype.add_trait(Health())
+        first, = self._actors.spawn(self._prototype, 1)
+        first.get_trait(Health).hp = 3
+        self._actors.remove_actor(first)
+        self._actors.apply_changes()
+
+        second, = self._actors.spawn(self._prototype, 1)
+        self.assertIs(second, first)
+        self.assertEqual(second.get_trait(Health).hp, 100)
+
+    def test_spawn_checks_per_copy_values_before_taking_from_the_pool(self):
+        """
+        Ensures that a per-copy override of the wrong length raises before
+        any pooled actor is taken
+        """
+        self._actors.remove_actors(self._actors.spawn(self._prototype, 2))
+        self._actors.apply_changes()
+        with self.assertRaises(ValueError):
+            self._actors.spawn(self._prototype, 3, x=[1, 2])
+        self.assertEqual(self._pool.get_stats()["pooled"], 2)
+        self.assertEqual(self._actors.with_traits(), [])
+
+if __name__ == '__main__':
+    unittest.main()
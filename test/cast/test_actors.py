@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import sys
   
@@ -7,6 +8,8 @@ sys.path.append('..')
 
 from genie_core.cast.actors import Actors
 from genie_core.cast.actor import Actor
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
 from stub.traits import Blue, Red, CanShoot
 
 class TestActors(unittest.TestCase):
@@ -182,11 +185,11 @@ class TestActors(unittest.TestCase):
         and that the result set does not include any actor without one
         of the traits set forth in the parameters
         """
-        # Add the 3 actors to the cast without using add_actor so the test is
-        # not dependent on the previous test
-        self._actors._current_actors.add(self._actor1)
-        self._actors._current_actors.add(self._actor2)
-        self._actors._current_actors.add(self._actor3)
+        # Add the 3 actors to the cast with add_actor so that they are also
+        # put in the trait index that with_traits() reads from
+        self._actors.add_actor(self._actor1)
+        self._actors.add_actor(self._actor2)
+        self._actors.add_actor(self._actor3)
 
         # Assert that they are found:
         self.assertIn(self._actor1, self._actors._current_actors)
@@ -223,7 +226,195 @@ class TestActors(unittest.TestCase):
         self.assertIn(self._actor2, actors_red)
         self.assertIn(self._actor3, actors_red)
         self.assertNotIn(self._actor1, actors_red)
-        
+
+    def test_with_traits_follows_traits_added_and_removed_after_add_actor(self):
+        """
+        Ensures that with_traits() keeps up with traits that are added to or
+        removed from an actor after it has joined the cast
+        """
+        actor = Actor()
+        actor.add_trait(Blue())
+        self._actors.add_actor(actor)
+        self.assertNotIn(actor, self._actors.with_traits(Red))
+
+        # Adding a trait puts the actor in the results for that trait
+        red = Red()
+        actor.add_trait(red)
+        self.assertIn(actor, self._actors.with_traits(Red))
+        self.assertIn(actor, self._actors.with_traits(Blue, Red))
+
+        # Removing it takes the actor back out
+        actor.remove_trait(red)
+        self.assertNotIn(actor, self._actors.with_traits(Red))
+        self.assertIn(actor, self._actors.with_traits(Blue))
+
+    def test_with_traits_excludes_actors_after_apply_changes(self):
+        """
+        Ensures that removed actors are still found by with_traits() until
+        apply_changes() is called, and are no longer tracked afterwards
+        """
+        self._actors.add_actor(self._actor1)
+        self._actors.add_actor(self._actor2)
+        self._actors.remove_actor(self._actor1)
+        self.assertIn(self._actor1, self._actors.with_traits(Blue))
+
+        self._actors.apply_changes()
+        self.assertNotIn(self._actor1, self._actors.with_traits(Blue))
+        self.assertIn(self._actor2, self._actors.with_traits(Blue))
+
+        # A removed actor that gains a trait must not come back
+        actor = Actor()
+        self._actors.add_actor(actor)
+        self._actors.remove_actor(actor)
+        self._actors.apply_changes()
+        actor.add_trait(Red())
+        self.assertNotIn(actor, self._actors.with_traits(Red))
+
+    def test_changed_actors_are_recorded_until_apply_changes(self):
+        """
+        Ensures that actors that are added, or whose Body or Image change,
+        are reported as changed until apply_changes() starts a new frame
+        """
+        still = Actor()
+        still.add_trait(Body(0, 0))
+        moving = Actor()
+        moving.add_trait(Body(0, 0, 1, 1))
+        spinning = Actor()
+        spinning.add_trait(Image("ship.png"))
+        for actor in (still, moving, spinning):
+            self._actors.add_actor(actor)
+        self.assertEqual(self._actors.get_changed_actors(), 
+            {still, moving, spinning})
+
+        self._actors.apply_changes()
+        self.assertEqual(self._actors.get_changed_actors(), set())
+
+        moving.get_trait(Body).move()
+        spinning.get_trait(Image).set_rotation(90)
+        self._actors.remove_actor(still)
+        self.assertEqual(self._actors.get_changed_actors(), {moving, spinning})
+        self.assertEqual(self._actors.get_removed_actors(), {still})
+
+        # Bulk changes mark the actors with bodies as changed for one frame
+        self._actors.apply_changes()
+        self._actors.invalidate_positions()
+        self.assertEqual(self._actors.get_changed_actors(), {moving})
+        self._actors.apply_changes()
+        self.assertEqual(self._actors.get_changed_actors(), set())
+
+        # Traits that left the actor no longer report to the cast
+        image = spinning.get_trait(Image)
+        spinning.remove_trait(image)
+        self._actors.apply_changes()
+        image.set_scale(2)
+        self.assertEqual(self._actors.get_changed_actors(), set())
+
+    def test_add_actors_and_remove_actors_work_in_batches(self):
+        """
+        Ensures that a batch of actors is indexed like actors added one at a
+        time and that a batch removal waits for apply_changes
+        """
+        actors = Actors()
+        batch = [Actor() for _ in range(3)]
+        batch[0].add_trait(Blue())
+        batch[1].add_trait(Blue())
+        batch[1].add_trait(Body(1, 1))
+        actors.add_actors(batch + batch[:1])
+        self.assertEqual(len(actors.with_traits()), 3)
+        self.assertEqual(set(actors.with_traits(Blue)), set(batch[:2]))
+        self.assertEqual(actors.in_radius(1, 1, 1), [batch[1]])
+        self.assertEqual(actors.get_changed_actors(), set(batch))
+
+        actors.remove_actors(batch[:2])
+        self.assertEqual(len(actors.with_traits()), 3)
+        actors.apply_changes()
+        self.assertEqual(actors.with_traits(), [batch[2]])
+        self.assertEqual(actors.in_radius(1, 1, 1), [])
+
+    def test_spawn_clones_the_prototype_with_overrides(self):
+        """
+        Ensures that spawned actors get their own copies of the prototype's
+        traits, with per-copy and shared overrides applied
+        """
+        prototype = Actor()
+        prototype.add_trait(Body(0, 0, 1, 2))
+        prototype.add_trait(Image("bullet.png"))
+        prototype.add_trait(Red())
+        actors = Actors()
+        spawned = actors.spawn(prototype, 3, position=[(i, -i) for i in range(3)],
+            rotation=45)
+
+        self.assertEqual(len(actors.with_traits(Body, Image, Red)), 3)
+        self.assertNotIn(prototype, actors.with_traits())
+        for i, actor in enumerate(spawned):
+            body = actor.get_trait(Body)
+            self.assertIsNot(body, prototype.get_trait(Body))
+            self.assertIsNot(actor.get_trait(Red), prototype.get_trait(Red))
+            self.assertEqual(body.get_position(), (i, -i))
+            self.assertEqual(body.get_vy(), 2)
+            self.assertEqual(actor.get_trait(Image).get_rotation(), 45)
+        self.assertEqual(prototype.get_trait(Body).get_position(), (0, 0))
+
+        # The clones tell the cast about their changes
+        spawned[0].get_trait(Body).set_x(5)
+        self.assertIn(spawned[0], actors.get_changed_actors())
+        with self.assertRaises(AttributeError):
+            actors.spawn(prototype, 1, colour="red")
+
+
+    def test_each(self):
+        """
+        Ensures that each walks exactly the actors with all the given traits, 
+        with their current traits, and that ids go stale once removed
+        """
+        actors = Actors()
+        both = Actor()
+        both.add_trait(Body(1, 2))
+        both.add_trait(Image("a.png"))
+        only_body = Actor()
+        only_body.add_trait(Body(3, 4))
+        actors.add_actors([both, only_body])
+
+        rows = list(actors.each(Body, Image))
+        self.assertEqual(rows, [(both, both.get_trait(Body), 
+            both.get_trait(Image))])
+        self.assertEqual(len(list(actors.each(Body))), 2)
+        self.assertEqual(list(actors.each(Red)), [])
+
+        # Replacing a trait replaces it in storage
+        image = Image("b.png")
+        both.add_trait(image)
+        self.assertIs(list(actors.each(Image))[0][1], image)
+
+        only_body.add_trait(Image("c.png"))
+        self.assertEqual(len(list(actors.each(Image, Body))), 2)
+
+        id_ = actors.get_id(both)
+        self.assertIs(actors.get_actor(id_), both)
+        actors.remove_actor(both)
+        actors.apply_changes()
+        self.assertIsNone(actors.get_id(both))
+        self.assertIsNone(actors.get_actor(id_))
+        self.assertEqual([row[0] for row in actors.each(Body, Image)], 
+            [only_body])
+
+
+    def test_pickle_round_trip(self):
+        """
+        Ensures that a cast with live queries can still be pickled, and that
+        the copy works without them
+        """
+        actors = Actors()
+        actor = Actor()
+        actor.add_trait(Body(1, 2))
+        actors.add_actor(actor)
+        query = actors.query(Body)
+
+        copy = pickle.loads(pickle.dumps(actors))
+        copied, = copy.with_traits(Body)
+        self.assertEqual(copied.get_trait(Body).get_position(), (1, 2))
+        self.assertEqual(len(copy.query(Body)), 1)
+        self.assertEqual(len(query), 1)
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.Body import Body
+from genie_core.cast import body_store
+from genie_core.cast.body_store import BodyStore
+
+@unittest.skipIf(body_store.numpy is None, "numpy is not installed")
+class TestBodyStore(unittest.TestCase):
+
+    def setUp(self):
+        # A tiny capacity so that the tests also exercise growing the store
+        self._store = BodyStore(capacity=2)
+
+    def test_stored_body_reads_and_writes_through_the_store(self):
+        """
+        Ensures that a body created with a store keeps the normal getters and
+        setters, and that its values live in the store's columns
+        """
+        body = Body(1, 2, 3, 4, 5, 6, store=self._store)
+        self.assertIs(body.get_store(), self._store)
+        self.assertEqual(body.get_position(), (1, 2))
+        self.assertEqual(body.get_vx(), 3)
+        self.assertEqual(body.get_vy(), 4)
+        self.assertEqual(body.get_height(), 5)
+        self.assertEqual(body.get_width(), 6)
+
+        body.set_position(10, 20)
+        body.incr_x(1)
+        body.incr_y(-1)
+        self.assertEqual(self._store.get_column("x")[0], 11)
+        self.assertEqual(self._store.get_column("y")[0], 19)
+
+        body.move()
+        self.assertEqual(body.get_position(), (14, 23))
+
+    def test_move_all_moves_every_body(self):
+        """
+        Ensures that move_all() moves each body by its own velocity, including
+        bodies created after the store had to grow
+        """
+        bodies = [Body(i, -i, 1, i, store=self._store) for i in range(5)]
+        self._store.move_all()
+        for i, body in enumerate(bodies):
+            self.assertEqual(body.get_position(), (i + 1, 0))
+
+    def test_release_turns_the_body_back_into_a_plain_body(self):
+        """
+        Ensures that a released body keeps its values, no longer touches the
+        store, and that its slot is reused by the next body
+        """
+        body1 = Body(1, 2, 3, 4, store=self._store)
+        body2 = Body(5, 6, store=self._store)
+        self._store.release(body1)
+        self.assertEqual(len(self._store), 1)
+        self.assertIsNone(body1.get_store())
+        self.assertEqual(body1.get_position(), (1, 2))
+
+        body1.move()
+        self.assertEqual(body1.get_position(), (4, 6))
+        self.assertEqual(body2.get_position(), (5, 6))
+
+        body3 = Body(7, 8, store=self._store)
+        self.assertEqual(len(self._store), 2)
+        self.assertEqual(self._store.get_column("x").tolist(), [7, 5])
+        self.assertEqual(body3.get_position(), (7, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.entities import Entities, INDEX_MASK
+from genie_core.cast.sparse_set import SparseSet
+
+class TestEntities(unittest.TestCase):
+
+    def test_generations(self):
+        """
+        Ensures that a destroyed id goes stale and its slot is reused under 
+        a new generation
+        """
+        entities = Entities()
+        first = entities.create()
+        second = entities.create()
+        self.assertTrue(entities.is_alive(first))
+        self.assertEqual(len(entities), 2)
+
+        entities.destroy(first)
+        self.assertFalse(entities.is_alive(first))
+        reused = entities.create()
+        self.assertEqual(reused & INDEX_MASK, first & INDEX_MASK)
+        self.assertNotEqual(reused, first)
+        self.assertTrue(entities.is_alive(reused))
+        self.assertFalse(entities.is_alive(first))
+        self.assertTrue(entities.is_alive(second))
+
+    def test_sparse_set(self):
+        """
+        Ensures that removing from a sparse set keeps it packed and every 
+        remaining slot findable
+        """
+        storage = SparseSet()
+        for index in (4, 0, 9):
+            storage.add(index, f"actor{index}", index * 10)
+        storage.remove(4)
+        storage.remove(4)
+
+        self.assertEqual(len(storage), 2)
+        self.assertNotIn(4, storage)
+        self.assertNotIn(100, storage)
+        self.assertEqual(storage.get(9), 90)
+        self.assertEqual(storage.get(0), 0)
+        self.assertIsNone(storage.get(4))
+        self.assertEqual(sorted(storage.get_indices()), [0, 9])
+        self.assertEqual(sorted(storage.get_values()), [0, 90])
+
+        storage.add(9, "actor9", 91)
+        self.assertEqual(len(storage), 2)
+        self.assertEqual(storage.get(9), 91)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from stub.traits import Blue, Red
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self._actors = Actors()
+
+    def _add_actor(self, *traits):
+        actor = Actor()
+        for trait in traits:
+            actor.add_trait(trait)
+        self._actors.add_actor(actor)
+        return actor
+
+    def test_query_stays_current(self):
+        """
+        Ensures that a query follows actors joining, gaining and losing
+        traits and being removed from the cast
+        """
+        both = self._add_actor(Blue(), Red())
+        self._add_actor(Blue())
+        query = self._actors.query(Blue, Red)
+        self.assertEqual(list(query), [both])
+
+        added = self._add_actor(Blue(), Red())
+        gains = self._add_actor(Blue())
+        gains.add_trait(Red())
+        self.assertEqual(set(query), {both, added, gains})
+
+        red = both.get_trait(Red)
+        both.remove_trait(red)
+        self.assertNotIn(both, query)
+        self._actors.remove_actor(added)
+        self.assertIn(added, query)
+        self._actors.apply_changes()
+        self.assertEqual(list(query), [gains])
+        self.assertEqual(len(query), 1)
+
+    def test_changes_are_reported_for_the_last_frame(self):
+        """
+        Ensures that the actors that joined or left during a frame are
+        reported after the frame's apply_changes, and only until the next
+        """
+        query = self._actors.query(Blue)
+        staying = self._add_actor(Blue())
+        leaving = self._add_actor(Blue())
+        self._add_actor(Blue()).remove_trait(Blue())
+        self._actors.apply_changes()
+        self.assertEqual(query.get_added(), {staying, leaving})
+        self.assertEqual(query.get_removed(), set())
+
+        self._actors.remove_actor(leaving)
+        self._actors.apply_changes()
+        self.assertEqual(query.get_added(), set())
+        self.assertEqual(query.get_removed(), {leaving})
+
+        self._actors.apply_changes()
+        self.assertEqual(query.get_removed(), set())
+
+    def test_iterating_while_the_cast_changes(self):
+        """
+        Ensures that changes made while a query is being iterated show up
+        the next time it is iterated
+        """
+        for _ in range(10):
+            self._add_actor(Blue())
+        query = self._actors.query(Blue)
+        seen = 0
+        for actor in query:
+            actor.remove_trait(actor.get_trait(Blue))
+            self._add_actor(Blue())
+            seen += 1
+        self.assertEqual(seen, 10)
+        self.assertEqual(len(query), 10)
+
+    def test_len_and_contains_while_iterating(self):
+        """
+        Ensures that asking for the length or membership of a query while
+        iterating it answers correctly and doesn't skip members
+        """
+        actors = [self._add_actor(Blue()) for _ in range(5)]
+        query = self._actors.query(Blue)
+        seen = []
+        for actor in query:
+            actor.remove_trait(actor.get_trait(Blue))
+            self.assertNotIn(actor, query)
+            self.assertEqual(len(query), 4 - len(seen))
+            seen.append(actor)
+        self.assertEqual(sorted(seen, key=id), sorted(actors, key=id))
+        self.assertEqual(len(query), 0)
+        self.assertEqual(list(query), [])
+    def test_get_joined_reports_this_frame_so_far(self):
+        """
+        Ensures that get_joined has the actors that joined since the last
+        frame ended, before the frame is over
+        """
+        query = self._actors.query(Blue)
+        first = self._add_actor(Blue())
+        self.assertEqual(query.get_joined(), {first})
+        self._actors.apply_changes()
+        self.assertEqual(query.get_joined(), set())
+        self.assertEqual(query.get_added(), {first})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.cast import body_store
+from genie_core.cast import snapshot
+from genie_core.cast.body_store import BodyStore
+from stub.traits import Blue, Red
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self._actors = Actors()
+
+    def _add_actor(self, *traits):
+        actor = Actor()
+        for trait in traits:
+            actor.add_trait(trait)
+        self._actors.add_actor(actor)
+        return actor
+
+    def test_restore_rebuilds_actors_and_traits(self):
+        """
+        Ensures that restoring a snapshot replaces the cast with copies of
+        the actors and traits it was taken from
+        """
+        snapshot.register_trait(Blue)
+        ship = self._add_actor(Body(1, 2, 3, 4, 5, 6), Image("ship.png", 2, 90, 1),
+            Blue())
+        data = self._actors.snapshot()
+
+        ship.get_trait(Body).set_position(100, 100)
+        self._add_actor(Body())
+        self._actors.restore(data)
+
+        restored = self._actors.with_traits(Body, Image, Blue)
+        self.assertEqual(len(self._actors.with_traits()), 1)
+        self.assertEqual(len(restored), 1)
+        self.assertIsNot(restored[0], ship)
+        body = restored[0].get_trait(Body)
+        image = restored[0].get_trait(Image)
+        self.assertEqual(body.get_position(), (1, 2))
+        self.assertEqual((body.get_vx(), body.get_width()), (3, 6))
+        self.assertEqual((image.get_path(), image.get_scale(), 
+            image.get_rotation(), image.get_layer()), ("ship.png", 2, 90, 1))
+        self.assertEqual(self._actors.in_radius(1, 2, 1), restored)
+
+    def test_snapshot_rejects_unregistered_traits(self):
+        """
+        Ensures that a trait the snapshot doesn't know how to pack is
+        reported instead of silently dropped
+        """
+        self._add_actor(Red())
+        with self.assertRaises(ValueError):
+            self._actors.snapshot()
+
+    @unittest.skipIf(body_store.numpy is None, "numpy is not installed")
+    def test_stored_bodies_restore_into_a_new_store(self):
+        """
+        Ensures that bodies living in a store are restored as views into a
+        new store holding the same columns and free slots
+        """
+        store = BodyStore(capacity=4)
+        bodies = [Body(i, -i, store=store) for i in range(3)]
+        store.release(bodies[1])
+        self._add_actor(bodies[0])
+        self._add_actor(bodies[2])
+        data = self._actors.snapshot()
+
+        store.move_all()
+        bodies[0].set_x(50)
+        self._actors.restore(data)
+        restored = [a.get_trait(Body) for a in self._actors.with_traits(Body)]
+        new_store = restored[0].get_store()
+        self.assertIsNot(new_store, store)
+        self.assertEqual(sorted(b.get_position() for b in restored), 
+            [(0, 0), (2, -2)])
+        self.assertEqual(new_store.get_free_slots(), [1])
+        self.assertEqual(len(new_store), 2)
+
+if __name__ == '__main__':
+    unittest.main()
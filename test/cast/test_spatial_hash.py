@@ -0,0 +1,81 @@
+import random
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from stub.traits import Blue
+
+class TestSpatialHash(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self._actors = Actors(cell_size=10)
+        self._all = []
+        for _ in range(300):
+            actor = Actor()
+            actor.add_trait(Body(random.uniform(-100, 100), 
+                random.uniform(-100, 100)))
+            self._actors.add_actor(actor)
+            self._all.append(actor)
+
+    def _distance(self, actor, x, y):
+        ax, ay = actor.get_trait(Body).get_position()
+        return ((ax - x) ** 2 + (ay - y) ** 2) ** 0.5
+
+    def test_in_rect_and_in_radius_match_a_full_scan(self):
+        """
+        Ensures that the rectangle and radius queries return exactly the
+        actors a brute force check over the cast would
+        """
+        found = self._actors.in_rect(-20, -35, 45, 5)
+        expected = [a for a in self._all 
+            if -20 <= a.get_trait(Body).get_x() <= 45 
+            and -35 <= a.get_trait(Body).get_y() <= 5]
+        self.assertCountEqual(found, expected)
+
+        found = self._actors.in_radius(12, -7, 33)
+        expected = [a for a in self._all if self._distance(a, 12, -7) <= 33]
+        self.assertCountEqual(found, expected)
+
+    def test_nearest_returns_closest_actors_in_order(self):
+        """
+        Ensures that nearest() returns the k closest actors, closest first,
+        for points inside and far outside the occupied area
+        """
+        for x, y in ((0, 0), (95, -95), (1000, 1000)):
+            found = self._actors.nearest(x, y, 5)
+            expected = sorted(self._all, key=lambda a: self._distance(a, x, y))
+            self.assertEqual(found, expected[:5])
+
+    def test_queries_follow_moves_and_cast_changes(self):
+        """
+        Ensures that the index keeps up with bodies that move and with actors
+        that join, leave, or lose their Body
+        """
+        actor = self._all[0]
+        self._actors.in_rect(0, 0, 0, 0)
+        actor.get_trait(Body).set_position(500, 500)
+        self.assertEqual(self._actors.nearest(500, 500), [actor])
+
+        # Actors without a Body are never found, even after gaining a trait
+        other = Actor()
+        other.add_trait(Blue())
+        self._actors.add_actor(other)
+        other.add_trait(Body(501, 501))
+        self.assertCountEqual(self._actors.in_radius(500, 500, 2), 
+            [actor, other])
+
+        other.remove_trait(other.get_trait(Body))
+        self._actors.remove_actor(actor)
+        self._actors.apply_changes()
+        self.assertEqual(self._actors.in_radius(500, 500, 2), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
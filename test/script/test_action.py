@@ -1,5 +1,6 @@
 import unittest
 import sys
+import weakref
   
 # setting path
 sys.path.append('..\\..')
@@ -55,5 +56,19 @@ class TestAction(unittest.TestCase):
         self._action3.set_priority(PRIORITY_ONE)
         self.assertEqual(self._action3._priority, PRIORITY_ONE)
 
+    def test_slotted_actions_can_be_weakly_referenced(self):
+        """
+        Ensures that actions keep supporting weak references even when no
+        class adds an instance dictionary
+        """
+        class SlottedAction(Action):
+            __slots__ = ()
+            def execute(self):
+                pass
+
+        action = SlottedAction(PRIORITY_ONE)
+        self.assertFalse(hasattr(action, "__dict__"))
+        self.assertIs(weakref.ref(action)(), action)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
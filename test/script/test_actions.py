@@ -236,6 +236,45 @@ class TestAction(unittest.TestCase):
         actions_OUTPUT = self._actions.get_actions(OutputAction)
         self.assertEqual(self._action5, actions_OUTPUT[0]) # Priority 1
         self.assertEqual(self._action3, actions_OUTPUT[1]) # Priority 3
+
+    def test_get_actions_reuses_result_until_script_changes(self):
+        """
+        Ensures that get_actions hands back the same list while nothing
+        changes, and a fresh one once an action is added or removed
+        """
+        self._actions.add_action(self._action1)
+        self._actions.add_action(self._action2)
+        actions_INPUT = self._actions.get_actions(InputAction)
+        self.assertIs(actions_INPUT, self._actions.get_actions(InputAction))
+
+        # Applying changes with nothing removed keeps the same list
+        self._actions.apply_changes()
+        self.assertIs(actions_INPUT, self._actions.get_actions(InputAction))
+
+        # Adding an action rebuilds the list
+        self._actions.add_action(self._action4)
+        actions_INPUT = self._actions.get_actions(InputAction)
+        self.assertEqual([self._action1, self._action4], actions_INPUT)
+
+        # Removing an action only takes effect after apply_changes
+        self._actions.remove_action(self._action1)
+        self.assertIs(actions_INPUT, self._actions.get_actions(InputAction))
+        self._actions.apply_changes()
+        self.assertEqual([self._action4], self._actions.get_actions(InputAction))
+
+    def test_get_actions_resorts_after_set_priority(self):
+        """
+        Ensures that changing an action's priority changes its place in the
+        result of get_actions
+        """
+        self._actions.add_action(self._action1)
+        self._actions.add_action(self._action4)
+        self.assertEqual([self._action1, self._action4],
+            self._actions.get_actions(InputAction))
+
+        self._action1.set_priority(PRIORITY_THREE)
+        self.assertEqual([self._action4, self._action1],
+            self._actions.get_actions(InputAction))
         
 if __name__ == "__main__":
     unittest.main()
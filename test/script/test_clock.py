@@ -0,0 +1,86 @@
+import time
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.script.clock import Clock
+
+class TestClock(unittest.TestCase):
+
+    def _count_updates(self, clock):
+        updates = 0
+        while clock.is_lagging():
+            clock.catch_up()
+            updates += 1
+        return updates
+
+    def test_updates_per_frame_are_capped_and_extra_lag_dropped(self):
+        """
+        Ensures that a long stall only causes max_updates catch-up steps and
+        that the lag left over is forgotten, apart from the partial step
+        """
+        clock = Clock(max_updates=3)
+        clock.tick()
+        clock._lag = Clock.TIME_STEP * 10.5
+        self.assertEqual(self._count_updates(clock), 3)
+        self.assertAlmostEqual(clock._lag, Clock.TIME_STEP * 0.5)
+        self.assertAlmostEqual(clock._dropped, Clock.TIME_STEP * 7)
+
+    def test_lag_is_carried_over_when_not_dropped(self):
+        """
+        Ensures that with drop_lag off the animation catches up over the
+        following frames instead
+        """
+        clock = Clock(max_updates=3, drop_lag=False)
+        clock.tick()
+        clock._lag = Clock.TIME_STEP * 7
+        self.assertEqual(self._count_updates(clock), 3)
+        clock.tick()
+        self.assertEqual(self._count_updates(clock), 3)
+        clock.tick()
+        self.assertEqual(self._count_updates(clock), 1)
+
+    def test_no_cap_when_max_updates_is_none(self):
+        """
+        Ensures that the cap can be turned off
+        """
+        clock = Clock(max_updates=None)
+        clock.tick()
+        clock._lag = Clock.TIME_STEP * 20
+        self.assertEqual(self._count_updates(clock), 20)
+
+    def test_wait_paces_frames_to_the_target_fps(self):
+        """
+        Ensures that wait() holds each frame to at least 1/target_fps seconds
+        and returns immediately without a target
+        """
+        clock = Clock(target_fps=100)
+        start = time.perf_counter()
+        for _ in range(5):
+            clock.tick()
+            clock.wait()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+        clock = Clock()
+        start = time.perf_counter()
+        clock.tick()
+        clock.wait()
+        self.assertLess(time.perf_counter() - start, 0.01)
+
+    def test_get_wait_time_is_what_is_left_of_the_frame(self):
+        """
+        Ensures that get_wait_time() counts down the rest of the frame and is
+        0 without a target frame rate
+        """
+        clock = Clock(target_fps=10)
+        clock.tick()
+        self.assertGreater(clock.get_wait_time(), 0.05)
+        self.assertLessEqual(clock.get_wait_time(), 0.1)
+        self.assertEqual(Clock().get_wait_time(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
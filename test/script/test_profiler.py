@@ -0,0 +1,58 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.script.profiler import Profiler
+from genie_core.script.update_action import UpdateAction
+
+class TestProfiler(unittest.TestCase):
+
+    class CountingAction(UpdateAction):
+        def execute(self, actors, actions, clock, callback):
+            self.calls = getattr(self, "calls", 0) + 1
+
+    def setUp(self):
+        self._profiler = Profiler(window=100)
+
+    def test_get_stats_reports_counts_and_percentiles(self):
+        """
+        Ensures that the summary of a key counts every sample but computes
+        the percentiles from the most recent window only
+        """
+        for i in range(1, 201):
+            self._profiler.record(Profiler.UPDATE, i)
+        stats = self._profiler.get_stats()["phases"][Profiler.UPDATE]
+        self.assertEqual(stats["count"], 200)
+        self.assertEqual(stats["max"], 200)
+        self.assertEqual(stats["p50"], 150)
+        self.assertEqual(stats["p95"], 195)
+        self.assertEqual(stats["p99"], 199)
+
+    def test_execute_runs_and_times_each_action(self):
+        """
+        Ensures that execute() runs the actions and records one sample per
+        action and one for the phase
+        """
+        action1 = self.CountingAction(1)
+        action2 = self.CountingAction(2)
+        for _ in range(3):
+            self._profiler.execute(Profiler.UPDATE, [action1, action2], 
+                None, None, None, None)
+        self.assertEqual(action1.calls, 3)
+        self.assertEqual(action2.calls, 3)
+
+        stats = self._profiler.get_stats()
+        self.assertEqual(stats["phases"][Profiler.UPDATE]["count"], 3)
+        self.assertEqual(stats["actions"][action1]["count"], 3)
+        self.assertEqual(stats["actions"][action2]["count"], 3)
+
+        self._profiler.reset()
+        self.assertEqual(self._profiler.get_stats(), 
+            {"phases": {}, "actions": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import threading
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actors import Actors
+from genie_core.script.action import Action
+from genie_core.script.actions import Actions
+from genie_core.script.scene_loader import SceneLoader
+
+class TestSceneLoader(unittest.TestCase):
+
+    def test_build_runs_in_the_background_and_reports_progress(self):
+        """
+        Ensures that the build function runs on another thread, that its
+        progress can be followed and that its scene is kept
+        """
+        release = threading.Event()
+        scene = (Actors(), Actions())
+
+        def build(loader):
+            loader.set_progress(0.5)
+            release.wait(5)
+            return scene
+
+        loader = SceneLoader(build)
+        loader.start()
+        self.assertFalse(loader.wait(0.05))
+        self.assertEqual(loader.get_progress(), 0.5)
+        self.assertIsNone(loader.get_scene())
+
+        release.set()
+        self.assertTrue(loader.wait(5))
+        self.assertEqual(loader.get_progress(), 1.0)
+        self.assertIs(loader.get_scene(), scene)
+
+    def test_get_scene_raises_what_the_build_raised(self):
+        """
+        Ensures that a failed build is reported when its scene is asked for
+        """
+        def build(loader):
+            raise IOError("missing asset")
+
+        loader = SceneLoader(build)
+        loader.start()
+        loader.wait(5)
+        self.assertTrue(loader.is_done())
+        with self.assertRaises(IOError):
+            loader.get_scene()
+
+    def test_callbacks_without_on_load_build_right_away(self):
+        """
+        Ensures that a callback that doesn't override on_load can still be
+        made and builds the next scene synchronously
+        """
+        class Callback(Action.Callback):
+            def __init__(self):
+                self.scenes = []
+            def on_next(self, actors, actions):
+                self.scenes.append((actors, actions))
+            def on_stop(self):
+                pass
+
+        scene = (Actors(), Actions())
+        callback = Callback()
+        loader = callback.on_load(lambda loader: scene)
+        self.assertTrue(loader.is_done())
+        self.assertEqual(loader.get_progress(), 1.0)
+        self.assertEqual(callback.scenes, [scene])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import threading
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.script.scheduler import Scheduler
+from genie_core.script.update_action import UpdateAction
+from stub.traits import Blue, Red, CanShoot
+
+class TestScheduler(unittest.TestCase):
+
+    class RecordingAction(UpdateAction):
+        """Appends its name to a shared log, optionally waiting at a barrier
+        that only opens if enough actions run at the same time."""
+        def __init__(self, priority, name, log, reads=None, writes=None, 
+                barrier=None):
+            super().__init__(priority)
+            self.name = name
+            self.log = log
+            self.READS = reads
+            self.WRITES = writes
+            self.barrier = barrier
+
+        def execute(self, actors, actions, clock, callback):
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+            self.log.append(self.name)
+
+    def setUp(self):
+        self._log = []
+        self._scheduler = Scheduler(max_workers=4)
+
+    def tearDown(self):
+        self._scheduler.shutdown()
+
+    def _action(self, priority, name, reads=None, writes=None, barrier=None):
+        return self.RecordingAction(priority, name, self._log, reads, writes, 
+            barrier)
+
+    def test_stages_keep_conflicting_actions_in_priority_order(self):
+        """
+        Ensures that actions only share a stage when they don't conflict,
+        and that undeclared actions conflict with everything
+        """
+        ai = self._action(1, "ai", reads=[Blue], writes=[Red])
+        animate = self._action(2, "animate", reads=[], writes=[CanShoot])
+        steer = self._action(3, "steer", reads=[Red], writes=[Blue])
+        look = self._action(4, "look", reads=[Blue, CanShoot], writes=[])
+        legacy = self._action(5, "legacy")
+        stages = self._scheduler.get_stages([ai, animate, steer, look, legacy])
+        self.assertEqual(stages, [[ai, animate], [steer], [look], [legacy]])
+
+    def test_stages_are_reused_until_the_list_changes(self):
+        """
+        Ensures that the stages are only rebuilt for a different list
+        """
+        actions = [self._action(1, "a", [], [])]
+        stages = self._scheduler.get_stages(actions)
+        self.assertIs(stages, self._scheduler.get_stages(actions))
+        self.assertIsNot(stages, self._scheduler.get_stages(list(actions)))
+
+    def test_execute_runs_non_conflicting_actions_concurrently(self):
+        """
+        Ensures that the actions of a stage really run at the same time, and
+        that the next stage only starts after the whole stage is done
+        """
+        barrier = threading.Barrier(2)
+        first = self._action(1, "first", [Blue], [Red], barrier)
+        second = self._action(2, "second", [Blue], [CanShoot], barrier)
+        last = self._action(3, "last", [Red, CanShoot], [])
+        self._scheduler.execute([first, second, last], None, None, None, None)
+        self.assertFalse(barrier.broken)
+        self.assertCountEqual(self._log[:2], ["first", "second"])
+        self.assertEqual(self._log[2], "last")
+
+    def test_actions_can_search_and_grow_the_cast_at_the_same_time(self):
+        """
+        Ensures that actions sharing a stage can search the cast, iterate a
+        query and spawn actors without tripping over each other's lazy
+        index updates
+        """
+        class Search(UpdateAction):
+            READS, WRITES = [Body], []
+            def execute(self, actors, actions, clock, callback):
+                for i in range(20):
+                    actors.in_radius(i * 50, i * 50, 40)
+                    actors.nearest(i * 50, 0, 3)
+
+        class Count(UpdateAction):
+            READS, WRITES = [Body], []
+            def __init__(self, priority, query):
+                super().__init__(priority)
+                self.query = query
+            def execute(self, actors, actions, clock, callback):
+                for _ in range(5):
+                    sum(1 for _ in self.query)
+
+        class Spawn(UpdateAction):
+            READS, WRITES = [], []
+            def __init__(self, priority, prototype):
+                super().__init__(priority)
+                self.prototype = prototype
+            def execute(self, actors, actions, clock, callback):
+                actors.spawn(self.prototype, 100, 
+                    position=[(i * 10, i * 10) for i in range(100)])
+
+        actors = Actors()
+        for i in range(2000):
+            actor = Actor()
+            actor.add_trait(Body(i % 1000, i // 2))
+            actors.add_actor(actor)
+        prototype = Actor()
+        prototype.add_trait(Body())
+        query = actors.query(Body)
+        actions = [Spawn(1, prototype)] + [Search(1) for _ in range(2)] \
+            + [Count(1, query) for _ in range(2)]
+        self.assertEqual(self._scheduler.get_stages(actions), [actions])
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(5):
+                actors.invalidate_positions()
+                self._scheduler.execute(actions, actors, None, None, None)
+                actors.apply_changes()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(len(query), 2500)
+        self.assertEqual(len(actors.in_rect(-1, -1, 1001, 1001)), 2500)
+
+    def test_coroutine_actions_are_rejected(self):
+        """
+        Ensures that a coroutine action raises instead of silently never
+        running
+        """
+        class Wait(UpdateAction):
+            async def execute(self, actors, actions, clock, callback):
+                pass
+
+        with self.assertRaises(TypeError):
+            self._scheduler.execute([Wait(1)], None, None, None, None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast import body_store
+from genie_core.director import Director
+from genie_core.script.actions import Actions
+from genie_core.script.virtual_clock import VirtualClock
+
+if body_store.numpy is not None:
+    from genie_core.script.sharded_world import ShardedWorld
+    from genie_core.script.sharded_world import ShardedUpdateAction
+    from genie_core.script.sharded_world import move_bodies
+
+@unittest.skipIf(body_store.numpy is None, "numpy is not installed")
+class TestShardedWorld(unittest.TestCase):
+
+    def setUp(self):
+        self._world = ShardedWorld(64, [move_bodies], shards=3, 
+            bounds=(0, 30))
+        self._store = self._world.get_store()
+
+    def tearDown(self):
+        self._world.close()
+
+    def test_step_moves_every_body_and_migrates_across_borders(self):
+        """
+        Ensures that the workers move the bodies of every shard, that the
+        parent sees the result through its Body views, and that bodies that
+        cross a border change shard
+        """
+        bodies = [Body(x, 0, 1, 0.5, store=self._store) for x in range(0, 30, 3)]
+        self.assertEqual(self._world.get_shard_sizes(), [4, 3, 3])
+
+        for _ in range(5):
+            self._world.step(1 / 60)
+        for i, body in enumerate(bodies):
+            self.assertEqual(body.get_position(), (i * 3 + 5, 2.5))
+        self.assertEqual(self._world.get_shard_sizes(), [2, 3, 5])
+        self.assertEqual(self._world.get_migrations(), 4)
+
+    def test_released_slots_are_not_simulated(self):
+        """
+        Ensures that a body released from the store belongs to no shard
+        """
+        body1 = Body(1, 0, 1, 0, store=self._store)
+        body2 = Body(2, 0, 1, 0, store=self._store)
+        self._store.release(body1)
+        self._world.step(1 / 60)
+        self.assertEqual(self._world.get_shard_sizes(), [1, 0, 0])
+        self.assertEqual(body1.get_x(), 1)
+        self.assertEqual(body2.get_x(), 3)
+
+    def test_director_steps_the_world_and_bodies_survive_close(self):
+        """
+        Ensures that the update action steps the world once per update and
+        that bodies keep their values after the world is closed
+        """
+        actor = Actor()
+        actor.add_trait(Body(0, 0, 2, 0, store=self._store))
+        actors = Actors()
+        actors.add_actor(actor)
+        actions = Actions()
+        actions.add_action(ShardedUpdateAction(1, self._world))
+
+        Director(clock=VirtualClock()).run_for(actors, actions, 10)
+        self._world.close()
+        self.assertEqual(actor.get_trait(Body).get_x(), 20)
+        actor.get_trait(Body).move()
+        self.assertEqual(actor.get_trait(Body).get_x(), 22)
+
+    def test_update_action_marks_only_bodies_in_the_world_changed(self):
+        """
+        Ensures that stepping the world marks the actors whose bodies live in
+        its store as changed, and no others
+        """
+        shared = Actor()
+        shared.add_trait(Body(0, 0, 1, 0, store=self._store))
+        plain = Actor()
+        plain.add_trait(Body(0, 0))
+        actors = Actors()
+        actors.add_actors([shared, plain])
+        actors.apply_changes()
+
+        ShardedUpdateAction(1, self._world).execute(actors, None, 
+            VirtualClock(), None)
+        self.assertEqual(actors.get_changed_actors(), {shared})
+
+
+if __name__ == "__main__":
+    unittest.main()
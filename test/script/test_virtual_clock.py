@@ -0,0 +1,35 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.script.virtual_clock import VirtualClock
+
+class TestVirtualClock(unittest.TestCase):
+
+    def _run_frame(self, clock):
+        clock.tick()
+        updates = 0
+        while clock.is_lagging():
+            clock.catch_up()
+            updates += 1
+        return updates
+
+    def test_every_frame_owes_the_same_number_of_updates(self):
+        """
+        Ensures that each frame runs exactly updates_per_frame updates, no
+        matter how many frames are run
+        """
+        clock = VirtualClock(updates_per_frame=3)
+        for _ in range(10_000):
+            self.assertEqual(self._run_frame(clock), 3)
+        self.assertEqual(clock.get_frames(), 10_000)
+        self.assertEqual(clock.get_updates(), 30_000)
+        self.assertAlmostEqual(clock.get_stats()["seconds"], 
+            30_000 * VirtualClock.TIME_STEP)
+
+
+if __name__ == "__main__":
+    unittest.main()
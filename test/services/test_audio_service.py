@@ -0,0 +1,102 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Sound import Sound
+from genie_core.services.AudioService import AudioService
+from genie_core.services.NullAudioDevice import NullAudioDevice
+
+class TestAudioService(unittest.TestCase):
+
+    def setUp(self):
+        self._now = 0.0
+        self._loads = []
+        self._actors = Actors()
+        # one second of samples per clip
+        self._device = NullAudioDevice(bytes_per_second=10,
+            timer=lambda: self._now)
+
+    def _load(self, path):
+        self._loads.append(path)
+        return bytes(10)
+
+    def _add_sound(self, path, priority = 0, volume = 1):
+        actor = Actor()
+        actor.add_trait(Sound(path, volume, priority))
+        self._actors.add_actor(actor)
+        return actor.get_trait(Sound)
+
+    def test_play_sounds_coalesces_duplicate_triggers(self):
+        """
+        Ensures that triggers of one clip within a frame play once, at the 
+        loudest volume, and that the clip is decoded once
+        """
+        audio = AudioService(self._load, self._device)
+        for volume in (0.2, 0.9, 0.5):
+            self._add_sound("boom.wav", volume=volume).play()
+        audio.play_sounds(self._actors)
+
+        played = self._device.get_played()
+        self.assertEqual(len(played), 1)
+        self.assertEqual(played[0][2], 0.9)
+        self.assertEqual(audio.get_stats()["coalesced"], 2)
+
+        self._actors.apply_changes()
+        audio.play_sounds(self._actors)
+        self.assertEqual(len(self._device.get_played()), 1)
+        self.assertEqual(self._loads, ["boom.wav"])
+
+    def test_play_reuses_voices_and_steals_by_priority(self):
+        """
+        Ensures that finished voices are reused, that a full pool gives the 
+        voice of its lowest priority sound to a more important one and that 
+        less important sounds are dropped
+        """
+        audio = AudioService(self._load, self._device, voices=2)
+        audio.preload("a.wav")
+        self.assertEqual(audio.play("a.wav", priority=1), 0)
+        self.assertEqual(audio.play("b.wav", priority=5), 1)
+        self.assertIsNone(audio.play("c.wav", priority=0))
+        self.assertEqual(audio.play("d.wav", priority=3), 0)
+
+        self._now = 2.0
+        self.assertEqual(audio.play("e.wav"), 0)
+        stats = audio.get_stats()
+        self.assertEqual((stats["started"], stats["dropped"], stats["stolen"]),
+            (4, 1, 1))
+        self.assertEqual(self._loads, ["a.wav", "b.wav", "d.wav", "e.wav"])
+
+    def test_sounds_played_after_play_sounds_are_heard_next_frame(self):
+        """
+        Ensures that a sound played after play_sounds has run in a frame is
+        heard at the next call, including one of an actor that just joined
+        """
+        audio = AudioService(self._load, self._device)
+        early = self._add_sound("early.wav")
+        audio.play_sounds(self._actors)
+        early.play()
+        self._add_sound("late.wav").play()
+        self._actors.apply_changes()
+
+        audio.play_sounds(self._actors)
+        self.assertEqual(sorted(self._loads), ["early.wav", "late.wav"])
+        self._actors.apply_changes()
+        audio.play_sounds(self._actors)
+        self.assertEqual(len(self._device.get_played()), 2)
+
+    def test_null_device_only_remembers_recent_sounds(self):
+        """
+        Ensures that the null device doesn't keep every clip it played
+        """
+        device = NullAudioDevice(history=3)
+        for voice in range(10):
+            device.play(voice, bytes(4), 1)
+        self.assertEqual([p[0] for p in device.get_played()], [7, 8, 9])
+
+if __name__ == '__main__':
+    unittest.main()
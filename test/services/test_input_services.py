@@ -0,0 +1,74 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.services.KeyBoardService import KeyBoardService
+from genie_core.services.MouseService import MouseService
+
+class TestKeyBoardService(unittest.TestCase):
+
+    def test_update_takes_a_snapshot_of_the_frame(self):
+        """
+        Ensures that keys are pressed in the frame they go down, held while
+        down and released in the frame they come up, and that a tap within
+        one frame is not lost
+        """
+        keyboard = KeyBoardService()
+        keyboard.push_key(1, True)
+        keyboard.push_key(2, True)
+        keyboard.push_key(2, False)
+        self.assertFalse(keyboard.is_key_held(1))
+
+        keyboard.update()
+        self.assertTrue(keyboard.is_key_pressed(1))
+        self.assertTrue(keyboard.is_key_held(1))
+        self.assertTrue(keyboard.is_key_pressed(2))
+        self.assertTrue(keyboard.is_key_released(2))
+        self.assertFalse(keyboard.is_key_held(2, 3))
+
+        snapshot = keyboard.get_snapshot()
+        keyboard.push_key(1, False)
+        keyboard.update()
+        self.assertTrue(snapshot.is_held(1))
+        self.assertFalse(keyboard.is_key_pressed(1))
+        self.assertTrue(keyboard.is_key_released(1))
+        self.assertFalse(keyboard.is_key_held(1))
+
+    def test_full_buffer_drops_the_oldest_events(self):
+        """
+        Ensures that events beyond the buffer's capacity push out the oldest
+        """
+        keyboard = KeyBoardService(capacity=2)
+        for key in range(4):
+            keyboard.push_key(key, True)
+        keyboard.update()
+        self.assertEqual(keyboard.get_snapshot().get_held(), 0b1100)
+
+class TestMouseService(unittest.TestCase):
+
+    def test_motion_is_coalesced_into_one_delta(self):
+        """
+        Ensures that every motion within a frame adds up to one delta from
+        the previous frame's position
+        """
+        mouse = MouseService()
+        for x in range(1, 101):
+            mouse.push_motion(x, 2 * x)
+        mouse.push_button(0, True)
+        mouse.update()
+        self.assertTrue(mouse.has_mouse_moved())
+        self.assertEqual(mouse.get_motion(), (100, 200))
+        self.assertEqual(mouse.get_current_coordinates(), (100, 200))
+        self.assertEqual(mouse.get_last_coordinates(), (0, 0))
+        self.assertTrue(mouse.is_button_pressed(0))
+
+        mouse.update()
+        self.assertFalse(mouse.has_mouse_moved())
+        self.assertTrue(mouse.is_button_held(0))
+        self.assertFalse(mouse.is_button_pressed(0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import socket
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.services.NetworkService import NetworkService
+
+class TestNetworkService(unittest.TestCase):
+
+    def setUp(self):
+        self._sockets = []
+        self._server = NetworkService(self._bind())
+        self._client = NetworkService(self._bind())
+        self._server.add_client(self._client._socket.getsockname())
+        self._actors = Actors()
+
+    def tearDown(self):
+        for sock in self._sockets:
+            sock.close()
+
+    def _bind(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(("127.0.0.1", 0))
+        self._sockets.append(sock)
+        return sock
+
+    def _add_actor(self, x, y, path = "ship.png"):
+        actor = Actor()
+        actor.add_trait(Body(x, y, 1, 0, 10, 20))
+        actor.add_trait(Image(path, 2, 90, 1))
+        self._actors.add_actor(actor)
+        return actor
+
+    def _tick(self):
+        """Sends a frame and lets the client receive and acknowledge it."""
+        self._server.send_state(self._actors)
+        self._actors.apply_changes()
+        self.assertTrue(self._client.receive_state(timeout=1))
+
+    def test_client_rebuilds_the_server_state(self):
+        """
+        Ensures that the client ends up with the quantized body and image
+        fields of every actor, including removals
+        """
+        ship = self._add_actor(1.234, -5.5)
+        rock = self._add_actor(7, 8, "rock.png")
+        self._tick()
+
+        state = self._client.get_state()
+        x, y, vx, vy, height, width, path, scale, rotation, layer = \
+            state[self._server.get_id(ship)]
+        self.assertAlmostEqual(x, 1.23)
+        self.assertAlmostEqual(y, -5.5)
+        self.assertEqual((path, layer), ("ship.png", 1))
+        self.assertAlmostEqual(rotation, 90)
+        self.assertEqual(state[self._server.get_id(rock)][6], "rock.png")
+
+        rock_id = self._server.get_id(rock)
+        self._actors.remove_actor(rock)
+        ship.get_trait(Body).set_position(3, 4)
+        self._tick()
+        state = self._client.get_state()
+        self.assertNotIn(rock_id, state)
+        self.assertAlmostEqual(state[self._server.get_id(ship)][0], 3)
+
+    def test_deltas_only_carry_what_changed(self):
+        """
+        Ensures that once a state is acknowledged, frames only send the
+        actors that changed and batch them into one datagram
+        """
+        actors = [self._add_actor(i, i) for i in range(50)]
+        self._tick()
+        self._server.send_state(self._actors)  # picks up the ack
+
+        stats = self._server.get_stats()
+        before = dict(stats)
+        actors[0].get_trait(Body).set_x(100)
+        actors[1].get_trait(Body).set_x(1.001)  # below the precision
+        self._tick()
+        self.assertEqual(stats["datagrams"] - before["datagrams"], 1)
+        self.assertEqual(stats["entries"] - before["entries"], 1)
+        self.assertLess(stats["bytes"] - before["bytes"], 30)
+        self.assertEqual(len(self._client.get_state()), 50)
+
+    def test_large_states_are_split_and_reassembled(self):
+        """
+        Ensures that a state larger than a datagram is sent in parts that
+        the client puts back together
+        """
+        for i in range(200):
+            self._add_actor(i, i)
+        self._tick()
+        self.assertGreater(self._server.get_stats()["datagrams"], 1)
+        self.assertEqual(len(self._client.get_state()), 200)
+
+    def test_changes_in_frames_without_a_send_are_not_lost(self):
+        """
+        Ensures that when the server sends less often than once a frame, the
+        changes and removals made in the frames between sends still arrive
+        """
+        ship = self._add_actor(1, 1)
+        rock = self._add_actor(2, 2)
+        self._tick()
+        rock_id = self._server.get_id(rock)
+
+        ship.get_trait(Body).set_x(50)
+        self._actors.remove_actor(rock)
+        self._actors.apply_changes()
+        self._tick()
+        state = self._client.get_state()
+        self.assertAlmostEqual(state[self._server.get_id(ship)][0], 50)
+        self.assertNotIn(rock_id, state)
+
+    def test_fields_too_large_to_send_are_rejected(self):
+        """
+        Ensures that a field that doesn't fit 32 bits at the precision
+        raises a clear error
+        """
+        server = NetworkService(self._bind(), precision=0.001)
+        self._add_actor(3_000_000, 0)
+        with self.assertRaises(ValueError):
+            server.send_state(self._actors)
+    def test_changes_made_after_a_send_go_out_with_the_next(self):
+        """
+        Ensures that changes and removals made later in a frame than the
+        send reach the client with the next frame's state
+        """
+        ship = self._add_actor(1, 1)
+        rock = self._add_actor(2, 2)
+        self._tick()
+        rock_id = self._server.get_id(rock)
+
+        self._server.send_state(self._actors)
+        ship.get_trait(Body).set_x(50)
+        self._actors.remove_actor(rock)
+        self._actors.apply_changes()
+        self._client.receive_state(timeout=1)
+
+        self._tick()
+        state = self._client.get_state()
+        self.assertAlmostEqual(state[self._server.get_id(ship)][0], 50)
+        self.assertNotIn(rock_id, state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast import body_store
+from genie_core.cast.body_store import BodyStore
+from genie_core.services.PhysicsService import PhysicsService
+
+class TestPhysicsService(unittest.TestCase):
+
+    def setUp(self):
+        self._actors = Actors()
+
+    def _add_body(self, body):
+        actor = Actor()
+        actor.add_trait(body)
+        self._actors.add_actor(actor)
+        return actor
+
+    def test_move_actors_moves_plain_bodies(self):
+        """
+        Ensures that bodies without a store are moved by their velocity,
+        damped and clamped to the bounds
+        """
+        body1 = Body(0, 0, 2, 4)
+        body2 = Body(9, 5, 4, -2)
+        self._add_body(body1)
+        self._add_body(body2)
+
+        physics = PhysicsService(damping=0.5, bounds=(0, 0, 10, 10))
+        physics.move_actors(self._actors)
+        self.assertEqual(body1.get_position(), (1, 2))
+        self.assertEqual((body1.get_vx(), body1.get_vy()), (1, 2))
+
+        # body2 runs into the right edge and stops moving along x
+        self.assertEqual(body2.get_position(), (10, 4))
+        self.assertEqual((body2.get_vx(), body2.get_vy()), (0, -1))
+
+    @unittest.skipIf(body_store.numpy is None, "numpy is not installed")
+    def test_move_actors_moves_stored_bodies_in_batch(self):
+        """
+        Ensures that stored bodies are moved like plain ones, whether or not
+        every slot of their store belongs to the cast
+        """
+        store = BodyStore()
+        body1 = Body(0, 0, 2, 4, store=store)
+        body2 = Body(9, 5, 4, -2, store=store)
+        self._add_body(body1)
+        self._add_body(body2)
+
+        physics = PhysicsService(damping=0.5, bounds=(0, 0, 10, 10))
+        physics.move_actors(self._actors)
+        self.assertEqual(body1.get_position(), (1, 2))
+        self.assertEqual((body1.get_vx(), body1.get_vy()), (1, 2))
+        self.assertEqual(body2.get_position(), (10, 4))
+        self.assertEqual((body2.get_vx(), body2.get_vy()), (0, -1))
+
+        # A stored body that is not in the cast must not move
+        loose_body = Body(1, 1, 1, 1, store=store)
+        physics.move_actors(self._actors)
+        self.assertEqual(body1.get_position(), (1.5, 3))
+        self.assertEqual(loose_body.get_position(), (1, 1))
+
+        # Only the actors whose bodies moved count as changed
+        still = Actor()
+        self._actors.add_actor(still)
+        self._actors.apply_changes()
+        physics.move_actors(self._actors)
+        self.assertEqual(self._actors.get_changed_actors(), 
+            set(self._actors.with_traits(Body)))
+        self.assertNotIn(still, self._actors.get_changed_actors())
+
+    @unittest.skipIf(body_store.numpy is None, "numpy is not installed")
+    def test_move_actors_follows_changes_to_the_cast(self):
+        """
+        Ensures that actors joining or leaving the cast are picked up on the
+        next call
+        """
+        store = BodyStore()
+        body1 = Body(0, 0, 1, 0, store=store)
+        actor1 = self._add_body(body1)
+        physics = PhysicsService()
+        physics.move_actors(self._actors)
+
+        body2 = Body(0, 0, 1, 0)
+        self._add_body(body2)
+        self._actors.remove_actor(actor1)
+        self._actors.apply_changes()
+        physics.move_actors(self._actors)
+        self.assertEqual(body1.get_x(), 1)
+        self.assertEqual(body2.get_x(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
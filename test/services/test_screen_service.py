@@ -0,0 +1,106 @@
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actor import Actor
+from genie_core.cast.actors import Actors
+from genie_core.cast.Body import Body
+from genie_core.cast.Image import Image
+from genie_core.services.ScreenService import ScreenService
+
+class RecordingScreenService(ScreenService):
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def draw_batch(self, batch):
+        self.batches.append(batch)
+
+class TestScreenService(unittest.TestCase):
+
+    def setUp(self):
+        self._actors = Actors()
+        self._screen = RecordingScreenService()
+
+    def _add_sprite(self, path, layer = 0, x = 0, y = 0):
+        actor = Actor()
+        actor.add_trait(Body(x, y))
+        actor.add_trait(Image(path, layer=layer))
+        self._actors.add_actor(actor)
+        return actor
+
+    def test_draw_actors_batches_by_layer_and_path(self):
+        """
+        Ensures that actors sharing an image and a layer are drawn in one 
+        batch, lower layers first
+        """
+        self._add_sprite("ship.png", 1, 1, 2)
+        self._add_sprite("rock.png", 0, 3, 4)
+        self._add_sprite("ship.png", 1, 5, 6)
+        Actor().add_trait(Image("ignored.png"))
+
+        self._screen.draw_actors(self._actors)
+        batches = self._screen.batches
+        self.assertEqual([(b.get_layer(), b.get_path(), len(b)) 
+            for b in batches], [(0, "rock.png", 1), (1, "ship.png", 2)])
+        self.assertEqual(sorted(zip(batches[1].get_xs(), batches[1].get_ys())),
+            [(1, 2), (5, 6)])
+        self.assertEqual(list(batches[1].get_scales()), [1, 1])
+
+    def test_draw_actors_keeps_order_of_unchanged_actors(self):
+        """
+        Ensures that the draw order within a batch is stable from frame to 
+        frame and that new actors are drawn after existing ones
+        """
+        first = [self._add_sprite("a.png") for _ in range(5)]
+        self._actors.apply_changes()
+        order = self._screen.get_batches(self._actors)[0].get_actors()
+
+        added = self._add_sprite("a.png")
+        self._actors.apply_changes()
+        self.assertEqual(self._screen.get_batches(self._actors)[0].get_actors(),
+            order + [added])
+        self.assertEqual(sorted(order, key=id), sorted(first, key=id))
+
+    def test_draw_actors_resorts_when_a_layer_changes(self):
+        """
+        Ensures that changing an image's layer or removing an actor is 
+        reflected in the next frame's batches
+        """
+        low = self._add_sprite("a.png", 0)
+        high = self._add_sprite("b.png", 1)
+        self._actors.apply_changes()
+        self._screen.get_batches(self._actors)
+
+        low.get_trait(Image).set_layer(2)
+        paths = [b.get_path() for b in self._screen.get_batches(self._actors)]
+        self.assertEqual(paths, ["b.png", "a.png"])
+
+        self._actors.apply_changes()
+        self._actors.remove_actor(high)
+        self._actors.apply_changes()
+        paths = [b.get_path() for b in self._screen.get_batches(self._actors)]
+        self.assertEqual(paths, ["a.png"])
+
+    def test_get_batches_sees_changes_made_between_draws(self):
+        """
+        Ensures that a path changed in a frame nothing was drawn in is still 
+        reflected in later batches
+        """
+        sprite = self._add_sprite("a.png")
+        self._add_sprite("m.png")
+        self._actors.apply_changes()
+        self._screen.get_batches(self._actors)
+
+        sprite.get_trait(Image).set_path("z.png")
+        self._actors.apply_changes()
+        self._actors.apply_changes()
+        paths = [b.get_path() for b in self._screen.get_batches(self._actors)]
+        self.assertEqual(paths, ["m.png", "z.png"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from genie.cast.trait import Trait
+from genie_core.cast.trait import Trait
 
 class Blue(Trait):
     pass
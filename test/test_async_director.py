@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.async_director import AsyncDirector
+from genie_core.cast.actors import Actors
+from genie_core.script.actions import Actions
+from genie_core.script.input_action import InputAction
+from genie_core.script.update_action import UpdateAction
+from genie_core.script.virtual_clock import VirtualClock
+
+class TestAsyncDirector(unittest.TestCase):
+
+    class Count(UpdateAction):
+        def __init__(self, priority):
+            super().__init__(priority)
+            self.updates = 0
+
+        def execute(self, actors, actions, clock, callback):
+            self.updates += 1
+
+    class Poll(InputAction):
+        """Waits for a reply that takes several frames to arrive."""
+        def __init__(self, priority, replies):
+            super().__init__(priority)
+            self.replies = replies
+            self.calls = 0
+            self.received = []
+
+        async def execute(self, actors, actions, clock, callback):
+            self.calls += 1
+            self.received.append(await self.replies.get())
+
+    def test_coroutine_actions_span_frames(self):
+        """
+        Ensures that a coroutine action runs as a task across frames without
+        stalling the loop, and is cued again once it is over
+        """
+        async def scene():
+            replies = asyncio.Queue()
+            poll = self.Poll(1, replies)
+            count = self.Count(1)
+            actions = Actions()
+            actions.add_action(poll)
+            actions.add_action(count)
+            director = AsyncDirector(clock=VirtualClock())
+
+            async def server():
+                # Replies only after the loop has run a few frames
+                while count.updates < 5:
+                    await asyncio.sleep(0)
+                await replies.put("hello")
+
+            ran, _ = await asyncio.gather(
+                director.run_for(Actors(), actions, 10), server())
+            pending = [t for t in asyncio.all_tasks() 
+                if t is not asyncio.current_task()]
+            return ran, poll, count, director, pending
+
+        ran, poll, count, director, pending = asyncio.run(scene())
+        self.assertEqual(ran, 10)
+        self.assertEqual(count.updates, 10)
+        self.assertEqual(poll.received, ["hello"])
+        self.assertEqual(poll.calls, 2)
+
+        # The second poll was still waiting and was cancelled on return
+        self.assertEqual(director.get_tasks(), {})
+        self.assertEqual(pending, [])
+
+    def test_errors_in_coroutine_actions_are_raised(self):
+        """
+        Ensures that an exception raised by a coroutine action stops the
+        loop at the end of the frame
+        """
+        class Fail(UpdateAction):
+            async def execute(self, actors, actions, clock, callback):
+                raise ValueError("lost connection")
+
+        actions = Actions()
+        actions.add_action(Fail(1))
+        director = AsyncDirector(clock=VirtualClock())
+        with self.assertRaises(ValueError):
+            asyncio.run(director.run_for(Actors(), actions, 10))
+
+    def test_tasks_are_cancelled_when_the_scene_changes(self):
+        """
+        Ensures that the tasks started by a scene are cancelled when the
+        next scene takes over
+        """
+        class Wait(InputAction):
+            cancelled_at = None
+            async def execute(self, actors, actions, clock, callback):
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    Wait.cancelled_at = clock.get_updates()
+                    raise
+
+        class Next(UpdateAction):
+            def execute(self, actors, actions, clock, callback):
+                callback.on_next(Actors(), Actions())
+
+        async def scene():
+            actions = Actions()
+            actions.add_action(Wait(1))
+            actions.add_action(Next(1))
+            director = AsyncDirector(clock=VirtualClock())
+            await director.run_for(Actors(), actions, 3)
+            return director
+
+        director = asyncio.run(scene())
+        self.assertEqual(Wait.cancelled_at, 1)
+        self.assertEqual(director.get_tasks(), {})
+
+if __name__ == '__main__':
+    unittest.main()
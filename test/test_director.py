@@ -0,0 +1,188 @@
+import threading
+import unittest
+import sys
+  
+# setting path
+sys.path.append('..\\..')
+sys.path.append('..')
+
+from genie_core.cast.actors import Actors
+from genie_core.director import Director
+from genie_core.script.actions import Actions
+from genie_core.script.input_action import InputAction
+from genie_core.script.output_action import OutputAction
+from genie_core.script.profiler import Profiler
+from genie_core.script.update_action import UpdateAction
+from genie_core.script.virtual_clock import VirtualClock
+from genie_core.services.KeyBoardService import KeyBoardService
+
+class TestDirector(unittest.TestCase):
+
+    class StopAfter(InputAction):
+        """Stops the director after the given number of frames."""
+        def __init__(self, priority, frames):
+            super().__init__(priority)
+            self.frames = frames
+
+        def execute(self, actors, actions, clock, callback):
+            self.frames -= 1
+            if self.frames == 0:
+                callback.on_stop()
+
+    class Draw(OutputAction):
+        def execute(self, actors, actions, clock, callback):
+            pass
+
+    class StopOnDraw(OutputAction):
+        def execute(self, actors, actions, clock, callback):
+            callback.on_stop()
+
+    class Count(UpdateAction):
+        def __init__(self, priority):
+            super().__init__(priority)
+            self.updates = 0
+
+        def execute(self, actors, actions, clock, callback):
+            self.updates += 1
+
+    def setUp(self):
+        self._actions = Actions()
+        self._stop = self.StopAfter(1, 5)
+        self._draw = self.Draw(1)
+        self._actions.add_action(self._stop)
+        self._actions.add_action(self._draw)
+
+    def test_profiling_reports_actions_and_phases_in_clock_stats(self):
+        """
+        Ensures that a profiling director times every action and phase and
+        that the clock reports those timings
+        """
+        director = Director(profile=True)
+        director.direct_scene(Actors(), self._actions)
+
+        stats = director._clock.get_stats()
+        self.assertEqual(stats["frames"], 5)
+        self.assertEqual(stats["phases"][Profiler.FRAME]["count"], 5)
+        self.assertEqual(stats["phases"][Profiler.INPUT]["count"], 5)
+        self.assertEqual(stats["phases"][Profiler.OUTPUT]["count"], 5)
+        self.assertEqual(stats["actions"][self._stop]["count"], 5)
+        self.assertEqual(stats["actions"][self._draw]["count"], 5)
+
+    def test_no_timings_without_profiling(self):
+        """
+        Ensures that the clock stats hold only the running totals when
+        profiling is off
+        """
+        director = Director()
+        director.direct_scene(Actors(), self._actions)
+        stats = director._clock.get_stats()
+        self.assertEqual(stats["frames"], 5)
+        self.assertNotIn("phases", stats)
+        self.assertNotIn("actions", stats)
+
+    def test_run_for_runs_the_exact_number_of_updates(self):
+        """
+        Ensures that run_for() with a virtual clock runs exactly the number
+        of updates asked for and can skip the output actions
+        """
+        actions = Actions()
+        count = self.Count(1)
+        actions.add_action(count)
+        director = Director(clock=VirtualClock())
+
+        self.assertEqual(director.run_for(Actors(), actions, 600), 600)
+        self.assertEqual(count.updates, 600)
+
+        # Output actions are skipped, so this one never stops the run, and
+        # the next run picks up from where the last one ended
+        actions.add_action(self.StopOnDraw(1))
+        self.assertEqual(director.run_for(Actors(), actions, 60, outputs=False), 
+            60)
+        self.assertEqual(count.updates, 660)
+
+        # A frame owing more updates than are left only runs those left
+        count = self.Count(1)
+        actions = Actions()
+        actions.add_action(count)
+        director = Director(clock=VirtualClock(updates_per_frame=3))
+        self.assertEqual(director.run_for(Actors(), actions, 4), 4)
+        self.assertEqual(count.updates, 4)
+
+    def test_run_until_stops_on_predicate_or_on_stop(self):
+        """
+        Ensures that run_until() stops once the predicate holds, or earlier
+        when an action stops the animation
+        """
+        actions = Actions()
+        count = self.Count(1)
+        actions.add_action(count)
+        director = Director(clock=VirtualClock(updates_per_frame=4))
+
+        ran = director.run_until(Actors(), actions, 
+            lambda actors, actions, clock: count.updates >= 10)
+        self.assertEqual(ran, 12)
+
+        actions.add_action(self._stop)
+        ran = director.run_until(Actors(), actions, 
+            lambda actors, actions, clock: False)
+        self.assertEqual(ran, 20)
+
+    def test_input_services_are_updated_before_input_actions(self):
+        """
+        Ensures that the input services take their snapshot at the start of
+        each frame, so input actions see the events pushed before it
+        """
+        keyboard = KeyBoardService()
+        seen = []
+
+        class Record(InputAction):
+            def execute(self, actors, actions, clock, callback):
+                seen.append(keyboard.is_key_held(3))
+
+        actions = Actions()
+        actions.add_action(Record(1))
+        director = Director(clock=VirtualClock(), input_services=[keyboard])
+        keyboard.push_key(3, True)
+        director.run_for(Actors(), actions, 1)
+        keyboard.push_key(3, False)
+        director.run_for(Actors(), actions, 1)
+        self.assertEqual(seen, [True, False])
+
+    def test_on_load_swaps_scenes_at_a_frame_boundary(self):
+        """
+        Ensures that the current scene keeps running while the next one is
+        built in the background, and that the transition happens after the
+        frame's changes are applied
+        """
+        release = threading.Event()
+        current = Actions()
+        count = self.Count(1)
+        current.add_action(count)
+        next_actions = Actions()
+        next_count = self.Count(1)
+        next_actions.add_action(next_count)
+        loaders = []
+
+        class Load(InputAction):
+            def execute(self, actors, actions, clock, callback):
+                if not loaders:
+                    loaders.append(callback.on_load(
+                        lambda loader: release.wait(5) and (Actors(), 
+                        next_actions)))
+
+        current.add_action(Load(1))
+        director = Director(clock=VirtualClock())
+        director.run_for(Actors(), current, 10)
+        self.assertEqual(count.updates, 10)
+        self.assertFalse(loaders[0].is_done())
+
+        release.set()
+        loaders[0].wait(5)
+        director.run_until(director._actors, director._actions,
+            lambda actors, actions, clock: next_count.updates >= 5)
+        self.assertEqual(count.updates, 11)
+        self.assertEqual(next_count.updates, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()